@@ -0,0 +1,296 @@
+"""
+ENGINE BENCHMARK CASES (v1.0.0)
+Every case is a factory: factory(workdir) does the untimed setup and returns the
+timed callable, which returns the number of files it produced (None when files/sec
+does not apply, or a callable that counts them after the clock stops).
+Factories run once per repetition, each in a fresh workdir.
+"""
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+CASES = {}   # name -> factory
+MEMORY = {}  # name -> False when the work happens in a child process (no tracemalloc)
+QUICK_SKIP = {"batch.1000"}
+
+# Framework x strategy matrix (same shapes as tests/test_full_matrix.py)
+MATRIX = [
+    ("fastapi", "fastapi (default)", "standard"),
+    ("fastapi", "fastapi (default)", "production"),
+    ("flask", "flask (default)", "standard"),
+    ("flask", "flask (default)", "production"),
+    ("django", "Django (Standard)", "standard"),
+    ("django", "Django + Rest Framework", "standard"),
+    ("bottle", "bottle (default)", "standard"),
+]
+
+
+def case(name: str, memory: bool = True):
+    def register(factory):
+        CASES[name] = factory
+        MEMORY[name] = memory
+        return factory
+    return register
+
+
+def _manifest(fw: str, blueprint: str, strategy: str, name: str = "bench", **extra) -> dict:
+    return {
+        "project name": name,
+        "core blueprint": blueprint,
+        "fw_name": fw,
+        "build strategy": strategy,
+        "venv_enabled": False,
+        **extra,
+    }
+
+
+def _controller(manifest: dict, base_dir: Path, **kwargs):
+    from create_app.initializer.controller import Controller
+    return Controller(manifest, ["docs", "tests"], base_dir=base_dir, preflight=False, quiet=True, **kwargs)
+
+
+# --- STARTUP ---
+
+@case("cli.cold_start", memory=False)
+def cli_cold_start(workdir: Path):
+    code = "import sys; sys.argv = ['init-app', '--version']; from create_app.engine.cli import main; main()"
+    env = {"PYTHONPATH": str(REPO_ROOT), "PATH": ""}
+
+    def run():
+        subprocess.run([sys.executable, "-c", code], cwd=workdir, env=env, check=True, capture_output=True)
+    return run
+
+
+# --- RESOLUTION (no disk) ---
+
+@case("bundler.init x200")
+def bundler_init(workdir: Path):
+    from create_app.framework.bundler import Bundler
+
+    def run():
+        for _ in range(200):
+            Bundler(workdir, {"fw_name": "fastapi", "build_strategy": "production"})
+    return run
+
+
+@case("plan.compile x50")
+def plan_compile(workdir: Path):
+    from create_app.framework.bundler import Bundler
+    from create_app.framework.planner import compile_plan
+
+    def run():
+        for _ in range(50):
+            data = Bundler(workdir, {"fw_name": "fastapi", "build_strategy": "production"}).execute()
+            compile_plan(data["ctx"], data["blueprint"], data["manifest"])
+    return run
+
+
+# --- GENERATION ---
+
+def _generate_factory(fw: str, blueprint: str, strategy: str, io_workers: int = 1):
+    def factory(workdir: Path):
+        ctrl = _controller(_manifest(fw, blueprint, strategy), workdir, io_workers=io_workers)
+
+        def run():
+            assert ctrl.run_mission(), ctrl.error
+            return sum(ctrl.worker.writes.values())
+        return run
+    return factory
+
+
+for _fw, _bp, _strategy in MATRIX:
+    _label = "drf" if "Rest Framework" in _bp else _strategy
+    case(f"generate.{_fw}.{_label}")(_generate_factory(_fw, _bp, _strategy))
+
+
+# --- WRITER POOL (--io-workers) ---
+# Local page-cached writes take microseconds, so the pool mostly adds thread hand-offs there.
+# It pays off when each write blocks (network filesystems, fsync-heavy storage): the slowfs
+# cases model that with a fixed per-file latency, the fsync cases with a real DiskSink(fsync=True).
+SLOW_WRITE_S = 0.002
+
+
+def _slow_disk(root: Path):
+    from create_app.initializer.sinks import DiskSink
+
+    class SlowDisk(DiskSink):
+        def write(self, rel, data):
+            time.sleep(SLOW_WRITE_S)  # Blocks without the GIL, like a slow write() / fsync()
+            super().write(rel, data)
+
+        def write_stream(self, rel, chunks):
+            time.sleep(SLOW_WRITE_S)
+            return super().write_stream(rel, chunks)
+
+    return SlowDisk(root)
+
+
+def _pool_factory(strategy: str, io_workers: int, slow: bool, fsync: bool = False):
+    def factory(workdir: Path):
+        from create_app.initializer.sinks import DiskSink
+        sink = _slow_disk(workdir / "bench") if slow else DiskSink(workdir / "bench", fsync=True) if fsync else None
+        ctrl = _controller(_manifest("fastapi", "fastapi (default)", strategy), workdir, io_workers=io_workers, sink=sink)
+
+        def run():
+            assert ctrl.run_mission(), ctrl.error
+            return sum(ctrl.worker.writes.values())
+        return run
+    return factory
+
+
+for _strategy in ("production", "auto_config"):
+    for _slow in (False, True):
+        for _io in (1, 4):
+            _name = f"io.fastapi.{_strategy}{'.slowfs' if _slow else ''} io{_io}"
+            case(_name)(_pool_factory(_strategy, _io, _slow))
+
+for _io in (1, 4):
+    case(f"io.fastapi.production.fsync io{_io}")(_pool_factory("production", _io, slow=False, fsync=True))
+
+
+@case("generate.memory.fastapi.production")
+def generate_memory(workdir: Path):
+    from create_app.initializer.sinks import MemorySink
+    ctrl = _controller(_manifest("fastapi", "fastapi (default)", "production"), workdir, sink=MemorySink())
+
+    def run():
+        assert ctrl.run_mission(), ctrl.error
+        return len(ctrl.sink.files)
+    return run
+
+
+@case("static_assets")
+def static_assets(workdir: Path):
+    from create_app.framework.planner import BuildPlan
+    from create_app.initializer.generator import Generator
+    ctrl = _controller(_manifest("flask", "flask (default)", "production"), workdir)
+    full = ctrl._compile()
+    plan = BuildPlan()
+    for op in full:
+        if op["source"] and op["source"].startswith("common/static/"):
+            plan.add(op["source"], op["target"], op["mode"], op["context"])
+    worker = Generator(ctrl.root, ctrl.worker.ctx)
+
+    def run():
+        worker.run(plan)
+        return sum(worker.writes.values())
+    return run
+
+
+# --- DJANGO ---
+
+@case("django.bootstrap")
+def django_bootstrap(workdir: Path):
+    # In-process project + 3 apps (nothing to mock: no django-admin subprocess)
+    ctrl = _controller(_manifest("django", "Django + Rest Framework", "standard", apps="blog, shop, cart"), workdir)
+
+    def run():
+        with patch("subprocess.run") as mock_run:
+            assert ctrl.run_mission(), ctrl.error
+        assert not mock_run.called
+        return sum(ctrl.worker.writes.values())
+    return run
+
+
+@case("django.settings_patch x100")
+def django_settings_patch(workdir: Path):
+    from create_app.initializer.settings_patcher import SettingsPatcher
+    from create_app.rules.django_rules import DJANGO_PATCH_RULES
+    from tests.stock_files import STOCK_SETTINGS as settings
+    patches = DJANGO_PATCH_RULES["drf"]["patches"]
+    ctx = {"django_apps": ["blog", "shop"], "app_name": "blog"}
+
+    def run():
+        for _ in range(100):
+            SettingsPatcher(settings).apply(patches, ctx)
+    return run
+
+
+# --- FLEET ---
+
+def _batch_factory(count: int):
+    def factory(workdir: Path):
+        from create_app.initializer.batch import BatchRunner
+        specs = [_manifest(*MATRIX[i % len(MATRIX)], name=f"svc_{i}") for i in range(count)]
+        runner = BatchRunner(specs, base_dir=workdir, jobs=1)
+
+        def run():
+            with patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+                mock_check.return_value = {"status": True, "errors": []}
+                results = runner.run()
+            assert all(r["status"] == "ok" for r in results), [r["error"] for r in results if r["error"]]
+            # Counted after the clock stops
+            return lambda: sum(1 for p in workdir.rglob("*") if p.is_file())
+        return run
+    return factory
+
+
+for _count in (10, 100, 1000):
+    case(f"batch.{_count}")(_batch_factory(_count))
+
+
+# --- SHARED ASSETS ---
+
+ASSET_PACK = {  # A small custom pack: images, a font, vendored CSS (~160 KiB per scaffold)
+    "img/hero.png": 48 * 1024, "img/logo.svg": 8 * 1024, "img/bg.jpg": 40 * 1024,
+    "fonts/inter.woff2": 56 * 1024, "css/vendor.css": 8 * 1024,
+}
+
+
+def _assets_factory(mode: str, projects: int = 500):
+    def factory(workdir: Path):
+        import os
+        from create_app.initializer.asset_store import AssetStore
+        from create_app.initializer.sinks import DiskSink
+        pack = workdir / "pack"
+        for rel, size in ASSET_PACK.items():
+            (pack / rel).parent.mkdir(parents=True, exist_ok=True)
+            (pack / rel).write_bytes(os.urandom(size))
+        store = AssetStore(workdir / "store")
+
+        def run():
+            written = 0
+            for i in range(projects):
+                sink = DiskSink(workdir / f"site_{i}", assets=mode, store=store)
+                for rel in ASSET_PACK:
+                    written += sink.copy(pack / rel, f"static/{rel}")
+            # Store fills count too: the first scaffold pays for every blob
+            return {"files": projects * len(ASSET_PACK),
+                    "bytes_per_scaffold": round((written + store.stored_bytes) / projects, 1)}
+        return run
+    return factory
+
+
+for _mode in ("copy", "link", "reflink"):
+    case(f"assets.{_mode} x500")(_assets_factory(_mode))
+
+
+# --- LARGE GENERATED FILES ---
+# Seed SQL / vendored bundles: peak_kb should track the chunk size, not the file size
+
+@case("render.large_file 8MiB")
+def render_large_file(workdir: Path):
+    from jinja2 import DictLoader, Environment
+    from create_app.framework.planner import BuildPlan, RENDER
+    from create_app.initializer.generator import Generator
+    env = Environment(loader=DictLoader({
+        "seed.sql.tpl": "{% for i in range(rows) %}INSERT INTO seed VALUES ({{ i }}, '{{ label }}');\n{% endfor %}"
+    }))
+
+    class SeedGenerator(Generator):
+        @property
+        def env(self):
+            return env
+
+    plan = BuildPlan()
+    plan.add("seed.sql.tpl", "db/seed.sql", RENDER)
+    worker = SeedGenerator(workdir / "bench", {"rows": 200_000, "label": "fixture"})
+
+    def run():
+        worker.run(plan)
+        return sum(worker.writes.values())
+    return run
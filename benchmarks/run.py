@@ -0,0 +1,182 @@
+"""
+ENGINE BENCHMARK RUNNER (v1.0.0)
+    python -m benchmarks.run                          # all cases -> benchmarks/results.json
+    python -m benchmarks.run -k generate --repeat 7   # a subset
+    python -m benchmarks.run --quick --compare benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run --update-baseline        # re-record benchmarks/baseline.json
+
+Per case: median/min wall time over --repeat runs, tracemalloc peak from one extra
+run (tracing slows Python down, so it is never timed), files and files/sec, plus any
+extra metrics the case reports (e.g. bytes_per_scaffold).
+--compare exits 1 when a tracked metric regresses beyond --threshold.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+BASELINE = HERE / "baseline.json"
+
+# metric -> True when higher is better
+TRACKED = {"wall_s": False, "peak_kb": False, "files_per_s": True, "bytes_per_scaffold": False}
+# Absolute noise floors: smaller movements never count as regressions
+NOISE_FLOOR = {"wall_s": 0.005, "peak_kb": 256.0, "files_per_s": 0.0, "bytes_per_scaffold": 0.0}
+# Always-present result keys; anything else a case reports is printed after them
+BASE_KEYS = {"wall_s", "min_s", "peak_kb", "files", "files_per_s", "repeat"}
+
+
+def _once(factory, root: Path, traced: bool = False):
+    """One fresh-workdir execution: returns (seconds, files, peak bytes or None)."""
+    workdir = Path(tempfile.mkdtemp(dir=root))
+    run = factory(workdir)
+    if traced:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        files = run()
+    elapsed = time.perf_counter() - started
+    peak = None
+    if traced:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    if callable(files):
+        files = files()
+    return elapsed, files, peak
+
+
+def measure(factory, repeat: int, root: Path, memory: bool = True) -> dict:
+    _once(factory, root)  # Warm-up: imports, Jinja compile, bytecode cache
+    walls, files = [], None
+    for _ in range(repeat):
+        elapsed, files, _ = _once(factory, root)
+        walls.append(elapsed)
+    peak = _once(factory, root, traced=True)[2] if memory else None
+
+    # Cases may report extra metrics: {"files": n, "bytes_per_scaffold": ...}
+    extra = dict(files) if isinstance(files, dict) else {}
+    files = extra.pop("files", None) if isinstance(files, dict) else files
+
+    wall = statistics.median(walls)
+    return {
+        "wall_s": round(wall, 6),
+        "min_s": round(min(walls), 6),
+        "peak_kb": round(peak / 1024, 1) if peak is not None else None,
+        "files": files,
+        "files_per_s": round(files / wall, 1) if files and wall else None,
+        "repeat": repeat,
+        **extra,
+    }
+
+
+@contextlib.contextmanager
+def private_cache(root: Path):
+    """Benchmarks start from an empty user cache (bytecode, assets, venvs) and never fill the real one."""
+    from create_app.cache import CACHE_ENV_VAR
+    from create_app.initializer import asset_store, templating
+    saved = os.environ.get(CACHE_ENV_VAR), templating._ENVIRONMENTS, asset_store._STORE
+    os.environ[CACHE_ENV_VAR] = str(root)  # Inherited by batch workers and CLI subprocesses
+    templating._ENVIRONMENTS, asset_store._STORE = {}, None
+    try:
+        yield root
+    finally:
+        env, templating._ENVIRONMENTS, asset_store._STORE = saved
+        if env is None:
+            os.environ.pop(CACHE_ENV_VAR, None)
+        else:
+            os.environ[CACHE_ENV_VAR] = env
+
+
+def run_cases(names: list, repeat: int) -> dict:
+    from benchmarks.cases import CASES, MEMORY
+    from create_app.constants import __version__
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="init-app-bench-") as tmp, private_cache(Path(tmp) / "cache"):
+        for name in names:
+            # Big fleets get fewer repetitions; their median is stable enough
+            reps = max(1, repeat // 3) if name.startswith("batch.") else repeat
+            results[name] = measure(CASES[name], reps, Path(tmp), MEMORY[name])
+            r = results[name]
+            fps = f"{r['files_per_s']:>9.1f} files/s" if r["files_per_s"] else " " * 17
+            peak = f"{r['peak_kb']:>10.1f} KiB" if r["peak_kb"] is not None else " " * 14
+            extra = "  ".join(f"{k}={v}" for k, v in r.items() if k not in BASE_KEYS)
+            print(f"  {name.ljust(36)} {r['wall_s'] * 1000:10.2f} ms {peak} {fps}  {extra}".rstrip())
+
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """Human-readable regressions of tracked metrics (cases missing on either side are ignored)."""
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        now = current["results"].get(name)
+        if not now:
+            continue
+        for metric, higher_is_better in TRACKED.items():
+            old, new = base.get(metric), now.get(metric)
+            if not old or new is None or abs(new - old) <= NOISE_FLOOR[metric]:
+                continue
+            change = (old - new) / old if higher_is_better else (new - old) / old
+            if change > threshold:
+                regressions.append(f"{name}: {metric} {old} -> {new} ({change:+.0%} worse)")
+    return regressions
+
+
+def main(argv=None):
+    from benchmarks.cases import CASES, QUICK_SKIP
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.run", description="init-app engine benchmarks")
+    parser.add_argument("-k", dest="filter", help="Only cases whose name contains this substring")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case (median is reported)")
+    parser.add_argument("--quick", action="store_true", help=f"Skip the slowest cases ({', '.join(sorted(QUICK_SKIP))})")
+    parser.add_argument("-o", "--output", default=str(HERE / "results.json"), help="Results JSON path")
+    parser.add_argument("--compare", metavar="BASELINE", help="Fail (exit 1) on regressions against this results file")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument("--update-baseline", action="store_true", help=f"Also write the results to {BASELINE.name}")
+    parser.add_argument("--log-level", default="warning", help="Run-log level while benchmarking (default: warning)")
+    args = parser.parse_args(argv)
+
+    from create_app.logger import set_log_level
+    set_log_level(args.log_level)
+
+    names = [n for n in CASES if (not args.filter or args.filter in n) and not (args.quick and n in QUICK_SKIP)]
+    print(f"\n  {len(names)} benchmark cases, {args.repeat} repetitions\n")
+    current = run_cases(names, args.repeat)
+
+    Path(args.output).write_text(json.dumps(current, indent=1), encoding="utf-8")
+    print(f"\n  results: {args.output}")
+    if args.update_baseline:
+        BASELINE.write_text(json.dumps(current, indent=1), encoding="utf-8")
+        print(f"  baseline updated: {BASELINE}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(current, baseline, args.threshold)
+        for line in regressions:
+            print(f"  ✖ {line}")
+        print(f"  {'✖' if regressions else '✔'} {len(regressions)} regression(s) beyond {args.threshold:.0%} "
+              f"against {args.compare}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import os
+import sys
+from pathlib import Path
+
+# --- USER CACHE RESOLUTION ---
+# INIT_APP_CACHE_DIR overrides the platform default (useful for CI and tests).
+CACHE_ENV_VAR = "INIT_APP_CACHE_DIR"
+NO_CACHE_ENV_VAR = "INIT_APP_NO_CACHE"
+
+
+def cache_root() -> Path:
+    """Resolves the per-user cache directory for init-app."""
+    override = os.environ.get(CACHE_ENV_VAR)
+    if override:
+        return Path(override).expanduser()
+
+    if os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return base / "init-app"
+
+
+def cache_dir(*parts) -> Path:
+    """Returns (and creates) a sub-directory of the user cache."""
+    path = cache_root().joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def cache_enabled() -> bool:
+    """Caching can be switched off with INIT_APP_NO_CACHE=1."""
+    return os.environ.get(NO_CACHE_ENV_VAR, "").lower() not in ["1", "true", "yes"]
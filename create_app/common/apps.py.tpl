@@ -1,4 +1,3 @@
     'django_extensions',
     'django_filters',
     'rest_framework',
-    '{{app_name}}',
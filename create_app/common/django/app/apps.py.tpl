@@ -0,0 +1,6 @@
+from django.apps import AppConfig
+
+
+class {{ app_label.title() | replace("_", "") }}Config(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = '{{ app_label }}'
@@ -0,0 +1,17 @@
+"""
+URL configuration for {{ project_name }} project.
+
+The `urlpatterns` list routes URLs to views. For more information please see:
+    https://docs.djangoproject.com/en/5.0/topics/http/urls/
+"""
+{% if is_drf %}
+{% include "common/urls.tpl" %}
+
+{% else %}
+from django.contrib import admin
+from django.urls import path
+
+urlpatterns = [
+    path('admin/', admin.site.urls),
+]
+{% endif %}
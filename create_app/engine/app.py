@@ -0,0 +1,130 @@
+import sys
+import readchar
+from create_app.engine.ui.user_interface import InitUI
+from create_app.engine.prompts import BuildPrompts, INFRA_KEYS, domain_folders
+import create_app.constants as const
+
+class AppEngine(InitUI):
+    """
+    INTERACTIVE SHELL (v2.0.0)
+    Menu-driven manifest builder; imported only when no headless flags are given.
+    """
+    def __init__(self):
+        super().__init__(const.APP_NAME, const.__version__)
+        self.prompter = BuildPrompts(self, const)
+        self.infra_keys = INFRA_KEYS
+        self.domain_folders = domain_folders(const)
+        # DNA of the project creation
+        self.manifest = { 
+            "infra_suites": [], 
+            "infra_files": {}, 
+            "init_strategy": {},
+            "is_drf": False 
+        } 
+
+    def start(self):
+        """Interactive entry point (headless flags are handled by engine.cli)."""
+        self._handle_interactive_mode()
+
+    def _handle_interactive_mode(self):
+        """Interactive flow utilizing the High-Performance UI layer."""
+        try:
+            selected_folders = set()
+            fw_display, _ = self.menu("core blueprint", const.FRAMEWORKS, sub_mapping=const.FRAMEWORK_SERVER_MAPPING, flow=["blueprint"])
+            fw_slug = fw_display.split(" (")[0].lower()
+            
+            # Sync DRF logic from UI string
+            self.manifest["is_drf"] = "rest framework" in fw_display.lower()
+
+            if fw_slug == "others":
+                project_type_display, _ = self.menu("engine type", const.OTHERS_PROJECT_TYPES, flow=["others"])
+                fw_slug = project_type_display.lower()
+
+            mode_raw, _ = self.menu("build strategy", const.PROJECT_MODES, flow=[fw_slug, "mode"])
+            mode = mode_raw.lower()
+            
+            # Dynamic Workflow
+            db_raw, _ = self.menu("data nexus", const.DB_ENGINES, flow=[fw_slug, mode, "database"])
+            db = db_raw.lower()
+            
+            if mode == "auto_config":
+                env_display, _ = self.menu("environment", ["venv (recommended)", "no venv"], flow=[fw_slug, mode, "env"])
+                p_name = self.prompter.get_project_name()
+                apps_list = [] 
+                selected_folders = self.prompter.get_smart_folders(fw_slug, "standard", self.domain_folders)
+                self.manifest["init_strategy"] = {f: True for f in selected_folders}
+            else:
+                selected_folders = self._orchestrate_infra(fw_slug, mode)
+                env_display, _ = self.menu("environment", ["venv (recommended)", "no venv"], flow=[fw_slug, mode, "env"])
+                p_name, apps_list = self.prompter.collect_identity(fw_slug, mode)
+
+            self.manifest.update({
+                    "project name": p_name,
+                    "core blueprint": fw_display,
+                    "fw_name": fw_slug, 
+                    "build strategy": mode,
+                    "environment": env_display,
+                    "apps": ", ".join(apps_list) if apps_list else "none", 
+                    "database": db,
+                    "venv_enabled": "no" if "no venv" in env_display.lower() else "yes"
+                })
+
+            self._run_mission_control(fw_slug, p_name, mode, selected_folders)
+
+        except (KeyboardInterrupt, EOFError):
+            self.exit_gracefully()
+        except Exception as e:
+            self.cfg.write(f"\n  {self.cfg.C['accent']}✖ critical engine error: {self.cfg.C['white']}{str(e).lower()}")
+            sys.exit(1)
+
+    def _orchestrate_infra(self, fw, mode):
+        """Handles manual infrastructure selection logic."""
+        f_list = [fw, mode, "infra"]
+        if mode == "custom":
+            selected_dirs, init_map = self.architect(self.domain_folders, flow=[fw, "architect"])
+            self.manifest["init_strategy"] = init_map
+        else:
+            selected_dirs = self.prompter.get_smart_folders(fw, mode, self.domain_folders)
+            self.manifest["init_strategy"] = {d: True for d in selected_dirs}
+
+        infra_options = [("docker", const.DOCKER_SUITE), ("jenkins", const.JENKINS_SUITE), ("github", const.GITHUB_SUITE)]
+        if mode in ["production", "custom"]:
+            infra_options.extend([("community", const.COMMUNITY_CORE), ("kubernetes", const.K8S_FILES)])
+
+        for key, suite in infra_options:
+            res = self.checklist("infra forge", key, suite, flow=f_list)
+            if res:
+                self.manifest["infra_suites"].append(key)
+                self.manifest["infra_files"][key] = list(res)
+        return selected_dirs
+
+    def _run_mission_control(self, fw, p_name, mode, folders):
+        """Final summary matrix and execution trigger."""
+        c = self.cfg.C
+        self.header("mission control", "success")
+        infra_total = sum(len(f) for f in self.manifest['infra_files'].values())
+        db_clean = self.manifest['database'].split(' ')[0]
+        
+        # High-performance buffered write for the matrix
+        matrix = [
+            f"  {c['muted']}┌──────────────────────────────────────────┐",
+            f"  {c['muted']}│ {c['white']}NAME  : {c['primary']}{p_name[:12].ljust(12)} {c['white']}ENGINE: {c['primary']}{fw[:10].ljust(10)} {c['muted']}│",
+            f"  {c['muted']}│ {c['white']}MODE  : {c['primary']}{mode[:12].ljust(12)} {c['white']}DB    : {c['primary']}{db_clean[:10].ljust(10)} {c['muted']}│",
+            f"  {c['muted']}│ {c['white']}DIRS  : {c['primary']}{str(len(folders)).ljust(12)} {c['white']}DRF   : {c['primary']}{str(self.manifest['is_drf']).ljust(10)} {c['muted']}│",
+            f"  {c['muted']}└──────────────────────────────────────────┘"
+        ]
+        self.cfg.write("\n".join(matrix))
+
+        sys.stdout.write(f"\n  {c['success']}? {c['white']}Initialize build sequence? (y/n): ")
+        sys.stdout.flush()
+
+        if readchar.readkey().lower() == 'y':
+            self.cfg.write(f"{c['success']}yes")
+            self.finalize(p_name)
+            # ⚡ Build stack is only imported once the user confirms
+            from create_app.initializer.controller import Controller
+            mission = Controller(self.manifest, list(folders))
+            mission.run_mission()
+        else:
+            self.cfg.write(f"{c['accent']}no\n  {c['muted']}build cancelled.")
+            sys.exit(0)
@@ -1,219 +1,317 @@
-import readchar, time, sys, os, argparse
-from pathlib import Path
+import sys, os, argparse
 
 # --- AGGRESSIVE PATH RESOLUTION ---
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
-from create_app.engine.ui.user_interface import InitUI
-from create_app.engine.prompts import BuildPrompts
+# ⚡ Startup stays light: parsing, --help and --version only need the constants.
+# Everything else (Jinja, Controller, readchar, pyfiglet) is imported by the path that uses it.
 import create_app.constants as const
-from create_app.initializer.controller import Controller 
-
-class AppEngine(InitUI):
-    def __init__(self):
-        super().__init__(const.APP_NAME, const.__version__)
-        self.prompter = BuildPrompts(self, const)
-        self.infra_keys = ["docker", "jenkins", "k8s", ".github", "db"]
-        self.domain_folders = [f.lower() for f in const.ALL_CUSTOM_FOLDERS if f.lower() not in self.infra_keys]
-        # DNA of the project creation
-        self.manifest = { 
-            "infra_suites": [], 
-            "infra_files": {}, 
-            "init_strategy": {},
-            "is_drf": False 
-        } 
-
-    def _setup_parser(self):
-        """Defines the CLI command structure with high-performance overrides."""
-        parser = argparse.ArgumentParser(description=f"{const.APP_NAME} - Advanced Project Engine")
-        
-        # Identity & Version
-        parser.add_argument("name", nargs="?", help="Project name")
-        parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {const.__version__}")
-        
-        # Core Configuration
-        parser.add_argument("-f", "--framework", choices=["fastapi", "flask", "django", "others"], help="Target framework")
-        parser.add_argument("-s", "--server", help="Specific server (e.g., uvicorn, gunicorn, hypercorn)")
-        parser.add_argument("-t", "--type", choices=["standard", "production", "custom", "auto_config"], dest="strategy", help="Build strategy")
-        parser.add_argument("--drf", action="store_true", help="Enable Django Rest Framework (Django only)")
-        
-        # Architecture Overrides
-        parser.add_argument("--folders", nargs="+", help="Manually specify folders (Custom mode only)")
-        parser.add_argument("--packages", nargs="+", help="Specify which folders get __init__.py")
-        
-        # Environment & Database
-        parser.add_argument("--db", default="sqlite", help="Database engine (sqlite, postgres, mysql, mongodb)")
-        parser.add_argument("--venv", choices=["y", "n"], default="y", help="Enable virtual environment (y/n)")
-        
-        # Infrastructure Modules
-        parser.add_argument("--docker", nargs="+", help="Select Docker files")
-        parser.add_argument("--github", nargs="+", help="Select GitHub actions")
-        parser.add_argument("--k8s", nargs="+", help="Select Kubernetes manifests")
-        parser.add_argument("--jenkins", nargs="+", help="Select Jenkins pipeline files")
-        
-        return parser
-
-    def start(self):
-        parser = self._setup_parser()
-        args = parser.parse_args()
-
-        if args.name and args.framework:
-            self._handle_cli_mode(args)
-        else:
-            self._handle_interactive_mode()
-
-    def _handle_cli_mode(self, args):
-        """Processes logic based on CLI flags with full Django-aware support."""
-        fw_slug = args.framework.lower()
-        strategy = args.strategy or "standard"
-        p_name = args.name
-        
-        # Resolve Infrastructure
-        infra_map = {"docker": args.docker, "github": args.github, "kubernetes": args.k8s, "jenkins": args.jenkins}
-        for key, files in infra_map.items():
-            if files:
-                self.manifest["infra_suites"].append(key)
-                self.manifest["infra_files"][key] = files
-
-        # FOLDER RESOLUTION: Handle custom vs default
-        if strategy == "custom" and args.folders:
-            selected_folders = args.folders
-        else:
-            selected_folders = self.prompter.get_smart_folders(fw_slug, strategy, self.domain_folders)
-
-        # PACKAGE RESOLUTION: Precise __init__.py logic
-        if strategy == "custom" and args.packages is not None:
-            init_map = {folder: (folder in args.packages) for folder in selected_folders}
-        else:
-            init_map = {folder: True for folder in selected_folders}
-
-        self.manifest.update({
-            "project name": p_name,
-            "core blueprint": f"{fw_slug} ({args.server or 'default'})",
-            "fw_name": fw_slug, 
-            "is_drf": args.drf,
-            "build strategy": strategy,
-            "environment": "venv" if args.venv == "y" else "no venv",
-            "apps": "none", 
-            "database": args.db or "sqlite",
-            "venv_enabled": args.venv == "y",
-            "init_strategy": init_map
-        })
-        
-        mission = Controller(self.manifest, list(selected_folders))
-        mission.run_mission()
-
-    def _handle_interactive_mode(self):
-        """Interactive flow utilizing the High-Performance UI layer."""
+
+LOG_LEVELS = ["debug", "info", "warning", "error"]
+ASSET_MODES = ["link", "reflink", "copy"]  # create_app.initializer.asset_store
+ASSETS_HELP = "Static assets: hardlink or reflink from the shared asset store, or copy (default)"
+IO_WORKERS_HELP = "Writer threads per project: files are rendered while earlier ones are written (default: 1, inline)"
+
+def _apply_log_options(args):
+    """--plan mutes the log file; --log-level drops records below the chosen level."""
+    if args.plan or args.log_level:
+        from create_app.logger import set_file_logging, set_log_level
+        if args.plan:
+            set_file_logging(False)
+        if args.log_level:
+            set_log_level(args.log_level)
+
+def _add_profile_options(parser):
+    parser.add_argument("--profile", nargs="?", type=int, const=15, metavar="N",
+                        help="Print the N slowest spans (phases, renders, copies, venv steps) after the build")
+    parser.add_argument("--trace", metavar="FILE", help="Write a Chrome trace-event JSON (chrome://tracing, Perfetto)")
+
+def _traced(args, func):
+    """Runs func with build tracing on when --profile/--trace asked for it."""
+    if args.profile is None and not args.trace:
+        return func()
+    from create_app.tracing import start_tracing, stop_tracing, format_report
+    start_tracing()
+    try:
+        return func()
+    finally:
+        tracer = stop_tracing()
+        if args.profile is not None:
+            print("\n" + format_report(tracer, args.profile))
+        if args.trace:
+            tracer.write_chrome(args.trace)
+            print(f"\n  trace written: {args.trace} ({len(tracer.spans)} spans)")
+
+def build_parser():
+    """Defines the CLI command structure with high-performance overrides."""
+    parser = argparse.ArgumentParser(
+        description=f"{const.APP_NAME} - Advanced Project Engine",
+        epilog="Sub-commands: batch, cache, wheelhouse, serve. To scaffold a project with one of those names, "
+               "put -- before it (e.g. -- serve -f fastapi).")
+
+    # Identity & Version
+    parser.add_argument("name", nargs="?", help="Project name")
+    parser.add_argument("-v", "--version", action="version", version=f"%(prog)s {const.__version__}")
+
+    # Core Configuration
+    parser.add_argument("-f", "--framework", choices=["fastapi", "flask", "django", "others"], help="Target framework")
+    parser.add_argument("-s", "--server", help="Specific server (e.g., uvicorn, gunicorn, hypercorn)")
+    parser.add_argument("-t", "--type", choices=["standard", "production", "custom", "auto_config"], dest="strategy", help="Build strategy")
+    parser.add_argument("--drf", action="store_true", help="Enable Django Rest Framework (Django only)")
+
+    # Architecture Overrides
+    parser.add_argument("--folders", nargs="+", help="Manually specify folders (Custom mode only)")
+    parser.add_argument("--packages", nargs="+", help="Specify which folders get __init__.py")
+
+    # Environment & Database
+    parser.add_argument("--db", default="sqlite", help="Database engine (sqlite, postgres, mysql, mongodb)")
+    parser.add_argument("--venv", choices=["y", "n"], default="y", help="Enable virtual environment (y/n)")
+    parser.add_argument("--wheelhouse", metavar="DIR", help="Install dependencies offline from a local wheel directory")
+
+    # Infrastructure Modules
+    parser.add_argument("--docker", nargs="+", help="Select Docker files")
+    parser.add_argument("--github", nargs="+", help="Select GitHub actions")
+    parser.add_argument("--k8s", nargs="+", help="Select Kubernetes manifests")
+    parser.add_argument("--jenkins", nargs="+", help="Select Jenkins pipeline files")
+
+    # Dry Run
+    parser.add_argument("--plan", action="store_true", help="Print the resolved build plan as JSON without writing anything")
+
+    # Output
+    parser.add_argument("--archive", metavar="FILE", help="Stream the project into FILE (.tar.gz, .tgz or .zip) instead of a directory")
+    parser.add_argument("--assets", choices=ASSET_MODES, help=ASSETS_HELP)
+    parser.add_argument("--io-workers", type=int, default=1, metavar="N", help=IO_WORKERS_HELP)
+
+    # Re-runs
+    parser.add_argument("--force", action="store_true", help="Overwrite files edited since the last generation")
+
+    # Diagnostics
+    parser.add_argument("--log-level", choices=LOG_LEVELS, help="Minimum level written to the per-run log file (default: debug)")
+    _add_profile_options(parser)
+
+    return parser
+
+def _handle_cli_mode(args):
+    """Processes logic based on CLI flags with full Django-aware support."""
+    from create_app.engine.prompts import BuildPrompts, domain_folders
+    from create_app.initializer.controller import Controller
+
+    fw_slug = args.framework.lower()
+    strategy = args.strategy or "standard"
+    p_name = args.name
+    manifest = {"infra_suites": [], "infra_files": {}, "init_strategy": {}, "is_drf": False}
+
+    # Resolve Infrastructure
+    infra_map = {"docker": args.docker, "github": args.github, "kubernetes": args.k8s, "jenkins": args.jenkins}
+    for key, files in infra_map.items():
+        if files:
+            manifest["infra_suites"].append(key)
+            manifest["infra_files"][key] = files
+
+    # FOLDER RESOLUTION: Handle custom vs default
+    if strategy == "custom" and args.folders:
+        selected_folders = args.folders
+    else:
+        selected_folders = BuildPrompts(None, const).get_smart_folders(fw_slug, strategy, domain_folders(const))
+
+    # PACKAGE RESOLUTION: Precise __init__.py logic
+    if strategy == "custom" and args.packages is not None:
+        init_map = {folder: (folder in args.packages) for folder in selected_folders}
+    else:
+        init_map = {folder: True for folder in selected_folders}
+
+    manifest.update({
+        "project name": p_name,
+        "core blueprint": f"{fw_slug} ({args.server or 'default'})",
+        "fw_name": fw_slug, 
+        "is_drf": args.drf,
+        "build strategy": strategy,
+        "environment": "venv" if args.venv == "y" else "no venv",
+        "apps": "none", 
+        "database": args.db or "sqlite",
+        "venv_enabled": args.venv == "y",
+        "init_strategy": init_map
+    })
+
+    sink = None
+    if args.archive and not args.plan:
+        from create_app.initializer.sinks import archive_format, archive_sink
         try:
-            selected_folders = set()
-            fw_display, _ = self.menu("core blueprint", const.FRAMEWORKS, sub_mapping=const.FRAMEWORK_SERVER_MAPPING, flow=["blueprint"])
-            fw_slug = fw_display.split(" (")[0].lower()
-            
-            # Sync DRF logic from UI string
-            self.manifest["is_drf"] = "rest framework" in fw_display.lower()
-
-            if fw_slug == "others":
-                project_type_display, _ = self.menu("engine type", const.OTHERS_PROJECT_TYPES, flow=["others"])
-                fw_slug = project_type_display.lower()
-
-            mode_raw, _ = self.menu("build strategy", const.PROJECT_MODES, flow=[fw_slug, "mode"])
-            mode = mode_raw.lower()
-            
-            # Dynamic Workflow
-            db_raw, _ = self.menu("data nexus", const.DB_ENGINES, flow=[fw_slug, mode, "database"])
-            db = db_raw.lower()
-            
-            if mode == "auto_config":
-                env_display, _ = self.menu("environment", ["venv (recommended)", "no venv"], flow=[fw_slug, mode, "env"])
-                p_name = self.prompter.get_project_name()
-                apps_list = [] 
-                selected_folders = self.prompter.get_smart_folders(fw_slug, "standard", self.domain_folders)
-                self.manifest["init_strategy"] = {f: True for f in selected_folders}
-            else:
-                selected_folders = self._orchestrate_infra(fw_slug, mode)
-                env_display, _ = self.menu("environment", ["venv (recommended)", "no venv"], flow=[fw_slug, mode, "env"])
-                p_name, apps_list = self.prompter.collect_identity(fw_slug, mode)
-
-            self.manifest.update({
-                    "project name": p_name,
-                    "core blueprint": fw_display,
-                    "fw_name": fw_slug, 
-                    "build strategy": mode,
-                    "environment": env_display,
-                    "apps": ", ".join(apps_list) if apps_list else "none", 
-                    "database": db,
-                    "venv_enabled": "no" if "no venv" in env_display.lower() else "yes"
-                })
-
-            self._run_mission_control(fw_slug, p_name, mode, selected_folders)
-
-        except (KeyboardInterrupt, EOFError):
-            self.exit_gracefully()
-        except Exception as e:
-            self.cfg.write(f"\n  {self.cfg.C['accent']}✖ critical engine error: {self.cfg.C['white']}{str(e).lower()}")
-            sys.exit(1)
-
-    def _orchestrate_infra(self, fw, mode):
-        """Handles manual infrastructure selection logic."""
-        f_list = [fw, mode, "infra"]
-        if mode == "custom":
-            selected_dirs, init_map = self.architect(self.domain_folders, flow=[fw, "architect"])
-            self.manifest["init_strategy"] = init_map
-        else:
-            selected_dirs = self.prompter.get_smart_folders(fw, mode, self.domain_folders)
-            self.manifest["init_strategy"] = {d: True for d in selected_dirs}
-
-        infra_options = [("docker", const.DOCKER_SUITE), ("jenkins", const.JENKINS_SUITE), ("github", const.GITHUB_SUITE)]
-        if mode in ["production", "custom"]:
-            infra_options.extend([("community", const.COMMUNITY_CORE), ("kubernetes", const.K8S_FILES)])
-
-        for key, suite in infra_options:
-            res = self.checklist("infra forge", key, suite, flow=f_list)
-            if res:
-                self.manifest["infra_suites"].append(key)
-                self.manifest["infra_files"][key] = list(res)
-        return selected_dirs
-
-    def _run_mission_control(self, fw, p_name, mode, folders):
-        """Final summary matrix and execution trigger."""
-        c = self.cfg.C
-        self.header("mission control", "success")
-        infra_total = sum(len(f) for f in self.manifest['infra_files'].values())
-        db_clean = self.manifest['database'].split(' ')[0]
-        
-        # High-performance buffered write for the matrix
-        matrix = [
-            f"  {c['muted']}┌──────────────────────────────────────────┐",
-            f"  {c['muted']}│ {c['white']}NAME  : {c['primary']}{p_name[:12].ljust(12)} {c['white']}ENGINE: {c['primary']}{fw[:10].ljust(10)} {c['muted']}│",
-            f"  {c['muted']}│ {c['white']}MODE  : {c['primary']}{mode[:12].ljust(12)} {c['white']}DB    : {c['primary']}{db_clean[:10].ljust(10)} {c['muted']}│",
-            f"  {c['muted']}│ {c['white']}DIRS  : {c['primary']}{str(len(folders)).ljust(12)} {c['white']}DRF   : {c['primary']}{str(self.manifest['is_drf']).ljust(10)} {c['muted']}│",
-            f"  {c['muted']}└──────────────────────────────────────────┘"
-        ]
-        self.cfg.write("\n".join(matrix))
-
-        sys.stdout.write(f"\n  {c['success']}? {c['white']}Initialize build sequence? (y/n): ")
-        sys.stdout.flush()
-
-        if readchar.readkey().lower() == 'y':
-            self.cfg.write(f"{c['success']}yes")
-            self.finalize(p_name)
-            mission = Controller(self.manifest, list(folders))
-            mission.run_mission()
-        else:
-            self.cfg.write(f"{c['accent']}no\n  {c['muted']}build cancelled.")
-            sys.exit(0)
+            sink = archive_sink(args.archive, archive_format(args.archive), prefix=p_name)
+        except ValueError as e:
+            sys.exit(f"  {e}")
+
+    mission = Controller(manifest, list(selected_folders), force=args.force, wheelhouse=args.wheelhouse, sink=sink,
+                         assets=args.assets, io_workers=args.io_workers)
+    if args.plan:
+        import json
+        print(json.dumps(mission.dry_run(), indent=2))
+        return
+    if not mission.run_mission() and sink:
+        # Never leave a truncated archive behind
+        sink.fileobj.close()
+        os.remove(args.archive)
+
+def start(argv=None):
+    """Project command: headless when name + framework are given, interactive otherwise."""
+    args = build_parser().parse_args(argv)
+    _apply_log_options(args)
+
+    if args.name and args.framework:
+        _traced(args, lambda: _handle_cli_mode(args))
+    else:
+        from create_app.engine.app import AppEngine
+        _traced(args, lambda: AppEngine().start())
+
+def _batch_command(argv):
+    """`init-app batch specs.yaml`: fleet generation inside one warm process."""
+    parser = argparse.ArgumentParser(prog=f"{const.APP_NAME} batch", description="Generate many projects from one spec file")
+    parser.add_argument("specs", help="YAML or JSON file holding a list of project specs")
+    parser.add_argument("-o", "--output", default=".", help="Directory the projects are generated into")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="Worker processes (0 = one per CPU core)")
+    parser.add_argument("--plan", action="store_true", help="Print every project's build plan as JSON without writing anything")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, help="Minimum level written to the run log (info drops per-file records)")
+    parser.add_argument("--wheelhouse", metavar="DIR", help="Install dependencies offline from a local wheel directory")
+    parser.add_argument("--assets", choices=ASSET_MODES, help=ASSETS_HELP)
+    parser.add_argument("--io-workers", type=int, default=1, metavar="N", help=IO_WORKERS_HELP)
+    _add_profile_options(parser)  # Spans from this process only: use --jobs 1 for per-file detail
+    args = parser.parse_args(argv)
+    _apply_log_options(args)
+
+    if args.assets:
+        # Exported like the wheelhouse: every Controller (and pool worker) shares one asset store
+        from create_app.initializer.asset_store import ASSETS_ENV_VAR
+        os.environ[ASSETS_ENV_VAR] = args.assets
+
+    if args.wheelhouse:
+        # Exported so pool workers (fork or spawn) resolve the same wheelhouse
+        from create_app.initializer.wheelhouse import WHEELHOUSE_ENV_VAR
+        os.environ[WHEELHOUSE_ENV_VAR] = os.path.abspath(args.wheelhouse)
+
+    import json
+    from pathlib import Path
+    from create_app.initializer.batch import BatchRunner, load_specs
+
+    if args.plan:
+        plans = BatchRunner(load_specs(args.specs), base_dir=Path(args.output)).plan_all()
+        print(json.dumps(plans, indent=2))
+        sys.exit(0 if all("error" not in p for p in plans) else 1)
+
+    runner = BatchRunner(load_specs(args.specs), base_dir=Path(args.output), jobs=args.jobs, io_workers=args.io_workers)
+    results = _traced(args, runner.run)
+    runner.report(results, runner.elapsed)
+    sys.exit(0 if all(r["status"] == "ok" for r in results) else 1)
+
+def _cache_command(argv):
+    """`init-app cache warm|clear|info`: manages the compiled-template and venv template caches."""
+    parser = argparse.ArgumentParser(prog=f"{const.APP_NAME} cache", description="Manage the compiled-template and venv caches")
+    parser.add_argument("action", choices=["warm", "clear", "info"], help="Cache operation")
+    args = parser.parse_args(argv)
+
+    from create_app.engine.ui.ui_config import UIConfig
+    from create_app.initializer import templating
+    from create_app.initializer.venv_manager import clear_venv_cache, venv_cache_info
+    c = UIConfig.C
+
+    if args.action == "warm":
+        count = templating.warm_cache()
+        UIConfig.write(f"  {c['success']}✔ {c['white']}compiled {count} templates into the cache")
+    elif args.action == "clear":
+        templating.clear_cache()
+        clear_venv_cache()
+        UIConfig.write(f"  {c['success']}✔ {c['white']}template and venv caches cleared")
+
+    info = templating.cache_info()
+    UIConfig.write(f"  {c['muted']}path   : {c['white']}{info['path']}")
+    UIConfig.write(f"  {c['muted']}enabled: {c['white']}{info['enabled']}")
+    UIConfig.write(f"  {c['muted']}entries: {c['white']}{info['entries']} ({info['bytes'] / 1024:.1f} KiB)")
+    venvs = venv_cache_info()
+    UIConfig.write(f"  {c['muted']}venvs  : {c['white']}{venvs['templates']} templates in {venvs['path']}")
+
+def _wheelhouse_command(argv):
+    """`init-app wheelhouse build DIR`: pre-builds wheels for every dependency set (needs network)."""
+    parser = argparse.ArgumentParser(prog=f"{const.APP_NAME} wheelhouse", description="Build an offline wheelhouse")
+    parser.add_argument("action", choices=["build", "check"], help="build: download/build all wheels; check: report missing ones")
+    parser.add_argument("path", metavar="DIR", help="Wheelhouse directory")
+    args = parser.parse_args(argv)
+
+    from create_app.engine.ui.ui_config import UIConfig
+    from create_app.initializer.wheelhouse import Wheelhouse, dependency_sets
+    c = UIConfig.C
+    house = Wheelhouse(args.path)
+    sets = dependency_sets()
+
+    if args.action == "build":
+        from create_app.engine.ui.spinner import Spinner
+        with Spinner(f"Building wheels for {len(sets)} dependency sets"):
+            index = house.build(sets)
+        wheels = {w for entry in index["sets"].values() for w in entry["wheels"]}
+        failed = [d for d, entry in index["sets"].items() if entry.get("error")]
+        UIConfig.write(f"  {c['success']}✔ {c['white']}{len(wheels)} wheels for {len(sets) - len(failed)}/{len(sets)} sets in {house.path}")
+        for digest in failed:
+            UIConfig.write(f"  {c['accent']}✖ {c['white']}{digest[:12]}: {index['sets'][digest]['error']}")
+        sys.exit(1 if failed else 0)
+
+    gaps = {digest: house.missing(deps) for digest, deps in sets.items()}
+    gaps = {digest: missing for digest, missing in gaps.items() if missing}
+    for digest, missing in gaps.items():
+        UIConfig.write(f"  {c['accent']}✖ {c['white']}{digest[:12]}: {', '.join(missing)}")
+    UIConfig.write(f"  {c['success'] if not gaps else c['accent']}{len(sets) - len(gaps)}/{len(sets)} "
+                   f"{c['white']}dependency sets installable offline")
+    sys.exit(1 if gaps else 0)
+
+def _serve_command(argv):
+    """`init-app serve`: warm long-running scaffold server (HTTP on localhost or a Unix socket)."""
+    from create_app.engine import server as srv
+    parser = argparse.ArgumentParser(prog=f"{const.APP_NAME} serve", description="Serve scaffolds from one warm process")
+    parser.add_argument("--host", default=srv.DEFAULT_HOST, help=f"Bind address (default: {srv.DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=srv.DEFAULT_PORT, help=f"TCP port (default: {srv.DEFAULT_PORT})")
+    parser.add_argument("--unix", metavar="PATH", help="Listen on a Unix socket instead of TCP")
+    parser.add_argument("-j", "--max-concurrency", type=int, default=4, help="Builds running at once; the rest queue")
+    parser.add_argument("-o", "--output-root", default=".", help="Server-side directory that 'output' specs write under")
+    parser.add_argument("--grace", type=float, default=30.0, help="Seconds in-flight builds get on shutdown")
+    parser.add_argument("--log-level", choices=LOG_LEVELS, help="Minimum level written to the run log")
+    args = parser.parse_args(argv)
+    if args.log_level:
+        from create_app.logger import set_log_level
+        set_log_level(args.log_level)
+
+    from create_app.engine.ui.ui_config import UIConfig
+    c = UIConfig.C
+    # Announced only once bound and warm: --port 0 shows the real port, a failed start never claims to serve
+    announce = lambda where: UIConfig.write(f"  {c['success']}✔ {c['white']}serving scaffolds on {where} (ctrl+c to stop)")
+    server = srv.ScaffoldServer(host=args.host, port=args.port, unix_socket=args.unix,
+                                max_concurrency=args.max_concurrency, output_root=args.output_root, grace=args.grace,
+                                on_ready=announce)
+    try:
+        server.run()
+    except (RuntimeError, OSError) as e:  # Prerequisites failed / address in use
+        sys.exit(f"  {e}")
+
+# Sub-commands dispatched before the project parser sees argv.
+# A project literally named like one needs the separator: `init-app -- serve -f fastapi`.
+SUBCOMMANDS = {
+    "batch": _batch_command,
+    "cache": _cache_command,
+    "wheelhouse": _wheelhouse_command,
+    "serve": _serve_command,
+}
 
 def main():
     """Entry point for the console script."""
     try:
-        engine = AppEngine()
-        engine.start()
+        argv = sys.argv[1:]
+        if argv and argv[0] in SUBCOMMANDS:
+            SUBCOMMANDS[argv[0]](argv[1:])
+            return
+        if argv[:1] == ["--"]:
+            argv = argv[1:]  # `init-app -- serve ...`: a project named like a sub-command
+        start(argv)
     except KeyboardInterrupt:
         print("\n  Exiting...")
         sys.exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,6 +2,13 @@ import time
 import sys
 from create_app.engine.ui.ui_config import UIConfig
 
+# Infra layers are chosen in the Forge, never offered as domain folders
+INFRA_KEYS = ["docker", "jenkins", "k8s", ".github", "db"]
+
+def domain_folders(constants_module) -> list:
+    """Folder choices shared by the interactive, headless and batch flows."""
+    return [f.lower() for f in constants_module.ALL_CUSTOM_FOLDERS if f.lower() not in INFRA_KEYS]
+
 class BuildPrompts:
     """
     Identity & Strategy Resolver:
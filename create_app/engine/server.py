@@ -0,0 +1,391 @@
+"""
+SCAFFOLD SERVER (v1.0.0)
+`init-app serve`: one long-running process that keeps the Bundler rule tables,
+the constants snapshot and every compiled Jinja template warm, and answers build
+requests over HTTP (TCP on localhost, or a Unix socket).
+
+  POST /build[?format=tar|zip]  body: a batch-style spec -> streamed .tar.gz / .zip
+  POST /build                   spec with "output": "<dir>" -> written under --output-root
+  GET  /health                  liveness
+  GET  /metrics                 request counts, latencies, in-flight / queued builds
+
+Builds run on a thread pool behind an asyncio.Semaphore (--max-concurrency);
+SIGINT/SIGTERM stop accepting, let in-flight builds finish, then exit.
+"""
+import asyncio
+import io
+import json
+import os
+import signal
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import urlsplit, parse_qs
+
+import create_app.constants as const
+from create_app.engine.prompts import BuildPrompts, domain_folders
+from create_app.framework.bundler import constants_snapshot
+from create_app.initializer.batch import normalize_spec
+from create_app.initializer.controller import Controller
+from create_app.initializer.sinks import archive_sink
+from create_app.initializer.templating import template_index, warm_cache
+from docs.prerequisite import Prerequisite
+from create_app.logger import logger
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_BODY = 1 << 20        # Specs are small; anything bigger is refused (413)
+READ_TIMEOUT = 30         # Seconds to receive a complete request head + body
+STREAM_CHUNK = 64 * 1024  # Archive bytes handed to the event loop per chunk
+STREAM_QUEUE = 8          # Chunks buffered per response before the build thread waits
+LATENCY_WINDOW = 1024     # Samples kept per route for percentiles
+
+CONTENT_TYPES = {"tar": "application/gzip", "zip": "application/zip"}
+EXTENSIONS = {"tar": "tar.gz", "zip": "zip"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _ChunkPipe(io.RawIOBase):
+    """Write end for the build thread: chunks go to the event loop with backpressure."""
+    def __init__(self, loop, queue: asyncio.Queue):
+        self.loop = loop
+        self.queue = queue
+        self.abandoned = False  # Client went away: fail the build instead of buffering
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        if self.abandoned:
+            raise BrokenPipeError("client disconnected")
+        if data:
+            asyncio.run_coroutine_threadsafe(self.queue.put(bytes(data)), self.loop).result()
+        return len(data)
+
+
+class Metrics:
+    """Request counters and latency windows, read by GET /metrics."""
+    def __init__(self):
+        self.started = time.time()
+        self.requests = Counter()   # route -> count
+        self.statuses = Counter()   # HTTP status -> count
+        self.builds = Counter()     # ok / failed
+        self.bytes_sent = 0
+        self.in_flight = 0
+        self.queued = 0
+        self._latency = {}          # route -> deque of seconds
+
+    def observe(self, route: str, status: int, seconds: float):
+        self.requests[route] += 1
+        self.statuses[str(status)] += 1
+        self._latency.setdefault(route, deque(maxlen=LATENCY_WINDOW)).append(seconds)
+
+    @staticmethod
+    def _summary(samples) -> dict:
+        ordered = sorted(samples)
+        pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+        return {
+            "count": len(ordered),
+            "mean_ms": round(1000 * sum(ordered) / len(ordered), 2),
+            "p50_ms": round(1000 * pick(0.50), 2),
+            "p95_ms": round(1000 * pick(0.95), 2),
+            "max_ms": round(1000 * ordered[-1], 2),
+        }
+
+    def snapshot(self) -> dict:
+        return {
+            "uptime_s": round(time.time() - self.started, 1),
+            "requests": dict(self.requests),
+            "statuses": dict(self.statuses),
+            "builds": dict(self.builds),
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "bytes_sent": self.bytes_sent,
+            "latency": {route: self._summary(s) for route, s in self._latency.items() if s},
+        }
+
+
+class ScaffoldServer:
+    """
+    WARM SCAFFOLD DAEMON (v1.0.0)
+    FEATURE: Per-process costs (system check, constants, Jinja compile) are paid once at startup.
+    FEATURE: Archives stream straight from the Generator's sink into the HTTP response (chunked).
+    FEATURE: Concurrency limit, timing metrics and graceful shutdown.
+    """
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, unix_socket: str = None,
+                 max_concurrency: int = 4, output_root: Path = None, grace: float = 30.0, preflight: bool = True,
+                 on_ready=None):
+        self.host = host
+        self.port = port
+        self.unix_socket = unix_socket
+        self.max_concurrency = max(1, max_concurrency)
+        self.output_root = Path(output_root or Path.cwd()).resolve()
+        self.grace = grace          # Seconds in-flight requests get after a shutdown signal
+        self.preflight = preflight
+        self.metrics = Metrics()
+        self.prompter = BuildPrompts(None, const)
+        self.domain_folders = domain_folders(const)
+        self.ready = threading.Event()  # Set once listening (self.port holds the bound port)
+        self.on_ready = on_ready        # Called with the bound address once listening (CLI banner)
+        self._loop = None
+        self._stop = None
+        self._slots = None
+        self._pool = None
+        self._active = set()
+
+    # --- LIFECYCLE ---
+
+    def warm_up(self):
+        if self.preflight:
+            check = Prerequisite.check_system()
+            if not check["status"]:
+                raise RuntimeError(f"Prerequisites failed: {check.get('errors')}")
+        constants_snapshot()
+        template_index()
+        count = warm_cache()
+        logger.info(f"🔥 Scaffold server warm: {count} templates compiled.")
+
+    def run(self):
+        """Blocking entry point (warm-up, serve until signalled)."""
+        self.warm_up()
+        asyncio.run(self.serve())
+
+    def shutdown(self):
+        """Thread-safe graceful stop (same path as SIGTERM)."""
+        if self._loop and self._stop:
+            self._loop.call_soon_threadsafe(self._stop.set)
+
+    async def serve(self):
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+        self._pool = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="scaffold")
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._stop.set)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass  # Windows, or not on the main thread (embedded / tests): use shutdown()
+
+        if self.unix_socket:
+            server = await asyncio.start_unix_server(self._track, path=self.unix_socket)
+            where = f"unix:{self.unix_socket}"
+        else:
+            server = await asyncio.start_server(self._track, self.host, self.port)
+            self.port = server.sockets[0].getsockname()[1]
+            where = f"http://{self.host}:{self.port}"
+        logger.info(f"🛰️ Scaffold server listening on {where} (max {self.max_concurrency} concurrent builds)")
+        self.ready.set()
+        if self.on_ready:
+            self.on_ready(where)
+
+        await self._stop.wait()
+
+        # --- GRACEFUL SHUTDOWN: no new connections, in-flight requests finish ---
+        logger.info(f"🛑 Scaffold server stopping ({len(self._active)} requests in flight)")
+        server.close()
+        await server.wait_closed()
+        if self._active:
+            await asyncio.wait(self._active, timeout=self.grace)
+        self._pool.shutdown(wait=True)
+        if self.unix_socket and os.path.exists(self.unix_socket):
+            os.remove(self.unix_socket)
+        logger.info("🏁 Scaffold server stopped.")
+
+    async def _track(self, reader, writer):
+        task = asyncio.current_task()
+        self._active.add(task)
+        try:
+            await self._handle(reader, writer)
+        finally:
+            self._active.discard(task)
+
+    # --- HTTP ---
+
+    async def _read_request(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        try:
+            method, target, _ = request_line.split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "malformed request line")
+
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1")
+            if line in ("\r\n", "\n", ""):
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        try:
+            length = int(headers.get("content-length") or 0)
+            if length < 0:
+                raise ValueError(length)
+        except ValueError:
+            raise HTTPError(400, "invalid Content-Length")
+        if length > MAX_BODY:
+            raise HTTPError(413, f"spec larger than {MAX_BODY} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), urlsplit(target), body
+
+    @staticmethod
+    def _head(status: int, headers: dict) -> bytes:
+        lines = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+        lines += [f"{k}: {v}" for k, v in {**headers, "Connection": "close"}.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer, status: int, payload: dict) -> int:
+        body = json.dumps(payload, indent=1).encode("utf-8")
+        writer.write(self._head(status, {"Content-Type": "application/json", "Content-Length": len(body)}) + body)
+        await writer.drain()
+        self.metrics.bytes_sent += len(body)
+        return status
+
+    async def _handle(self, reader, writer):
+        started = time.perf_counter()
+        route, status = "invalid", 500
+        try:
+            try:
+                method, url, body = await asyncio.wait_for(self._read_request(reader), READ_TIMEOUT)
+                route = f"{method} {url.path}"
+                if url.path == "/health" and method == "GET":
+                    status = await self._send_json(writer, 200, {"status": "ok", "version": const.__version__})
+                elif url.path == "/metrics" and method == "GET":
+                    status = await self._send_json(writer, 200, self.metrics.snapshot())
+                elif url.path == "/build" and method == "POST":
+                    status = await self._build(url, body, writer)
+                else:
+                    raise HTTPError(404, f"no route for {method} {url.path}")
+            except HTTPError as e:
+                status = await self._send_json(writer, e.status, {"error": str(e)})
+            except (asyncio.TimeoutError, asyncio.IncompleteReadError):
+                status = await self._send_json(writer, 408, {"error": "incomplete request"})
+        except (ConnectionError, OSError):
+            status = 499  # Client went away mid-response
+        except Exception as e:
+            logger.error(f"🔥 Scaffold server error: {str(e)}", exc_info=True)
+            try:
+                status = await self._send_json(writer, 500, {"error": str(e)})
+            except (ConnectionError, OSError):
+                pass
+        finally:
+            self.metrics.observe(route, status, time.perf_counter() - started)
+            writer.close()
+
+    # --- BUILDS ---
+
+    def _parse_spec(self, url, body: bytes):
+        try:
+            spec = json.loads(body or b"{}")
+        except ValueError as e:
+            raise HTTPError(400, f"spec is not valid JSON: {e}")
+        if not isinstance(spec, dict):
+            raise HTTPError(400, "spec must be a JSON object")
+
+        output = spec.pop("output", None)
+        kind = parse_qs(url.query).get("format", [spec.pop("format", "tar")])[0]
+        if kind not in CONTENT_TYPES:
+            raise HTTPError(400, f"unknown format '{kind}' (use {', '.join(CONTENT_TYPES)})")
+        try:
+            manifest, folders = normalize_spec(spec, self.prompter, self.domain_folders)
+        except ValueError as e:
+            raise HTTPError(400, str(e))
+
+        base_dir = None
+        if output:
+            base_dir = (self.output_root / output).resolve()
+            self._check_inside_root(base_dir)
+        return manifest, folders, kind, base_dir
+
+    def _check_inside_root(self, path: Path):
+        if path != self.output_root and self.output_root not in path.parents:
+            raise HTTPError(403, f"output must stay inside {self.output_root}")
+
+    async def _build(self, url, body: bytes, writer) -> int:
+        manifest, folders, kind, base_dir = self._parse_spec(url, body)
+
+        self.metrics.queued += 1
+        async with self._slots:
+            self.metrics.queued -= 1
+            self.metrics.in_flight += 1
+            try:
+                if base_dir:
+                    return await self._build_to_disk(manifest, folders, base_dir, writer)
+                return await self._stream_archive(manifest, folders, kind, writer)
+            finally:
+                self.metrics.in_flight -= 1
+
+    def _count(self, mission) -> bool:
+        ok = mission.error is None
+        self.metrics.builds["ok" if ok else "failed"] += 1
+        return ok
+
+    async def _build_to_disk(self, manifest: dict, folders: list, base_dir: Path, writer) -> int:
+        def work():
+            mission = Controller(manifest, folders, base_dir=base_dir, preflight=False, quiet=True)
+            self._check_inside_root(mission.root)  # The project directory itself, not just output
+            mission.run_mission()
+            return mission
+
+        mission = await self._loop.run_in_executor(self._pool, work)
+        payload = {"project": mission.p_name, "root": str(mission.root), "error": mission.error,
+                   "phases": {k: round(v, 4) for k, v in mission.timings.items()}}
+        return await self._send_json(writer, 200 if self._count(mission) else 500, payload)
+
+    async def _stream_archive(self, manifest: dict, folders: list, kind: str, writer) -> int:
+        queue = asyncio.Queue(maxsize=STREAM_QUEUE)
+        pipe = _ChunkPipe(self._loop, queue)
+        stream = io.BufferedWriter(pipe, buffer_size=STREAM_CHUNK)
+        p_name = manifest["project name"]  # check_project_name(): safe as a header value and entry prefix
+        # Encoded before the build starts: a bad header must fail while an error response is still possible
+        head = self._head(200, {
+            "Content-Type": CONTENT_TYPES[kind],
+            "Content-Disposition": f'attachment; filename="{p_name}.{EXTENSIONS[kind]}"',
+            "Transfer-Encoding": "chunked",
+        })
+
+        def work():
+            try:
+                sink = archive_sink(stream, kind, prefix=p_name)
+                mission = Controller(manifest, folders, preflight=False, quiet=True, sink=sink)
+                if mission.run_mission():
+                    stream.flush()
+                return mission
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), self._loop).result()
+
+        future = self._loop.run_in_executor(self._pool, work)
+        chunk = await queue.get()
+        if chunk is None:
+            # Failed before the first byte: a proper error response is still possible
+            mission = await future
+            self._count(mission)
+            return await self._send_json(writer, 500, {"project": p_name, "error": mission.error})
+
+        writer.write(head)
+        try:
+            while chunk is not None:
+                writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+                self.metrics.bytes_sent += len(chunk)
+                await writer.drain()
+                chunk = await queue.get()
+        except (ConnectionError, OSError):
+            pipe.abandoned = True
+            while chunk is not None:  # Unblock the build thread, then let it fail
+                chunk = await queue.get()
+            self._count(await future)
+            raise
+
+        mission = await future
+        if self._count(mission):
+            writer.write(b"0\r\n\r\n")  # A missing terminator tells the client the archive is truncated
+            await writer.drain()
+        return 200 if mission.error is None else 500
@@ -0,0 +1,14 @@
+# Generated by create_app.engine.ui.banner -- do not edit.
+# python -m create_app.engine.ui.banner
+FONT = 'slant'
+
+BANNERS = {
+    'init-app': (
+        '    _       _ __                        ',
+        '   (_)___  (_) /_      ____ _____  ____ ',
+        '  / / __ \\/ / __/_____/ __ `/ __ \\/ __ \\',
+        ' / / / / / / /_/_____/ /_/ / /_/ / /_/ /',
+        '/_/_/ /_/_/\\__/      \\__,_/ .___/ .___/ ',
+        '                         /_/   /_/      ',
+    ),
+}
@@ -0,0 +1,66 @@
+"""
+BANNER CACHE (v1.0.0)
+FEATURE: Fixed Figlet strings (the app name) are pre-rendered into _banner.py, so
+the interactive UI starts without importing pyfiglet or parsing a font file.
+pyfiglet is only loaded for a title that is not in the table.
+Regenerate with: python -m create_app.engine.ui.banner (setup.py's build_py does it too,
+when pyfiglet is importable; isolated builds ship the checked-in table).
+"""
+import os
+from create_app.constants import APP_NAME
+
+FONT = "slant"
+
+# Every Figlet string the UI draws with a fixed text
+FIXED_TITLES = (APP_NAME,)
+
+_figlet = None
+
+
+def _render(text: str, font: str = FONT) -> tuple:
+    global _figlet
+    if _figlet is None or _figlet.font != font:
+        from pyfiglet import Figlet  # Slow: imports the package and parses the font
+        _figlet = Figlet(font=font)
+    return tuple(_figlet.renderText(text).splitlines())
+
+
+def banner_lines(text: str) -> tuple:
+    """Figlet lines for text: precomputed when possible, rendered (and kept) otherwise."""
+    from create_app.engine.ui._banner import BANNERS, FONT as BUILT_FONT
+    lines = BANNERS.get(text) if BUILT_FONT == FONT else None
+    if lines is None:
+        lines = BANNERS[text] = _render(text)
+    return lines
+
+
+def write_banner_module(path):
+    """Renders FIXED_TITLES with pyfiglet into a plain-data module."""
+    body = [
+        "# Generated by create_app.engine.ui.banner -- do not edit.",
+        "# python -m create_app.engine.ui.banner",
+        f"FONT = {FONT!r}",
+        "",
+        "BANNERS = {",
+    ]
+    for title in FIXED_TITLES:
+        body.append(f"    {title!r}: (")
+        body += [f"        {line!r}," for line in _render(title)]
+        body.append("    ),")
+    body.append("}")
+    os.makedirs(os.path.dirname(os.fspath(path)) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write("\n".join(body) + "\n")
+
+
+def build_banner_module(path) -> bool:
+    """Build step: regenerates path, or keeps the checked-in table when pyfiglet is not installed."""
+    try:
+        write_banner_module(path)
+    except ImportError:
+        return False  # pyfiglet is a runtime dependency, not a build requirement
+    return True
+
+
+if __name__ == "__main__":
+    write_banner_module(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_banner.py"))
@@ -0,0 +1,72 @@
+import os
+import re
+import shutil
+import sys
+
+# --- DIFFERENTIAL SCREEN RENDERER ---
+# Menus hand over whole frames (lists of lines). The first frame is a full redraw
+# from the top-left corner; after that only lines that differ from the previous
+# frame are rewritten in place (cursor move + line + erase-to-EOL). An arrow key
+# usually changes two lines. Resizes, wrapped lines and frames taller than the
+# terminal fall back to a full redraw.
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+RESET = "\033[0m"
+
+
+def visible_width(line: str) -> int:
+    return len(_ANSI.sub("", line))
+
+
+class Screen:
+    def __init__(self, stream=None):
+        self.stream = stream
+        self.frame = None   # Lines currently on screen; None forces a full redraw
+        self.size = None    # Terminal size the frame was drawn at
+        self.full_redraws = 0
+
+    @property
+    def out(self):
+        # Resolved per write: colorama (and tests) may swap sys.stdout
+        return self.stream or sys.stdout
+
+    def invalidate(self):
+        """Someone else wrote to the terminal: the next frame is drawn in full."""
+        self.frame = None
+
+    def _clear(self):
+        if os.name == "nt" and self.stream is None:
+            os.system("cls")
+        else:
+            self.out.write("\033[H\033[J")
+
+    @staticmethod
+    def _fits(lines: list, size) -> bool:
+        # One spare row for the cursor line; a wrapped line would shift every row below it
+        return len(lines) < size.lines and all(visible_width(line) < size.columns for line in lines)
+
+    def render(self, lines: list) -> int:
+        """Draws a frame and leaves the cursor on the row below it. Returns the number of lines written."""
+        size = shutil.get_terminal_size()
+        previous = self.frame
+
+        if previous is None or size != self.size or not self._fits(lines, size):
+            self._clear()
+            # Every line starts from a clean SGR state, so a line redrawn alone looks the same
+            self.out.write("".join(f"{RESET}{line}\n" for line in lines))
+            written = len(lines)
+            self.full_redraws += 1
+        else:
+            # ⚡ Only the rows that changed: cursor move + line + erase to end of line
+            changed = [row for row, line in enumerate(lines) if row >= len(previous) or previous[row] != line]
+            chunks = [f"\033[{row + 1};1H{RESET}{lines[row]}\033[K" for row in changed]
+            if len(lines) < len(previous):
+                chunks.append(f"\033[{len(lines) + 1};1H\033[J")  # Frame got shorter
+            chunks.append(f"\033[{len(lines) + 1};1H")
+            self.out.write("".join(chunks))
+            written = len(changed)
+
+        self.out.flush()
+        self.frame = list(lines)
+        self.size = size
+        return written
@@ -8,8 +8,10 @@ from colorama import Fore, Style
 from create_app.logger import logger
 
 class Spinner:
-    def __init__(self, message="Processing"):
+    def __init__(self, message="Processing", silent=False, status=None):
         self.message = message
+        self.silent = silent  # Log-only mode for batch/background builds
+        self.status = status  # Optional callable: progress of a concurrent phase, shown after the message
         self.spinner = itertools.cycle(["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"])
         self.running = False
         self.thread = None
@@ -20,14 +22,17 @@ class Spinner:
         logger.info(f"🌀 Spinner started: {self.message}")
         self.start_time = time.time()
         self.running = True
+        if self.silent:
+            return
         self.thread = threading.Thread(target=self.animate, daemon=True)
         self.thread.start()
 
     def animate(self):
         while self.running:
+            extra = f" {Fore.CYAN}· {self.status()}{Style.RESET_ALL}" if self.status else ""
             sys.stdout.write(
                 f"\r{Fore.CYAN}{next(self.spinner)}{Style.RESET_ALL} "
-                f"{Fore.WHITE}{Style.DIM}{self.message}...{Style.RESET_ALL}\033[K"
+                f"{Fore.WHITE}{Style.DIM}{self.message}...{Style.RESET_ALL}{extra}\033[K"
             )
             sys.stdout.flush()
             time.sleep(0.08)
@@ -43,6 +48,8 @@ class Spinner:
         # 🪵 Log the completion and duration to the file
         status = "SUCCESS" if success else "FAILED"
         logger.info(f"🌀 Spinner stopped: {self.message} | Status: {status} | Duration: {duration:.2f}s")
+        if self.silent:
+            return
         
         icon = f"{Fore.GREEN}✔{Style.RESET_ALL}" if success else f"{Fore.RED}✘{Style.RESET_ALL}"
         sys.stdout.write(f"\r{icon} {self.message} Done!\n")
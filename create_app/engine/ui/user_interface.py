@@ -2,8 +2,9 @@ import sys
 import os
 import readchar
 import time
-from pyfiglet import Figlet
 from create_app.engine.ui.ui_config import UIConfig
+from create_app.engine.ui.screen import Screen
+from create_app.engine.ui.banner import banner_lines
 
 class InitUI(UIConfig):
     """
@@ -15,14 +16,22 @@ class InitUI(UIConfig):
         self.version = version
         self.cfg = UIConfig 
         self.manifest = {}
-        # Pre-cache Figlet font for high-speed header rendering
-        self.fig = Figlet(font="slant")
+        self._banner = None  # Figlet lines, looked up once per session
+        self.screen = Screen()
 
     def _get_c(self, key):
         return self.cfg.C.get(key, self.cfg.C["primary"])
 
+    @property
+    def banner(self):
+        if self._banner is None:
+            # ⚡ Precomputed for the app name; pyfiglet only loads for a custom title
+            self._banner = [line.lower() for line in banner_lines(self.app_name)]
+        return self._banner
+
     def clear(self):
         """Cross-platform terminal clear."""
+        self.screen.invalidate()  # Whatever comes next is not the frame the screen remembers
         if os.name == 'nt':
             os.system('cls')
         else:
@@ -35,39 +44,45 @@ class InitUI(UIConfig):
         UIConfig.write(f"  {self.cfg.C['dim']}engine state preserved. no files were modified.\n")
         sys.exit(0)
 
-    def status_bar(self, steps):
-        """Standardized Breadcrumb Navigation."""
+    def _status_lines(self, steps):
+        if not steps:
+            return []
         formatted = []
         for i, s in enumerate(steps):
             color = self._get_c("success") if i < len(steps)-1 else self._get_c("accent")
             label = str(s).replace('_', ' ').title()
             formatted.append(f"{color}{label}")
         tag = f" {self.cfg.C['muted']} » ".join(formatted)
-        UIConfig.write(f"  {self.cfg.C['muted']}path: {tag}\n")
+        return [f"  {self.cfg.C['muted']}path: {tag}", ""]
 
-    def header(self, subtitle, color_key="primary"):
-        """High-performance header rendering with buffered output."""
-        self.clear()
+    def _header_lines(self, subtitle, color_key="primary"):
         c = self._get_c(color_key)
-        banner = self.fig.renderText(self.app_name).lower()
-        
-        output = []
-        for line in banner.splitlines():
-            output.append(f"  {c}{self.cfg.C['bold']}{line}")
-        
+        output = [f"  {c}{self.cfg.C['bold']}{line}" for line in self.banner]
         output.append(f"  {c}⚡ {subtitle.lower()} {self.cfg.C['dim']}│ {self.cfg.C['white']}v{self.version}")
-        UIConfig.write("\n".join(output) + "\n")
+        output.append("")
+        return output
+
+    def status_bar(self, steps):
+        """Standardized Breadcrumb Navigation."""
+        UIConfig.write("\n".join(self._status_lines(steps)))
+
+    def header(self, subtitle, color_key="primary"):
+        """Full-screen header for one-off screens (menus draw through self.screen)."""
+        self.clear()
+        UIConfig.write("\n".join(self._header_lines(subtitle, color_key)))
+
+    def _draw(self, subtitle, color_key, flow, body):
+        """One menu frame: header + breadcrumb + body, diffed against the last frame."""
+        self.screen.render(self._header_lines(subtitle, color_key) + self._status_lines(flow) + body)
 
     def menu(self, title, options, color_key="primary", sub_mapping=None, flow=None):
         """Standardized Selector: Returns (Base_Slug, Sub_Value)."""
         selected, sub_idx = 0, -1
         c = self._get_c(color_key)
+        self.screen.invalidate()
         
         while True:
             try:
-                self.header(title, color_key)
-                if flow: self.status_bar(flow)
-                
                 current_opt = options[selected].lower()
                 lookup_key = None
                 if sub_mapping:
@@ -88,7 +103,7 @@ class InitUI(UIConfig):
                     else:
                         output.append(f"    {self.cfg.C['white']}{label.ljust(25)}")
                 
-                UIConfig.write("\n".join(output))
+                self._draw(title, color_key, flow, output)
                 
                 key = readchar.readkey()
 
@@ -113,14 +128,11 @@ class InitUI(UIConfig):
         options = ["yes (recommended)", "no (skip setup)"]
         selected = 0
         c = self._get_c("primary")
+        self.screen.invalidate()
 
         while True:
             try:
-                self.header("environment", "primary")
-                if flow: self.status_bar(flow)
-                UIConfig.write(f"  {self.cfg.C['white']}create isolated virtual environment?\n")
-
-                output = []
+                output = [f"  {self.cfg.C['white']}create isolated virtual environment?", ""]
                 for i, opt in enumerate(options):
                     is_active = (i == selected)
                     if is_active:
@@ -128,7 +140,7 @@ class InitUI(UIConfig):
                     else:
                         output.append(f"    {self.cfg.C['white']}{opt.ljust(25)}")
                 
-                UIConfig.write("\n".join(output))
+                self._draw("environment", "primary", flow, output)
                 key = readchar.readkey()
 
                 if key == readchar.key.UP or key == readchar.key.DOWN:
@@ -153,12 +165,10 @@ class InitUI(UIConfig):
 
         selected, init_map, idx = set(), {}, 0
         master = filtered_list + ["---", "master init (force all)"]
+        self.screen.invalidate()
         
         while True:
             try:
-                self.header("nexus architect", "primary")
-                if flow: self.status_bar(flow)
-                
                 output = []
                 for i, item in enumerate(master):
                     if item == "---": 
@@ -177,8 +187,8 @@ class InitUI(UIConfig):
                         mark = f"{self.cfg.C['success']}•" if init_map.get(item) else " "
                         output.append(f"    {check_icon} {self.cfg.C['white']}{label.ljust(22)} {mark}")
                 
-                UIConfig.write("\n".join(output))
-                UIConfig.write(f"\n  {self.cfg.C['muted']}(Space) Toggle | (Arrows) Package Init | (Enter) Confirm")
+                output += ["", f"  {self.cfg.C['muted']}(Space) Toggle | (Arrows) Package Init | (Enter) Confirm"]
+                self._draw("nexus architect", "primary", flow, output)
                 
                 key = readchar.readkey()
                 if key == readchar.key.UP: idx = (idx - 1) % len(master)
@@ -207,12 +217,10 @@ class InitUI(UIConfig):
     def checklist(self, title, label, items, flow=None):
         """Standardized Checklist for Infra/Addons."""
         selected, idx = set(), 0
+        self.screen.invalidate()
         while True:
             try:
-                self.header(title, "primary")
-                if flow: self.status_bar(flow)
-                UIConfig.write(f"  {self.cfg.C['dim']}layer: {self.cfg.C['white']}{label.lower()}\n")
-                output = []
+                output = [f"  {self.cfg.C['dim']}layer: {self.cfg.C['white']}{label.lower()}", ""]
                 for i, item in enumerate(items):
                     is_active = (i == idx)
                     check = f"{self.cfg.C['success']}{self.cfg.SYMBOL_CHECKED}" if item in selected else f"{self.cfg.C['muted']}{self.cfg.SYMBOL_UNCHECKED}"
@@ -223,7 +231,7 @@ class InitUI(UIConfig):
                     else:
                         output.append(f"    {check} {self.cfg.C['white']}{display_name}")
                 
-                UIConfig.write("\n".join(output))
+                self._draw(title, "primary", flow, output)
                 key = readchar.readkey()
                 if key == readchar.key.UP: idx = (idx - 1) % len(items)
                 elif key == readchar.key.DOWN: idx = (idx + 1) % len(items)
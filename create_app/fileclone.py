@@ -0,0 +1,68 @@
+import os
+import shutil
+from pathlib import Path
+from create_app.logger import logger
+
+# --- CHEAP TREE CLONING ---
+# Hardlinks (shared inode) or reflinks (copy-on-write extents, Btrfs/XFS/APFS-style)
+# first, no data copied; plain copies when the filesystem refuses (cross-device
+# EXDEV, no link / clone support, permissions).
+LINK, REFLINK, COPY = "link", "reflink", "copy"
+CLONE_MODES = (LINK, REFLINK, COPY)
+
+# Linux ioctl: make dst share src's extents (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+
+def reflink(src: Path, dst: Path):
+    """Copy-on-write clone; raises OSError where the platform or filesystem can't (EXDEV, EOPNOTSUPP...)."""
+    try:
+        import fcntl
+    except ImportError:
+        raise OSError(0, "reflinks need fcntl (POSIX)")
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            target.close()
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def clone_file(src: Path, dst: Path, mode: str = LINK) -> str:
+    """Clones one file; returns the mode that actually worked (so callers can stop retrying links)."""
+    if mode == LINK:
+        try:
+            os.link(src, dst)
+            return LINK
+        except OSError as e:
+            logger.debug(f"🔗 Hardlink refused ({e.strerror}); copying instead: {src}")
+    elif mode == REFLINK:
+        try:
+            reflink(src, dst)
+            return REFLINK
+        except OSError as e:
+            logger.debug(f"🔗 Reflink refused ({e.strerror}); copying instead: {src}")
+    shutil.copy2(src, dst)
+    return COPY
+
+
+def clone_tree(src: Path, dst: Path, mode: str = LINK) -> str:
+    """
+    Mirrors `src` into `dst`: directories recreated, symlinks preserved as symlinks,
+    regular files hardlinked (or copied). Returns the mode used for the last file.
+    """
+    src, dst = Path(src), Path(dst)
+    for root, dirs, files in os.walk(src):
+        rel = Path(root).relative_to(src)
+        target_dir = dst / rel
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in dirs + files:
+            source = Path(root) / name
+            if source.is_symlink():
+                os.symlink(os.readlink(source), target_dir / name)
+            elif name in files:
+                mode = clone_file(source, target_dir / name, mode)
+    return mode
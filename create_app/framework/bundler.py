@@ -1,26 +1,46 @@
 import os
+from collections import ChainMap
 from pathlib import Path
+from types import MappingProxyType
 import create_app.constants as const 
 
 # 🟢 Centralized Logger Import
 from create_app.logger import logger
+from create_app.tracing import span
 
 from create_app.rules.global_rules import get_global_manifest
-from create_app.rules.standard_rules import STANDARD_BLUEPRINT
-from create_app.rules.production_rules import PROD_WEB_RULES
-from create_app.rules.django_rules import DJANGO_PATCH_RULES
-from create_app.rules.others_rules import OTHERS_RULES
+from create_app.rules.django_rules import get_django_manifest
+from create_app.rules.registry import blueprint_key, derive, lookup, DISPLAY_NAMES
+
+# ⚡ Process-wide constants layer (built once, shared read-only by every build context)
+_CONSTANTS_SNAPSHOT = None
+
+def constants_snapshot():
+    """Returns the read-only, non-dunder view of create_app.constants, computed once per process."""
+    global _CONSTANTS_SNAPSHOT
+    if _CONSTANTS_SNAPSHOT is None:
+        _CONSTANTS_SNAPSHOT = MappingProxyType({k: v for k, v in const.__dict__.items() if not k.startswith("__")})
+    return _CONSTANTS_SNAPSHOT
+
+def layered_context(ctx: dict) -> ChainMap:
+    """Per-project fields over the shared constants layer; writes land in ctx, nothing is copied."""
+    return ChainMap(ctx, constants_snapshot())
 
 class Bundler:
     """
-    SILENT LOGIC BUNDLER (v3.5.3)
+    SILENT LOGIC BUNDLER (v3.6.0)
     Resolves architecture, INJECTS constants, and POPULATES dependencies.
     FEATURE: Precise Django requirement resolution.
     FEATURE: Added Rich Libraries (WTForms, Flask-Mail, Mappers, and Schema tools).
+    FEATURE: Django project + app modules come from our own templates (no django-admin).
+    FEATURE: ctx is a ChainMap: the project's fields over one shared constants layer.
+    FIXED: Blueprints come from the frozen registry; per-build changes are copy-on-write
+    (the ui folder used to be appended to the shared rule table on every build).
     """
     def __init__(self, root: Path, ctx: dict):
         self.root = root  
-        self.ctx = ctx
+        # ⚡ 2. Constants are layered under the project's own fields, never copied into them
+        self.ctx = layered_context(ctx)
         
         # 1. Normalize Context keys
         self.fw_name = ctx.get('fw_name', ctx.get('framework', 'fastapi')).lower()
@@ -30,13 +50,10 @@ class Bundler:
         
         logger.info(f"🏗️ Bundler Init: FW={self.fw_name}, Strategy={self.strategy}, DRF={self.is_drf}")
         
-        # ⚡ 2. Inject Raw Constants
-        constants_dict = {k: v for k, v in const.__dict__.items() if not k.startswith("__")}
-        self.ctx.update(constants_dict)
-        
-        # ⚡ 3. Intelligent Context & Dependencies
-        self._inject_dynamic_defaults()
-        self._resolve_dependencies()
+        with span("bundler.init", "phase", framework=self.fw_name):
+            # ⚡ 3. Intelligent Context & Dependencies
+            self._inject_dynamic_defaults()
+            self._resolve_dependencies()
 
     def _resolve_dependencies(self):
         """Comprehensive Dependency Resolver - Injects Rich Professional Libraries."""
@@ -134,20 +151,17 @@ class Bundler:
         })
 
     def _get_architectural_blueprint(self):
-        """Resolves folder structure."""
-        if "django" in self.fw_name:
-            mode = "drf" if self.is_drf else "standard"
-            return DJANGO_PATCH_RULES.get(mode, DJANGO_PATCH_RULES["standard"])
-        elif self.fw_name in OTHERS_RULES:
-            return OTHERS_RULES.get(self.fw_name)
-        else:
-            lookup_map = {"fastapi": "FastAPI", "flask": "Flask", "bottle": "Bottle"}
-            lookup = lookup_map.get(self.fw_name, self.fw_name.capitalize())
-            source_dict = PROD_WEB_RULES if self.strategy in ["production", "auto_config"] else STANDARD_BLUEPRINT
-            return source_dict.get(lookup, source_dict.get("FastAPI"))
+        """Resolves folder structure: a frozen, shared registry record (derive() to change it)."""
+        fw, tier, drf = blueprint_key(self.fw_name, self.strategy, self.is_drf)
+        logger.debug(f"📐 Blueprint: {DISPLAY_NAMES.get(fw, fw)} / {tier}{' / drf' if drf else ''}")
+        return lookup(self.fw_name, self.strategy, self.is_drf)
 
     def execute(self):
         """Finalizes build data and forces correct template injection."""
+        with span("bundler.execute", "phase", framework=self.fw_name):
+            return self._execute()
+
+    def _execute(self):
         logger.info("🚀 Bundler Execution Started.")
         blueprint = self._get_architectural_blueprint()
         manifest = get_global_manifest(self.ctx)
@@ -158,9 +172,9 @@ class Bundler:
         self.ctx["ui_folder"] = ui_folder
 
         if self.fw_name in ["fastapi", "flask", "bottle"]:
-            if "folders" not in blueprint: blueprint["folders"] = []
             if ui_folder not in blueprint["folders"]:
-                blueprint["folders"].append(ui_folder)
+                # Copy-on-write: the registry record is shared by every build in the process
+                blueprint = derive(blueprint, folders=blueprint["folders"] + (ui_folder,))
 
         # Entry point normalization
         entry_found = False
@@ -188,6 +202,12 @@ class Bundler:
             for rule in ui_rules:
                 if rule["target"] not in existing: manifest.append(rule)
 
+        # Django Bootstrap (project package + one package per app, rendered in-process)
+        if "django" in self.fw_name:
+            packages, django_rules = get_django_manifest(self.ctx)
+            blueprint = derive(blueprint, packages=blueprint["packages"] + tuple(packages))
+            manifest += django_rules
+
         # Requirements
         manifest.append({"source": "common/requirements.txt.tpl", "target": "requirements.txt"})
 
@@ -0,0 +1,139 @@
+"""
+BUILD PLAN COMPILER (v1.0.0)
+Turns ctx + blueprint + manifest rules + infra selections into ONE
+target-keyed, deduplicated list of (source, target, mode) operations.
+The Generator executes this plan and nothing else.
+"""
+import os
+from create_app.initializer.templating import template_index
+from create_app.logger import logger
+
+# Operation modes, in the order the Generator understands them
+MKDIR, TOUCH, RENDER, COPY = "mkdir", "touch", "render", "copy"
+
+# Terminal-only templates that never land in the project tree
+TERMINAL_ONLY = ["work.txt", "venv.txt"]
+ENTRY_ALIASES = ["_main.py", "run.py", "entry.py"]
+
+
+class BuildPlan:
+    """Ordered, target-keyed operation list. First claim on a target wins."""
+    def __init__(self):
+        self._ops = {}
+        self._sources = set()
+        self.duplicates = 0  # Claims dropped because the target was already planned
+
+    def add(self, source, target: str, mode: str, context: dict = None) -> bool:
+        target = target.replace("\\", "/").strip("/")
+        if not target:
+            return False
+        existing = self._ops.get(target)
+        if existing:
+            self.duplicates += 1
+            if existing["source"] != source:
+                logger.debug(f"🔁 Plan dedup: {target} keeps {existing['source']} over {source}")
+            return False
+        self._ops[target] = {"source": source, "target": target, "mode": mode, "context": context}
+        self._sources.add(source)
+        return True
+
+    def has_source(self, source: str) -> bool:
+        return source in self._sources
+
+    def ops(self, mode: str = None) -> list:
+        return [op for op in self._ops.values() if mode is None or op["mode"] == mode]
+
+    def __iter__(self):
+        return iter(list(self._ops.values()))
+
+    def __len__(self):
+        return len(self._ops)
+
+    def __contains__(self, target):
+        return target in self._ops
+
+
+def _resolve_source(source: str, index: dict) -> str:
+    """Normalizes a rule source to its 'common/...' lookup name."""
+    source = source.replace("\\", "/")
+    if not source.startswith("common/") and not source.startswith("framework/"):
+        source = f"common/{source}"
+    # Bare page names (e.g. 'index.html.tpl') live under common/template/
+    if source not in index:
+        page = f"common/template/{os.path.basename(source)}"
+        if page in index:
+            return page
+    return source
+
+
+def compile_plan(ctx: dict, blueprint: dict, manifest_rules: list, infra_files: dict = None) -> BuildPlan:
+    """Compiles every build input into a single BuildPlan."""
+    plan = BuildPlan()
+    index = template_index()
+    blueprint = blueprint or {}
+    fw = str(ctx.get("framework", ctx.get("fw_name", "fastapi"))).lower()
+    app_name = ctx.get("app_name", "core_app")
+    ui_folder = ctx.get("ui_folder", "ui")
+
+    def blocked(target: str) -> bool:
+        # Guard for Django UI assets: Django uses app-specific folders, never generic 'ui/'
+        return fw == "django" and (target == "ui" or target.startswith("ui/"))
+
+    # --- 1. FOLDER & PACKAGE SCAFFOLDING ---
+    packages = tuple(blueprint.get("packages", ()))
+    for folder in tuple(blueprint.get("folders", ())) + packages:
+        if not folder or folder == "none" or blocked(folder.lower()):
+            continue
+        plan.add(None, folder, MKDIR)
+        if folder in packages:
+            plan.add(None, f"{folder}/__init__.py", TOUCH)
+
+    # --- 2. MANIFEST RULES (Bundler output) ---
+    for rule in manifest_rules or []:
+        target = rule["target"]
+        if any(x in target for x in TERMINAL_ONLY):
+            continue
+        if any(x in target for x in ENTRY_ALIASES):
+            target = "app.py"
+        if not blocked(target):
+            plan.add(_resolve_source(rule["source"], index), target, RENDER, rule.get("context"))
+
+    # --- 3. INFRASTRUCTURE SUITES ---
+    for suite, files in (infra_files or {}).items():
+        for filename in files or []:
+            base_file = os.path.basename(filename)
+            raw_name = base_file.replace(".tpl", "")
+            source = _resolve_source(base_file, index)
+            target = f".github/workflows/{raw_name}" if suite == "github" else f"{suite}/{raw_name}"
+            plan.add(source, target, RENDER)
+
+    # --- 4. HTML PAGES & STATIC ASSETS (skipped when a rule already renders the source) ---
+    page_root = f"{app_name}/templates" if fw == "django" else "ui"
+    static_root = f"{app_name}/static" if fw == "django" else f"{ui_folder}/static"
+
+    for source in index:
+        if source.startswith("common/template/"):
+            rel = source[len("common/template/"):]
+            if "/" in rel or not rel.endswith(".tpl") or plan.has_source(source):
+                continue
+            target = f"{page_root}/{rel.replace('.tpl', '')}"
+            if not blocked(target):
+                plan.add(source, target, RENDER)
+
+        elif source.startswith("common/static/"):
+            rel = source[len("common/static/"):]
+            if not rel.endswith(".tpl"):
+                plan.add(source, f"{static_root}/{rel}", COPY)
+                continue
+            if plan.has_source(source):
+                continue
+            clean_name = rel.replace(".tpl", "")
+            # Map 'scripts/' folder to 'js/' target folder
+            if clean_name.startswith("scripts"):
+                clean_name = clean_name.replace("scripts", "js", 1)
+            target = f"{static_root}/{clean_name}"
+            if not blocked(target):
+                plan.add(source, target, RENDER)
+
+    logger.info(f"🧭 Build plan compiled: {len(plan)} operations ({plan.duplicates} duplicates dropped).")
+    return plan
@@ -0,0 +1,102 @@
+"""
+SHARED ASSET STORE (v1.0.0)
+Content-addressed cache (<cache>/assets/<sha[:2]>/<sha256>) of the immutable static
+assets the planner COPYs verbatim (images, fonts, vendored CSS).
+FEATURE: --assets link|reflink|copy (or INIT_APP_ASSETS): link/reflink materialize
+each project file from the store without writing its data again; anything the
+filesystem refuses (EXDEV across devices, no clone support) falls back to a copy.
+Store blobs are read-only: a hardlinked asset shares its inode with every project
+that has it, so it must be replaced (new inode), never edited in place.
+"""
+import os
+import shutil
+import threading
+from pathlib import Path
+from create_app.cache import cache_dir
+from create_app.fileclone import CLONE_MODES, COPY, LINK, clone_file
+from create_app.initializer.templating import file_digest
+from create_app.logger import logger
+
+ASSETS_ENV_VAR = "INIT_APP_ASSETS"
+ASSET_MODES = CLONE_MODES  # link, reflink, copy
+
+
+def resolve_asset_mode(mode: str = None) -> str:
+    """--assets value, else INIT_APP_ASSETS, else plain copies."""
+    mode = (mode or os.environ.get(ASSETS_ENV_VAR) or COPY).lower()
+    if mode not in ASSET_MODES:
+        raise ValueError(f"Unknown asset mode '{mode}' (use {', '.join(ASSET_MODES)})")
+    return mode
+
+
+def detach(path: Path):
+    """Unlinks a hardlinked file before it is rewritten, so the store and other projects keep their bytes."""
+    try:
+        if path.lstat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class AssetStore:
+    def __init__(self, root: Path = None):
+        self._root = Path(root) if root else None
+        self._digests = {}  # (path, mtime_ns, size) -> sha256: each source is hashed once per process
+        self.stored_bytes = 0  # Data written into the store by this process (first sight of each blob)
+        self._ingest_lock = threading.Lock()  # Generator writer-pool threads share one store
+
+    @property
+    def root(self) -> Path:
+        if self._root is None:
+            self._root = cache_dir("assets")
+        return self._root
+
+    def digest(self, src: Path) -> str:
+        st = os.stat(src)
+        key = (str(src), st.st_mtime_ns, st.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = self._digests[key] = file_digest(src)
+        return digest
+
+    def ingest(self, src: Path) -> Path:
+        """The store blob for src's content, added on first sight (atomic: safe across builds and processes)."""
+        digest = self.digest(src)
+        blob = self.root / digest[:2] / digest
+        if not blob.exists():
+            with self._ingest_lock:
+                if not blob.exists():  # Another thread may have stored it meanwhile: count each blob once
+                    blob.parent.mkdir(parents=True, exist_ok=True)
+                    staging = blob.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                    shutil.copyfile(src, staging)
+                    os.chmod(staging, 0o444)
+                    os.replace(staging, blob)
+                    self.stored_bytes += os.stat(blob).st_size
+                    logger.debug(f"🗃️ Asset stored: {Path(src).name} -> {digest[:12]}")
+        return blob
+
+    def materialize(self, src: Path, dst: Path, mode: str) -> tuple:
+        """Places src's content at dst; returns (mode actually used, bytes of data written)."""
+        size = os.stat(src).st_size
+        detach(dst)
+        if mode == COPY:
+            shutil.copy2(src, dst)
+            return COPY, size
+        blob = self.ingest(src)
+        if dst.exists():
+            dst.unlink()
+        used = clone_file(blob, dst, mode)
+        if used != LINK:
+            shutil.copystat(src, dst)  # Reflinks / fallback copies are private: writable like a normal copy
+        return used, (0 if used != COPY else size)
+
+
+# ⚡ One store per process: digests and the blob directory are shared by every build
+_STORE = None
+
+
+def shared_store() -> AssetStore:
+    global _STORE
+    if _STORE is None:
+        _STORE = AssetStore()
+    return _STORE
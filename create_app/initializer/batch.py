@@ -0,0 +1,252 @@
+import json
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import create_app.constants as const
+from create_app.framework.bundler import constants_snapshot
+from create_app.initializer.controller import Controller
+from create_app.initializer.templating import get_environment
+from create_app.engine.prompts import BuildPrompts, domain_folders
+from create_app.engine.ui.ui_config import UIConfig
+from create_app.engine.ui.spinner import Spinner
+from docs.prerequisite import Prerequisite
+from create_app.logger import logger, listen, forward_to
+
+# ⚡ Per-process runner kept warm inside each pool worker
+_WORKER_RUNNER = None
+
+# A project name is one directory (and the archive entry prefix): no separators, no traversal
+PROJECT_NAME = re.compile(r"[A-Za-z0-9_.-]+")
+
+
+def load_specs(spec_path) -> list:
+    """
+    Reads a batch spec file (YAML or JSON).
+    Accepts either a bare list of projects or {"defaults": {...}, "projects": [...]}.
+    """
+    path = Path(spec_path)
+    raw = path.read_text(encoding="utf-8")
+
+    if path.suffix.lower() in [".yaml", ".yml"]:
+        try:
+            import yaml
+        except ImportError:
+            raise RuntimeError("YAML specs need PyYAML: pip install 'init-app[batch]' (or use a .json spec)")
+        data = yaml.safe_load(raw)
+    else:
+        data = json.loads(raw)
+
+    defaults = {}
+    if isinstance(data, dict):
+        defaults = data.get("defaults", {}) or {}
+        data = data.get("projects", [])
+
+    if not isinstance(data, list):
+        raise ValueError(f"Batch spec {path} must contain a list of projects.")
+
+    return [{**defaults, **spec} for spec in data]
+
+
+def check_project_name(name) -> str:
+    """Rejects project names that are paths ('../x', '/abs', 'a/b') or unsafe in headers and archives."""
+    name = str(name)
+    if not PROJECT_NAME.fullmatch(name) or name in (".", ".."):
+        raise ValueError(f"Invalid project name '{name}': use letters, digits, '_', '-' and '.' only.")
+    return name
+
+
+def normalize_spec(spec: dict, prompter: BuildPrompts, domain_folders: list):
+    """
+    Expands one spec into the (manifest, folders) pair the headless CLI builds.
+    Missing keys fall back to the same defaults as the headless CLI.
+    """
+    bp_raw = str(spec.get("core blueprint", ""))
+    fw_slug = str(spec.get("fw_name") or spec.get("framework") or bp_raw.split(" (")[0] or "fastapi").lower()
+    strategy = str(spec.get("build strategy", "standard")).lower()
+    p_name = spec.get("project name") or spec.get("name")
+    if not p_name:
+        raise ValueError(f"Batch spec is missing 'project name': {spec}")
+    p_name = check_project_name(p_name)
+
+    folders = spec.get("folders")
+    if not folders:
+        folders = prompter.get_smart_folders(fw_slug, strategy, domain_folders)
+
+    infra_files = {k: list(v) for k, v in (spec.get("infra_files") or {}).items() if v}
+    venv_enabled = spec.get("venv_enabled", True)
+
+    manifest = {
+        "infra_suites": list(spec.get("infra_suites") or infra_files.keys()),
+        "infra_files": infra_files,
+        "init_strategy": spec.get("init_strategy") or {f: True for f in folders},
+        "is_drf": bool(spec.get("is_drf", False)),
+        "apps": "none",
+        "database": spec.get("database") or "sqlite",
+    }
+    manifest.update({k: v for k, v in spec.items() if k not in ["folders", "name"]})
+    manifest.update({
+        "project name": p_name,
+        "core blueprint": bp_raw or f"{fw_slug} (default)",
+        "fw_name": fw_slug,
+        "build strategy": strategy,
+        "environment": "venv" if venv_enabled not in [False, "no", "n"] else "no venv",
+        "venv_enabled": venv_enabled,
+    })
+    return manifest, list(folders)
+
+
+class BatchRunner:
+    """
+    FLEET ORCHESTRATOR (v1.0.0)
+    Generates many projects from one spec list inside a single warm process.
+    FEATURE: One prerequisite check, one constants snapshot and one Jinja
+    environment shared by every Controller in the batch.
+    FEATURE: --jobs N fans projects out to a process pool of warm workers.
+    """
+    def __init__(self, specs: list, base_dir: Path = None, jobs: int = 1, io_workers: int = 1):
+        self.specs = specs
+        self.base_dir = Path(base_dir or Path.cwd()).resolve()
+        self.jobs = jobs if jobs and jobs > 0 else (os.cpu_count() or 1)
+        self.io_workers = io_workers  # Writer threads per project (Generator)
+        self.elapsed = 0.0
+        self.prompter = BuildPrompts(None, const)
+        self.domain_folders = domain_folders(const)
+
+    def _warm_up(self):
+        """Pays the per-process costs exactly once for the whole fleet."""
+        with Spinner("Verifying system requirements"):
+            check = Prerequisite.check_system()
+
+        if not check["status"]:
+            logger.error(f"❌ Prerequisites failed: {check.get('errors')}")
+            sys.exit(1)
+
+        self._warm_templates()
+
+    @staticmethod
+    def _warm_templates():
+        """Builds the shared constants snapshot and both Jinja environments."""
+        constants_snapshot()
+        get_environment("generator")
+        get_environment("terminal")
+
+    def _build_one(self, spec: dict) -> dict:
+        """Runs a single project through a quiet Controller and times it."""
+        started = time.perf_counter()
+        result = {"project": spec.get("project name") or spec.get("name"), "status": "failed", "error": None}
+        try:
+            manifest, folders = normalize_spec(spec, self.prompter, self.domain_folders)
+            result.update({"framework": manifest["fw_name"], "strategy": manifest["build strategy"]})
+            mission = Controller(manifest, folders, base_dir=self.base_dir, preflight=False, quiet=True,
+                                 io_workers=self.io_workers)
+            ok = mission.run_mission()
+            result["status"] = "ok" if ok else "failed"
+            result["error"] = mission.error
+            result["phases"] = dict(mission.timings)
+        except Exception as e:
+            logger.error(f"🔥 Batch spec failed: {str(e)}", exc_info=True)
+            result["error"] = str(e)
+        result["seconds"] = time.perf_counter() - started
+        return result
+
+    def run(self) -> list:
+        """Builds every spec in order and returns one result dict per project."""
+        logger.info(f"🚚 Batch started: {len(self.specs)} projects -> {self.base_dir}")
+        started = time.perf_counter()
+        self._warm_up()
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.jobs > 1 and len(self.specs) > 1:
+            results = self._run_parallel()
+        else:
+            with Spinner(f"Generating {len(self.specs)} projects"):
+                results = [self._build_one(spec) for spec in self.specs]
+
+        self.elapsed = time.perf_counter() - started
+        failed = sum(1 for r in results if r["status"] != "ok")
+        logger.info(f"🏁 Batch complete: {len(results) - failed} ok, {failed} failed.")
+        return results
+
+    def plan_all(self) -> list:
+        """Dry-runs every spec: one JSON-ready plan (or error) per project, nothing written."""
+        plans = []
+        for spec in self.specs:
+            try:
+                manifest, folders = normalize_spec(spec, self.prompter, self.domain_folders)
+                mission = Controller(manifest, folders, base_dir=self.base_dir, preflight=False, quiet=True)
+                plans.append(mission.dry_run())
+            except Exception as e:
+                plans.append({"project": spec.get("project name") or spec.get("name"), "error": str(e)})
+        return plans
+
+    def _run_parallel(self) -> list:
+        """Distributes specs across worker processes; results keep spec order."""
+        workers = min(self.jobs, len(self.specs))
+        results = []
+        # Workers ship their records to this process: one run log, no file contention
+        log_queue = multiprocessing.Queue()
+        listener = listen(log_queue)
+        try:
+            with Spinner(f"Generating {len(self.specs)} projects on {workers} workers"):
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(str(self.base_dir), log_queue, logger.level, self.io_workers)) as pool:
+                    futures = [pool.submit(_build_in_worker, spec) for spec in self.specs]
+                    for spec, future in zip(self.specs, futures):
+                        try:
+                            results.append(future.result())
+                        except Exception as e:
+                            # Worker crashed (not a build failure): record and keep collecting
+                            logger.error(f"🔥 Batch worker failed: {str(e)}")
+                            results.append({"project": spec.get("project name") or spec.get("name"),
+                                            "status": "failed", "error": str(e), "seconds": 0.0})
+        finally:
+            listener.stop()  # Also on Ctrl+C / pool failure: no leaked thread, queued records flushed
+        return results
+
+    @staticmethod
+    def report(results: list, elapsed: float = None):
+        """Prints the per-project summary table with timings."""
+        c = UIConfig.C
+        total = elapsed if elapsed is not None else sum(r.get("seconds", 0) for r in results)
+        lines = [
+            f"\n  {c['muted']}{'PROJECT'.ljust(24)} {'ENGINE'.ljust(10)} {'MODE'.ljust(12)} {'STATUS'.ljust(7)} {'TIME'.rjust(8)}"
+        ]
+        for r in results:
+            color = c["success"] if r["status"] == "ok" else c["accent"]
+            lines.append(
+                f"  {c['white']}{str(r['project'])[:24].ljust(24)} {str(r.get('framework', '-'))[:10].ljust(10)} "
+                f"{str(r.get('strategy', '-'))[:12].ljust(12)} {color}{r['status'].ljust(7)} "
+                f"{c['white']}{r.get('seconds', 0):7.2f}s"
+            )
+            if r.get("phases"):
+                phases = " · ".join(f"{k} {v:.2f}s" for k, v in r["phases"].items())
+                lines.append(f"    {c['dim']}↳ {phases}")
+            if r.get("error"):
+                lines.append(f"    {c['dim']}↳ {str(r['error']).lower()}")
+
+        ok = sum(1 for r in results if r["status"] == "ok")
+        lines.append(f"\n  {c['success']}✔ {c['white']}{ok}/{len(results)} projects built in {total:.2f}s")
+        UIConfig.write("\n".join(lines))
+
+
+def _init_worker(base_dir: str, log_queue=None, log_level: int = None, io_workers: int = 1):
+    """Pool initializer: builds one warm runner per worker process."""
+    global _WORKER_RUNNER
+    if log_queue is not None:
+        forward_to(log_queue)
+    if log_level is not None:
+        logger.setLevel(log_level)
+    _WORKER_RUNNER = BatchRunner([], base_dir=Path(base_dir), io_workers=io_workers)
+    BatchRunner._warm_templates()
+
+
+def _build_in_worker(spec: dict) -> dict:
+    """Pool task: builds one spec with the worker's warm runner."""
+    result = _WORKER_RUNNER._build_one(spec)
+    result["worker"] = os.getpid()
+    return result
@@ -1,10 +1,8 @@
 import os
 import sys
-import subprocess
-import shutil
-import re
+import time
+from contextlib import contextmanager
 from pathlib import Path
-import jinja2
 
 # --- AGGRESSIVE PATH RESOLUTION ---
 ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -12,12 +10,21 @@ if ROOT_DIR not in sys.path:
     sys.path.insert(0, ROOT_DIR)
 
 from create_app.framework.bundler import Bundler
+from create_app.framework.planner import compile_plan
 from create_app.engine.ui.ui_config import UIConfig 
 from create_app.initializer.generator import Generator
+from create_app.initializer.sinks import DiskSink
+from create_app.initializer.asset_store import resolve_asset_mode
+from create_app.initializer.settings_patcher import APPLIED, patch_settings
+from create_app.rules.registry import lookup as lookup_blueprint
+from create_app.initializer.venv_manager import VenvManager
+from create_app.initializer.wheelhouse import resolve_wheelhouse
+from create_app.initializer.templating import COMMON_DIR, get_environment, render_layered
 import create_app.constants as const 
 from create_app.engine.ui.spinner import Spinner 
 from docs.prerequisite import Prerequisite
 from create_app.logger import logger
+from create_app.tracing import span
 
 class Controller:
     """
@@ -25,9 +32,27 @@ class Controller:
     Orchestrator for System Checks, Django Injection, and Architecture Generation.
     FEATURE: Renders and displays work.txt.tpl and venv.txt.tpl directly to terminal.
     FIXED: Conditional DRF injection and clean app_name appending for normal Django.
+    FEATURE: Re-runs are incremental; the venv is skipped when already in place.
+    FEATURE: venv + pip run on a background thread, overlapping bundling and rendering.
+    FEATURE: Repeat dependency sets clone a cached venv template instead of rebuilding.
+    FEATURE: Offline wheelhouse installs, with missing wheels reported before pip runs.
+    FEATURE: Django project and apps render in-process with patched settings (no startproject/startapp).
+    FEATURE: A user-edited settings.py is kept and patched structurally (SettingsPatcher) instead.
+    FEATURE: Pluggable output sink; memory / archive builds never touch the project directory.
+    FEATURE: Static assets copied, hardlinked or reflinked from a shared content-addressed store.
     """
-    def __init__(self, manifest: dict, folders: list): 
+    def __init__(self, manifest: dict, folders: list, base_dir: Path = None, preflight: bool = True,
+                 quiet: bool = False, force: bool = False, wheelhouse=None, sink=None, assets: str = None,
+                 io_workers: int = 1): 
         self.manifest = manifest
+        self.preflight = preflight  # Batch runs validate the system once up front
+        self.quiet = quiet          # Suppress spinners and terminal instructions
+        self.error = None
+        self.plan = None            # Compiled BuildPlan, set by run_mission
+        self.timings = {}           # Phase name -> seconds, filled by run_mission
+        self.venv = None            # Background VenvManager, started by run_mission
+        self.patch_report = {}      # Settings patch name -> status, for kept Django settings
+        self.wheelhouse = resolve_wheelhouse(wheelhouse)  # Offline installs (--wheelhouse / INIT_APP_WHEELHOUSE)
         self.p_name = manifest.get("project name", "new_project")
         
         # Resolve Framework and Strategy
@@ -48,13 +73,19 @@ class Controller:
             }
             self.manifest["init_strategy"] = {f: True for f in folders}
 
-        self.root = Path.cwd().resolve() / self.p_name
+        # Django apps collected by the prompts ("blog, shop" or "none"); the first one is the primary app
+        apps = [a.strip() for a in str(manifest.get("apps", "none")).split(",")]
+        apps = [a for a in apps if a and a.lower() != "none"]
+        app_name = manifest.get("app_name") or (apps[0] if apps else "core_app")
+
+        self.root = Path(base_dir or Path.cwd()).resolve() / self.p_name
         self.colors = UIConfig.C
         
         # DNA of the build
         self.ctx = {
             "project_name": self.p_name,
-            "app_name": manifest.get("app_name", "core_app"),
+            "app_name": app_name,
+            "django_apps": [app_name] + [a for a in apps if a != app_name] if self.fw == "django" else [],
             "framework": self.fw,
             "build_strategy": self.strategy,
             "is_drf": self.is_drf,
@@ -65,164 +96,182 @@ class Controller:
 
         logger.info(f"🚀 Controller linked for mission: {self.p_name}")
         self.executor = Bundler(self.root, self.ctx)
-        self.worker = Generator(self.root, self.executor.ctx)
+        self.sink = sink or DiskSink(self.root, assets=resolve_asset_mode(assets))  # --assets / INIT_APP_ASSETS
+        self.worker = Generator(self.root, self.executor.ctx, force=force, sink=self.sink, io_workers=io_workers)
         
-        # ⚡ Template Engine for Terminal Output
-        self.tpl_path = Path(ROOT_DIR) / "create_app" / "common"
-        self.jinja_env = jinja2.Environment(loader=jinja2.FileSystemLoader(str(self.tpl_path)))
+        # ⚡ Template Engine for Terminal Output (shared, warm per process)
+        self.tpl_path = COMMON_DIR
+        self.jinja_env = get_environment("terminal")
 
     def _run_prerequisites(self):
         """Validates system tools before starting the build."""
-        with Spinner("Verifying system requirements"):
+        with Spinner("Verifying system requirements", silent=self.quiet):
             check = Prerequisite.check_system()
         
         if not check["status"]:
             logger.error(f"❌ Prerequisites failed: {check.get('errors')}")
             sys.exit(1)
 
-    def _setup_virtual_env(self):
-        """Creates a virtual environment only if requested."""
+    def _venv_requested(self) -> bool:
         raw_val = self.manifest.get("venv_enabled", self.manifest.get("venv", True))
-        
-        if raw_val in [False, "no", "n", "false", "skip"]:
+        return raw_val not in [False, "no", "n", "false", "skip"]
+
+    def _start_virtual_env(self):
+        """Kicks off venv creation in the background, only if requested."""
+        if not self._venv_requested() or not self.sink.on_disk:
             logger.info("🚫 VENV setup skipped.")
             return
+        # Bundler resolves dependencies at construction: the template lookup / pip can start right away
+        deps = self.executor.ctx.get("dependencies", "").split()
+        if self.wheelhouse:
+            missing = self.wheelhouse.missing(deps)
+            if missing:
+                # Reported before anything is installed, never halfway through pip
+                logger.error(f"❌ Wheelhouse {self.wheelhouse.path} is missing: {', '.join(missing)}")
+                if not self.quiet:
+                    print(f"\n  {self.colors['accent']}✖ {self.colors['white']}venv skipped, wheelhouse is missing "
+                          f"{len(missing)} wheel(s): {', '.join(missing[:8])}{' ...' if len(missing) > 8 else ''}")
+                return
+        self.venv = VenvManager(self.root / "venv", wheelhouse=self.wheelhouse).start()
+        self.venv.install(deps)
 
-        venv_path = self.root / "venv"
-        req_file = self.root / "requirements.txt"
-
-        try:
-            with Spinner("Setting up virtual environment"):
-                subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True, capture_output=True)
-            
-            if req_file.exists():
-                with Spinner("Installing dependencies (pip)"):
-                    pip_exe = venv_path / ("Scripts" if os.name == "nt" else "bin") / "pip"
-                    subprocess.run([str(pip_exe), "install", "--upgrade", "pip"], capture_output=True)
-                    subprocess.run([str(pip_exe), "install", "-r", str(req_file)], check=True, capture_output=True)
-                logger.info("✅ Dependencies installed.")
-        except Exception as e:
-            logger.error(f"⚠️ VENV warning: {str(e)}")
+    def _finish_virtual_env(self):
+        """Waits for the background venv (creation + pip) to complete."""
+        if not self.venv:
+            return
+        with Spinner("Finishing virtual environment", silent=self.quiet, status=self.venv.status):
+            self.venv.wait()
+        self.timings.update(self.venv.durations)
 
-    def _handle_django_logic(self):
-        """Native Django bootstrapping with Dynamic Snippet Injection."""
-        app_name = self.ctx.get("app_name", "core_app")
-        tpl_dir = self.tpl_path
-        
-        with Spinner(f"Injected Django architecture"):
-            # 1. Standard Bootstrap
-            subprocess.run([sys.executable, "-m", "django", "startproject", self.p_name, "."], 
-                           cwd=self.root, check=True, capture_output=True)
-            subprocess.run([sys.executable, "manage.py", "startapp", app_name], 
-                           cwd=self.root, check=True, capture_output=True)
-
-            settings_path = self.root / self.p_name / "settings.py"
-            if settings_path.exists():
-                content = settings_path.read_text(encoding="utf-8")
-                
-                # --- A. SECRET KEY & HOSTS ---
-                if (tpl_dir / "secret.tpl").exists():
-                    secret_patch = (tpl_dir / "secret.tpl").read_text()
-                    pattern = r"SECRET_KEY = .*?ALLOWED_HOSTS = \[\]"
-                    content = re.sub(pattern, secret_patch, content, flags=re.DOTALL)
-                
-                # --- B. INSTALLED_APPS INJECTION ---
-                if self.is_drf:
-                    # Case 1: Django REST Framework selected - Inject from apps.py.tpl
-                    apps_tpl = tpl_dir / "apps.py.tpl"
-                    if apps_tpl.exists():
-                        apps_list_raw = apps_tpl.read_text().replace('{{app_name}}', app_name).strip()
-                        pattern = r"(INSTALLED_APPS = \[.*?)(^])"
-                        content = re.sub(pattern, rf"\1    {apps_list_raw},\n\2", content, flags=re.DOTALL | re.MULTILINE)
-                else:
-                    # Case 2: Normal Django - Just add the app name at the end of the list
-                    pattern = r"(INSTALLED_APPS = \[.*?)(^])"
-                    content = re.sub(pattern, rf"\1    '{app_name}',\n\2", content, flags=re.DOTALL | re.MULTILINE)
-
-                # --- C. REST_FRAMEWORK CONFIG (DRF ONLY) ---
-                if self.is_drf:
-                    rf_tpl = tpl_dir / "rf.py.tpl"
-                    if rf_tpl.exists() and "REST_FRAMEWORK =" not in content:
-                        rf_config = rf_tpl.read_text().strip()
-                        content += f"\n\n{rf_config}\n"
-
-                # --- D. UTILITY IMPORTS ---
-                if "import os" not in content:
-                    content = content.replace("from pathlib import Path", "from pathlib import Path\nimport os")
-                
-                settings_path.write_text(content, encoding="utf-8")
-                logger.info(f"✅ Django settings.py patched. Mode: {'DRF' if self.is_drf else 'Standard'}")
+    def _patch_kept_settings(self):
+        """A kept (user-edited) settings.py still receives new apps / DRF config, merged in place."""
+        target = f"{self.p_name}/settings.py"
+        if target not in self.worker.conflicts:
+            return
+        rules = lookup_blueprint("django", is_drf=self.is_drf)
+        self.patch_report = patch_settings(self.root / target, rules.get("patches", []), self.worker.ctx)
 
     def _display_tpl(self, tpl_name: str):
         """Renders a specific template directly to terminal output."""
         try:
             template = self.jinja_env.get_template(tpl_name)
-            output = template.render(self.executor.ctx)
+            output = render_layered(template, self.executor.ctx)
             print(f"{self.colors['white']}{output}")
         except Exception as e:
             logger.debug(f"Terminal render skipped for {tpl_name}: {e}")
 
     def _render_instructions(self):
         """Displays final summary by populating templates directly."""
+        if self.quiet:
+            return
         print("\n" + "—"*50)
         self._display_tpl("venv.txt.tpl")
         self._display_tpl("work.txt.tpl")
         print("—"*50 + "\n")
 
+    def _compile(self):
+        """Bundler execution + plan compilation (no disk access)."""
+        build_data = self.executor.execute()
+        self.worker.ctx = build_data.get('ctx', self.ctx)
+        with span("plan.compile", "phase"):
+            self.plan = compile_plan(
+                self.worker.ctx,
+                build_data.get('blueprint'),
+                build_data.get('manifest', []),
+                self.manifest.get("infra_files", {})
+            )
+        return self.plan
+
+    def dry_run(self) -> dict:
+        """
+        PLAN-ONLY MODE: Resolves everything a build would do and returns it as data.
+        Nothing is written, no subprocess is spawned.
+        """
+        plan = self._compile()
+        deps = self.worker.ctx.get("dependencies", "")
+        return {
+            "project": self.p_name,
+            "root": str(self.root),
+            "framework": self.fw,
+            "strategy": self.strategy,
+            "is_drf": bool(self.is_drf),
+            "directories": [op["target"] for op in plan.ops("mkdir")],
+            "packages": [op["target"] for op in plan.ops("touch")],
+            "files": [
+                {"target": op["target"], "source": op["source"], "mode": op["mode"]}
+                for op in plan if op["mode"] in ["render", "copy"]
+            ],
+            "dependencies": [d for d in deps.splitlines() if d],
+            "venv": self._venv_requested() and self.sink.on_disk,
+            "wheelhouse": {"path": str(self.wheelhouse.path), "missing": self.wheelhouse.missing(deps.split())}
+                          if self.wheelhouse else None,
+            "django_apps": self.worker.ctx.get("django_apps", []),
+        }
+
+    @contextmanager
+    def _phase(self, name: str):
+        """Records the wall time of one mission phase into self.timings."""
+        started = time.perf_counter()
+        try:
+            with span(name, "phase", project=self.p_name):
+                yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + (time.perf_counter() - started)
+
     def run_mission(self):
         """Master Build Sequence Orchestrator."""
+        with span(f"mission:{self.p_name}", "mission", framework=self.fw, strategy=self.strategy):
+            return self._run_mission()
+
+    def _run_mission(self):
         try:
-            self._run_prerequisites()
-            self.root.mkdir(parents=True, exist_ok=True)
-            
-            if self.fw == "django": 
-                self._handle_django_logic()
-            
-            # 3. Execution & Generation
-            build_data = self.executor.execute()
-            self.worker.ctx = build_data.get('ctx', self.ctx) 
+            if self.preflight:
+                with self._phase("prerequisites"):
+                    self._run_prerequisites()
+            if self.sink.on_disk:
+                self.root.mkdir(parents=True, exist_ok=True)
+
+            # ⚡ venv creation overlaps bundling and rendering
+            self._start_virtual_env()
+            status = self.venv.status if self.venv else None
             
-            with Spinner("Generating project architecture"):
-                final_manifest = []
-                for rule in build_data.get('manifest', []):
-                    if any(x in rule["target"] for x in ["work.txt", "venv.txt"]):
-                        continue
-
-                    if any(x in rule["target"] for x in ["_main.py", "run.py", "entry.py"]):
-                        rule["target"] = "app.py"
-                    
-                    if not rule["source"].startswith("common/") and not rule["source"].startswith("framework/"):
-                        rule["source"] = f"common/{rule['source']}"
-                        
-                    final_manifest.append(rule)
-
-                # --- INFRASTRUCTURE & UI INJECTION ---
-                infra_map = self.manifest.get("infra_files", {})
-                for suite, files in infra_map.items():
-                    if not files: continue
-                    for filename in files:
-                        base_file = os.path.basename(filename)
-                        raw_name = base_file.replace('.tpl', '')
-                        src_path = f"common/template/{base_file}" if raw_name == "index.html" else f"common/{base_file}"
-                        target = f".github/workflows/{raw_name}" if suite == "github" else f"{suite}/{raw_name}"
-                        final_manifest.append({"source": src_path, "target": target})
-                
-                self.worker.run(blueprint=build_data.get('blueprint'), manifest_rules=final_manifest)
+            # 3. Execution & Plan Compilation
+            with self._phase("bundle"):
+                self._compile()
             
-            # 4. Environment Setup
-            self._setup_virtual_env()
+            with self._phase("generate"), Spinner("Generating project architecture", silent=self.quiet, status=status):
+                self.worker.run(self.plan)
+                self.sink.close()
+                if self.fw == "django":
+                    with span("django.settings_patch", "phase"):
+                        self._patch_kept_settings()
+
+            if self.worker.conflicts and not self.quiet:
+                print(f"\n  {self.colors['accent']}✋ {self.colors['white']}kept {len(self.worker.conflicts)} edited "
+                      f"file(s); re-run with --force to overwrite:")
+                for target in self.worker.conflicts:
+                    print(f"    {self.colors['dim']}↳ {target}")
+                applied = [name for name, status in self.patch_report.items() if status == APPLIED]
+                if applied:
+                    print(f"  {self.colors['accent']}💉 {self.colors['white']}settings.py kept, merged: {', '.join(applied)}")
             
-            if self.fw == "django":
-                ui_dir = self.root / "ui"
-                if ui_dir.exists(): 
-                    shutil.rmtree(ui_dir)
+            # 4. Environment Setup (only the part not hidden behind rendering)
+            with self._phase("venv"):
+                self._finish_virtual_env()
             
             # ⚡ 6. FINAL TERMINAL OUTPUT
             self._render_instructions()
+            return True
 
         except Exception as e:
+            if self.venv:
+                self.venv.cancel()
+                self.venv.wait()
+            self.error = str(e)
             logger.error(f"🔥 Controller Failure: {str(e)}", exc_info=True)
-            print(f"\n  {self.colors['accent']}✖ {self.colors['white']}failure: {str(e).lower()}")
+            if not self.quiet:
+                print(f"\n  {self.colors['accent']}✖ {self.colors['white']}failure: {str(e).lower()}")
+            return False
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
@@ -1,157 +1,264 @@
+import hashlib
 import os
-import shutil
+from collections import ChainMap, Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader
 from create_app.logger import logger
+from create_app.tracing import span
+from create_app.initializer.templating import BASE_DIR, file_digest, generate_layered, get_environment
+from create_app.initializer.lockfile import LockFile, NEW, UNCHANGED, EDITED, UNTRACKED
+from create_app.initializer.sinks import DiskSink
+from create_app.framework.planner import BuildPlan, MKDIR, TOUCH, RENDER, COPY
+
+# Rendered output is handed to the sink this many template output nodes at a time
+CHUNK_PARTS = 4096
 
 class Generator:
     """
-    PHYSICAL EXECUTION ENGINE (v3.5.6)
+    PHYSICAL EXECUTION ENGINE (v4.1.0)
     FIXED: Explicit HTML template rendering and unified path resolution for common assets.
-    FEATURE: Automatic Django-specific path mapping for Templates and Static files.
+    FEATURE: Executes a compiled BuildPlan; every file is rendered and written once.
+    FEATURE: Incremental re-runs via .init-app.lock; user-edited files are never overwritten without force.
+    FEATURE: Writes go through an output sink (disk, memory, tar.gz, zip); only disk builds are lock-tracked.
+    FEATURE: io_workers > 1 renders on this thread while a bounded pool of writer threads does the
+    disk I/O; results are settled in plan order, so stats, lock and fallbacks stay deterministic.
+    FEATURE: Templates stream into the sink CHUNK_PARTS output nodes at a time; size, sha256 and the
+    empty-output check run per chunk, so peak memory per file no longer grows with the file. Pooled
+    writes and untracked files (adoption compares digests first) still render the whole file first.
     """
-    def __init__(self, root: Path, ctx: dict):
+    def __init__(self, root: Path, ctx: dict, force: bool = False, sink=None, io_workers: int = 1):
         self.root = root
         self.ctx = ctx
+        self.force = force  # Overwrite files the user edited since the last run
+        self.sink = sink or DiskSink(root)
+        self.io_workers = max(1, int(io_workers or 1))
+        self._pool = None
+        self._pending = deque()  # (future, done, fail) in plan order
         self.fw = str(ctx.get("framework", "fastapi")).lower()
         self.is_drf = ctx.get("is_drf", False)
         self.app_name = ctx.get("app_name", "core_app")
-        
+
         # 1. Resolve Base Directory (points to 'create_app' folder)
-        self.base_dir = Path(__file__).parent.parent.resolve()
-        
-        # 2. Setup Jinja Search Paths
-        search_paths = [
-            str(self.base_dir),
-            str(self.base_dir / "common" / "template"),
-            str(self.base_dir / "framework" / "templates")
-        ]
-        
-        valid_paths = [p for p in search_paths if Path(p).exists()]
-        
+        self.base_dir = BASE_DIR
+
         logger.info(f"⚙️ Generator Engine Linked: Root={self.root}")
-        
-        self.env = Environment(
-            loader=FileSystemLoader(valid_paths),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-
-    def _render_and_write(self, tpl_path: str, output_rel_path: str):
-        """Renders a Jinja2 template and writes it to the target path."""
+
+        # 2. Write accounting (target -> writes, and totals per operation kind)
+        self.writes = Counter()
+        self.stats = Counter()
+        self.lock = None
+        self.conflicts = []  # Targets kept as-is because the user edited them
+
+    @property
+    def env(self):
+        """Shared Jinja Environment (warm across Controllers; untouched by dry runs)."""
+        return get_environment("generator")
+
+    @staticmethod
+    def _encode(text: str) -> bytes:
+        """Text-mode equivalent bytes (platform newlines), so the lock hashes what lands on disk."""
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        return text.encode("utf-8")
+
+    def _stream(self, tpl_path: str, template, ctx, meter: dict):
+        """Encoded output chunks; meter gets the running byte count, sha256 and whether anything non-blank came out."""
+        for text in generate_layered(template, ctx, CHUNK_PARTS):
+            yield self._metered(text, meter)
+        if not meter["content"]:
+            logger.warning(f"⚠️ Template {tpl_path} rendered as empty. Check context variables.")
+
+    def _metered(self, text: str, meter: dict) -> bytes:
+        if not meter["content"] and text and not text.isspace():
+            meter["content"] = True
+        data = self._encode(text)
+        meter["bytes"] += len(data)
+        meter["sha256"].update(data)
+        return data
+
+    def _skip(self, target: str, state: str) -> bool:
+        """True when a planned write must not touch disk (unchanged, or user-edited without force)."""
+        if state == UNCHANGED:
+            self.stats["skipped"] += 1
+            return True
+        # Untracked files only count as user files once a lock exists (first runs overwrite, as before)
+        user_file = state == EDITED or (state == UNTRACKED and self.lock.exists)
+        if user_file and not self.force:
+            self.conflicts.append(target)
+            self.stats["conflicts"] += 1
+            logger.warning(f"✋ Kept user-edited file: {target} (use --force to overwrite)")
+            return True
+        return False
+
+    def _adopt(self, target: str, path: Path, fingerprint: tuple, output_digest: str) -> bool:
+        """An untracked file identical to our output (e.g. pre-lock project) is recorded, not rewritten."""
+        if file_digest(path) != output_digest:
+            return False
+        self.lock.record(target, path, fingerprint, output_digest)
+        self.stats["adopted"] += 1
+        return True
+
+    def _state(self, target: str, path: Path, fingerprint: tuple) -> str:
+        """Lock state on disk; archive / memory output is always a fresh tree."""
+        return self.lock.check(target, path, fingerprint) if self.sink.on_disk else NEW
+
+    def _record(self, target: str, path: Path, fingerprint: tuple, output_digest: str):
+        if self.sink.on_disk:
+            self.lock.record(target, path, fingerprint, output_digest)
+
+    def _render_and_write(self, tpl_path: str, output_rel_path: str, extra: dict = None):
+        """Renders a Jinja2 template (ctx plus the op's own context, if any) and writes it; returns bytes written."""
         tpl_path = tpl_path.replace("\\", "/")
         target_path = self.root / output_rel_path
-        
-        # Guard for Django UI assets: Skip generic "ui/" if framework is Django
-        # (Django uses app-specific folders handled in _handle_static_assets)
-        if self.fw == "django" and (output_rel_path.startswith("ui/") or output_rel_path == "ui"):
-            return
+        ctx = ChainMap(extra, self.ctx) if extra else self.ctx  # Op layer on top, nothing copied
 
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        fingerprint = self.lock.render_fingerprint(tpl_path, ctx) if self.sink.on_disk else None
+        state = self._state(output_rel_path, target_path, fingerprint)
+        if state == UNCHANGED:
+            self._skip(output_rel_path, state)
+            return 0
+
+        meter = {"bytes": 0, "sha256": hashlib.sha256(), "content": False}
         try:
             template = self.env.get_template(tpl_path)
-            rendered_content = template.render(**self.ctx)
-            
-            if not rendered_content.strip():
-                logger.warning(f"⚠️ Template {tpl_path} rendered as empty. Check context variables.")
+            chunks = self._stream(tpl_path, template, ctx, meter)
+
+            # Writer threads take finished bytes, and adoption needs the digest before deciding to write
+            if self._pool is not None or state == UNTRACKED:
+                chunks = list(chunks)
+                if state == UNTRACKED and self._adopt(output_rel_path, target_path, fingerprint, meter["sha256"].hexdigest()):
+                    return 0
+            if self._skip(output_rel_path, state):
+                return 0
 
-            target_path.write_text(rendered_content, encoding="utf-8")
-            logger.debug(f"📝 Rendered: {output_rel_path}")
-            
         except Exception as e:
-            logger.error(f"❌ Template Error [{tpl_path}]: {str(e)}")
-            if not target_path.exists(): 
-                target_path.touch()
-                logger.warning(f"⚠️ Created empty fallback file: {output_rel_path}")
-
-    def run(self, blueprint: dict, manifest_rules: list):
-        """Executes the physical build sequence."""
-        if not blueprint: 
-            blueprint = {}
-            
-        self.root.mkdir(parents=True, exist_ok=True)
-        logger.info("🛠️ Building project filesystem...")
-
-        # 1. Folder & Package Scaffolding
-        folders_to_create = (blueprint.get("folders", []) + blueprint.get("packages", []))
-        for folder in folders_to_create:
-            if not folder or folder == "none" or (folder.lower() == "ui" and self.fw == "django"):
-                continue
-            
-            target = self.root / folder
-            target.mkdir(parents=True, exist_ok=True)
-            
-            if folder in blueprint.get("packages", []):
-                (target / "__init__.py").touch()
-
-        # 2. File Rendering from Manifest
-        if manifest_rules:
-            logger.info(f"📄 Rendering {len(manifest_rules)} files from manifest...")
-            for rule in manifest_rules:
-                self._render_and_write(rule["source"], rule["target"])
-
-        # 3. HTML and Static Asset Handling (Framework Specific)
-        self._handle_static_assets()
-        
-        logger.info("🏁 Physical generation phase complete.")
-        return True
+            self._fallback(tpl_path, output_rel_path, e)
+            return 0
+
+        def write():
+            # ⚡ Inline: rendering happens here, chunk by chunk, as the sink consumes the stream
+            with span(output_rel_path, "write") as info:
+                info["bytes"] = self.sink.write_stream(output_rel_path, chunks)
+
+        def done(_):
+            self._record(output_rel_path, target_path, fingerprint, meter["sha256"].hexdigest())
+            self._count(output_rel_path, "rendered")
+            logger.debug(f"📝 Rendered: {output_rel_path}")
+
+        self._submit(write, done, lambda e: self._fallback(tpl_path, output_rel_path, e))
+        return meter["bytes"]
 
-    def _handle_static_assets(self):
-        """Handles HTML templates and Static assets (CSS/JS)."""
-        
-        # --- PART A: HTML TEMPLATES ---
-        src_tpl_dir = self.base_dir / "common" / "template"
-        if src_tpl_dir.exists():
-            for tpl_file in src_tpl_dir.glob("*.tpl"):
-                clean_name = tpl_file.name.replace(".tpl", "")
-                
-                if self.fw == "django":
-                    # Django Path: project/app_name/templates/index.html
-                    target_path = f"{self.app_name}/templates/{clean_name}"
-                else:
-                    # Generic Path: project/ui/index.html
-                    target_path = f"ui/{clean_name}"
-                
-                tpl_lookup = f"common/template/{tpl_file.name}"
-                self._render_and_write(tpl_lookup, target_path)
-
-        # --- PART B: STATIC ASSETS (CSS/JS) ---
-        src_static_dir = self.base_dir / "common" / "static"
-        if not src_static_dir.exists():
+    def _fallback(self, tpl_path: str, output_rel_path: str, error: Exception):
+        """A failed render or write still leaves the planned file behind (empty)."""
+        logger.error(f"❌ Template Error [{tpl_path}]: {str(error)}")
+        self.stats["errors"] += 1
+        if not self.sink.exists(output_rel_path):
+            self.sink.write(output_rel_path, b"")
+            self._count(output_rel_path, "fallbacks")
+            logger.warning(f"⚠️ Created empty fallback file: {output_rel_path}")
+
+    def _copy_asset(self, source: str, output_rel_path: str):
+        """Copies (or links, per the sink's asset mode) a non-template asset verbatim."""
+        src_file = self.base_dir / source
+        dest_file = self.root / output_rel_path
+        fingerprint = self.lock.copy_fingerprint(source)
+        state = self._state(output_rel_path, dest_file, fingerprint)
+        if state == UNTRACKED and self._adopt(output_rel_path, dest_file, fingerprint, file_digest(src_file)):
+            return
+        if self._skip(output_rel_path, state):
+            return
+
+        def copy():
+            with span(output_rel_path, "copy", template=source) as info:
+                written = info["bytes"] = self.sink.copy(src_file, output_rel_path)  # 0 when linked / reflinked
+                return written
+
+        def done(written):
+            self._record(output_rel_path, dest_file, fingerprint, fingerprint[0])
+            self._count(output_rel_path, "copied")
+            self.stats["asset_bytes"] += written
+
+        self._submit(copy, done)
+
+    def _touch(self, target: str):
+        if self.sink.exists(target):
+            self.stats["skipped"] += 1
+            return
+        self._submit(lambda: self.sink.write(target, b""), lambda _: self._count(target, "touched"))
+
+    # --- WRITER POOL ---
+
+    def _submit(self, job, done, fail=None):
+        """
+        Runs job (sink I/O) inline, or on the writer pool. done(result) / fail(error) always
+        run on the calling thread, in submission order; without fail, errors propagate.
+        """
+        if self._pool is None:
+            self._settle_one(job, done, fail, inline=True)
+            return
+        self._pending.append((self._pool.submit(job), done, fail))
+        # ⚡ Bounded: at most a few writes per worker in flight (rendered bytes held in memory)
+        while len(self._pending) > self.io_workers * 4:
+            self._settle()
+
+    @staticmethod
+    def _settle_one(job, done, fail, inline=False):
+        try:
+            result = job() if inline else job.result()
+        except Exception as e:
+            if fail is None:
+                raise
+            fail(e)
             return
+        done(result)
+
+    def _settle(self):
+        future, done, fail = self._pending.popleft()
+        self._settle_one(future, done, fail)
+
+    def _drain(self):
+        while self._pending:
+            self._settle()
+
+    def _count(self, target: str, kind: str):
+        """Write accounting: every planned file must be written exactly once."""
+        self.writes[target] += 1
+        self.stats[kind] += 1
 
-        # Determine target static root
-        if self.fw == "django":
-            target_static_root = self.root / self.app_name / "static"
-        else:
-            ui_folder = self.ctx.get("ui_folder", "ui")
-            target_static_root = self.root / ui_folder / "static"
-
-        for root_path, _, files in os.walk(src_static_dir):
-            for file in files:
-                source_file = Path(root_path) / file
-                rel_path = source_file.relative_to(src_static_dir)
-                
-                if file.endswith(".tpl"):
-                    clean_name = str(rel_path).replace(".tpl", "")
-                    
-                    # Fix: Map 'scripts/' folder to 'js/' target folder
-                    if clean_name.startswith("scripts"):
-                        clean_name = clean_name.replace("scripts", "js", 1)
-                    
-                    tpl_lookup = f"common/static/{rel_path}".replace("\\", "/")
-                    
-                    # Calculate target path relative to project root
-                    final_abs_path = target_static_root / clean_name
-                    rel_to_root = str(final_abs_path.relative_to(self.root))
-                    
-                    self._render_and_write(tpl_lookup, rel_to_root)
-                else:
-                    # Copy non-template assets (images, etc)
-                    dest_file = target_static_root / rel_path
-                    dest_file.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(source_file, dest_file)
-
-    def _sync_files(self, src: Path, dest: Path, tpl_lookup_prefix: str):
-        """Deprecated in favor of explicit manifest and static asset handling."""
-        pass
\ No newline at end of file
+    def run(self, plan: BuildPlan):
+        """Executes the compiled build plan, and only that plan."""
+        with span("generator.run", "phase", ops=len(plan)):
+            return self._run(plan)
+
+    def _run(self, plan: BuildPlan):
+        self.sink.open()
+        self.lock = LockFile.load(self.root) if self.sink.on_disk else LockFile(self.root)
+        logger.info(f"🛠️ Building project filesystem ({len(plan)} planned operations)...")
+
+        # Archive streams and memory trees take writes in plan order: only the disk sink gets a pool
+        if self.io_workers > 1 and self.sink.on_disk:
+            self._pool = ThreadPoolExecutor(max_workers=self.io_workers, thread_name_prefix="init-app-io")
+        try:
+            for op in plan:
+                mode, target = op["mode"], op["target"]
+                if mode == MKDIR:
+                    self.sink.mkdir(target)
+                    self.stats["dirs"] += 1
+                elif mode == TOUCH:
+                    self._touch(target)
+                elif mode == RENDER:
+                    with span(target, "render", template=op["source"]) as info:
+                        info["bytes"] = self._render_and_write(op["source"], target, op.get("context"))
+                elif mode == COPY:
+                    self._copy_asset(op["source"], target)
+            self._drain()
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
+                self._pending.clear()
+
+        if self.lock.dirty and self.sink.on_disk:
+            self.lock.save()
+        logger.info(f"🏁 Physical generation phase complete: {dict(self.stats)}")
+        return True
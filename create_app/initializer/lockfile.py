@@ -0,0 +1,110 @@
+"""
+INCREMENTAL BUILD LOCK (v1.0.0)
+Records, per generated target: the template hash, the hash of the context
+slice that template reads, and the output hash (+ size/mtime for a cheap
+stat-only fast path). Re-runs consult it to skip, re-render or refuse.
+"""
+import hashlib
+import json
+from pathlib import Path
+from create_app.constants import __version__
+from create_app.initializer.templating import file_digest, template_index, template_variables
+from create_app.logger import logger
+
+LOCK_NAME = ".init-app.lock"
+
+# Target states returned by LockFile.check()
+NEW = "new"               # Nothing on disk yet
+UNCHANGED = "unchanged"   # Inputs identical and output untouched: skip
+STALE = "stale"           # Inputs changed, output untouched: re-render
+EDITED = "edited"         # Output modified by the user since we wrote it
+UNTRACKED = "untracked"   # File exists but was never recorded
+
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _digest_text(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LockFile:
+    """Reads, checks and rewrites <project>/.init-app.lock."""
+    def __init__(self, root: Path, entries: dict = None):
+        self.path = Path(root) / LOCK_NAME
+        self.entries = entries or {}
+        self.exists = entries is not None  # False on a project's first (lock-less) generation
+        self.dirty = False
+
+    @classmethod
+    def load(cls, root: Path):
+        path = Path(root) / LOCK_NAME
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(root, data.get("files", {}))
+        except FileNotFoundError:
+            return cls(root)
+        except (ValueError, OSError) as e:
+            logger.warning(f"⚠️ Ignoring unreadable {LOCK_NAME}: {e}")
+            return cls(root, {})  # Still a managed project: existing files stay protected
+
+    def save(self):
+        payload = {"version": __version__, "files": dict(sorted(self.entries.items()))}
+        self.path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        self.dirty = False
+        logger.debug(f"🔒 Lock written: {len(self.entries)} tracked files.")
+
+    # --- FINGERPRINTS ---
+
+    @staticmethod
+    def render_fingerprint(source: str, ctx) -> tuple:
+        """(template hash, context-slice hash) for a rendered target."""
+        names = template_variables(source)
+        keys = sorted(ctx.keys()) if names is None else names
+        ctx_slice = {k: ctx.get(k) for k in keys}
+        return (
+            template_index().get(source),
+            _digest_text(json.dumps(ctx_slice, sort_keys=True, default=_json_default))
+        )
+
+    @staticmethod
+    def copy_fingerprint(source: str) -> tuple:
+        return (template_index().get(source), "")
+
+    # --- STATE ---
+
+    def check(self, target: str, path: Path, fingerprint: tuple) -> str:
+        """Classifies a target against the lock using one stat in the common case."""
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return NEW
+
+        entry = self.entries.get(target)
+        if entry is None:
+            return UNTRACKED
+
+        if st.st_size != entry["size"] or st.st_mtime_ns != entry["mtime_ns"]:
+            # Stat drifted (checkout, copy): only a content change counts as an edit
+            if file_digest(path) != entry["output"]:
+                return EDITED
+            entry.update({"size": st.st_size, "mtime_ns": st.st_mtime_ns})
+            self.dirty = True
+
+        if (entry["template"], entry["context"]) == tuple(fingerprint):
+            return UNCHANGED
+        return STALE
+
+    def record(self, target: str, path: Path, fingerprint: tuple, output_digest: str):
+        st = path.stat()
+        self.entries[target] = {
+            "template": fingerprint[0],
+            "context": fingerprint[1],
+            "output": output_digest,
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+        }
+        self.dirty = True
@@ -0,0 +1,179 @@
+"""
+DJANGO SETTINGS PATCHER (v1.0.0)
+Applies DJANGO_PATCH_RULES["patches"] to an existing settings.py.
+FEATURE: settings.py is parsed once (ast) into an index of top-level imports and
+assignments; every patch becomes a (start, end, text) edit against that index and
+all edits are spliced in a single pass. No regex over the whole file.
+FEATURE: Idempotent; a report says which patches applied and which were already in place.
+"""
+import ast
+from create_app.initializer.templating import get_environment, render_layered
+from create_app.logger import logger
+
+# Report statuses
+APPLIED = "applied"
+UNCHANGED = "unchanged"
+FAILED = "failed"
+
+
+class SettingsPatcher:
+    def __init__(self, source: str):
+        self.source = source
+        self.tree = ast.parse(source)
+        self._line_starts = [0]
+        for line in source.splitlines(keepends=True):
+            self._line_starts.append(self._line_starts[-1] + len(line))
+
+        # --- A. TOP-LEVEL INDEX (built once) ---
+        self.assignments = {}  # NAME -> ast.Assign
+        self.imports = set()   # Module names bound by top-level imports
+        self._last_import = None
+        for node in self.tree.body:
+            if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+                self.assignments[node.targets[0].id] = node
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                self._last_import = node
+                if isinstance(node, ast.Import):
+                    self.imports.update(alias.name for alias in node.names)
+
+        self._edits = []
+        self.report = {}  # patch name -> applied / unchanged / failed
+
+    # --- OFFSETS ---
+
+    def _offset(self, lineno: int, col: int) -> int:
+        """ast positions (1-based line, utf-8 byte column) -> string offset."""
+        start = self._line_starts[lineno - 1]
+        line = self.source[start:self._line_starts[lineno]] if lineno < len(self._line_starts) else self.source[start:]
+        return start + len(line.encode("utf-8")[:col].decode("utf-8", errors="ignore"))
+
+    def _statement_span(self, node) -> tuple:
+        """Whole lines of a top-level statement, trailing newline included."""
+        start = self._line_starts[node.lineno - 1]
+        end = self._line_starts[node.end_lineno] if node.end_lineno < len(self._line_starts) else len(self.source)
+        return start, end
+
+    def _segment(self, node) -> str:
+        start, end = self._statement_span(node)
+        return self.source[start:end].rstrip("\n")
+
+    def _edit(self, start: int, end: int, text: str):
+        self._edits.append((start, end, text))
+
+    # --- PATCH KINDS ---
+
+    def _patch_import(self, patch: dict, ctx: dict) -> bool:
+        module = patch["module"]
+        if module in self.imports:
+            return False
+        # Right after the last top-level import (top of file when there is none)
+        anchor = self._statement_span(self._last_import)[1] if self._last_import else 0
+        self._edit(anchor, anchor, f"import {module}\n")
+        return True
+
+    def _patch_assign(self, patch: dict, ctx: dict) -> bool:
+        snippet = _render(patch["template"], ctx)
+        when = patch.get("when", "always")
+        changed = False
+        appended = []
+        for node in ast.parse(snippet).body:
+            if not (isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)):
+                continue
+            text = ast.get_source_segment(snippet, node)
+            existing = self.assignments.get(node.targets[0].id)
+            if existing is None:
+                appended.append(text)
+            elif when == "always" or (when == "literal" and _is_literal(existing.value)):
+                if self._segment(existing) != text:
+                    self._edit(*self._statement_span(existing), text + "\n")
+                    changed = True
+        if appended:
+            tail = "" if self.source.endswith("\n") else "\n"
+            self._edit(len(self.source), len(self.source), tail + "\n" + "\n".join(appended) + "\n")
+            changed = True
+        return changed
+
+    def _patch_list(self, patch: dict, ctx: dict) -> bool:
+        node = self.assignments.get(patch["target"])
+        if node is None or not isinstance(node.value, (ast.List, ast.Tuple)):
+            raise ValueError(f"{patch['target']} is not a top-level list")
+
+        items = []
+        if patch.get("template"):
+            items += ast.literal_eval("[" + _render(patch["template"], ctx) + "]")
+        items += list(ctx.get(patch.get("items_from"), []) or [])
+
+        present = {e.value for e in node.value.elts if isinstance(e, ast.Constant)}
+        missing = [i for i in dict.fromkeys(items) if i not in present]
+        if not missing:
+            return False
+
+        close = self._offset(node.value.end_lineno, node.value.end_col_offset) - 1  # the ']'
+        elts = node.value.elts
+        between = self.source[self._offset(elts[-1].end_lineno, elts[-1].end_col_offset):close] if elts else ""
+        comma = "" if not elts or "," in between else ","
+        line_start = self.source.rfind("\n", 0, close) + 1
+
+        if node.value.end_lineno > node.value.lineno and not self.source[line_start:close].strip():
+            # Multi-line list: one entry per line, just above the closing bracket
+            indent = " " * 4
+            if elts:
+                indent = self.source[self.source.rfind("\n", 0, self._offset(elts[-1].lineno, elts[-1].col_offset)) + 1:
+                                     self._offset(elts[-1].lineno, elts[-1].col_offset)]
+            if comma:
+                self._edit(self._offset(elts[-1].end_lineno, elts[-1].end_col_offset),
+                           self._offset(elts[-1].end_lineno, elts[-1].end_col_offset), comma)
+            self._edit(line_start, line_start, "".join(f"{indent}{i!r},\n" for i in missing))
+        else:
+            # Single-line list: appended inline
+            sep = (", " if comma else " ") if elts else ""
+            self._edit(close, close, sep + ", ".join(repr(i) for i in missing))
+        return True
+
+    # --- DRIVER ---
+
+    def apply(self, patches: list, ctx: dict) -> str:
+        """Collects every patch's edits against the original index, then splices once."""
+        kinds = {"import": self._patch_import, "assign": self._patch_assign, "list": self._patch_list}
+        for patch in patches:
+            name = patch.get("name", patch.get("kind"))
+            try:
+                self.report[name] = APPLIED if kinds[patch["kind"]](patch, ctx) else UNCHANGED
+            except Exception as e:
+                self.report[name] = FAILED
+                logger.warning(f"⚠️ Settings patch '{name}' not applied: {e}")
+
+        # ⚡ Single splice pass: edits never overlap (distinct statements), joined front to back
+        out, cursor = [], 0
+        for start, end, text in sorted(self._edits, key=lambda e: (e[0], e[1])):
+            out.append(self.source[cursor:start])
+            out.append(text)
+            cursor = max(cursor, end)
+        out.append(self.source[cursor:])
+        return "".join(out)
+
+
+def _render(template: str, ctx: dict) -> str:
+    return render_layered(get_environment("generator").get_template(f"common/{template}"), ctx).strip("\n")
+
+
+def _is_literal(node) -> bool:
+    """Hardcoded values (strings, numbers, lists of them): candidates for env-based replacement."""
+    try:
+        ast.literal_eval(node)
+        return True
+    except ValueError:
+        return False
+
+
+def patch_settings(path, patches: list, ctx: dict) -> dict:
+    """Patches a settings.py file in place; returns the per-patch report."""
+    patches = [p for p in patches if p.get("file", "settings.py") == "settings.py"]
+    source = path.read_text(encoding="utf-8")
+    patcher = SettingsPatcher(source)
+    patched = patcher.apply(patches, ctx)
+    if patched != source:
+        path.write_text(patched, encoding="utf-8")
+    applied = [name for name, status in patcher.report.items() if status == APPLIED]
+    logger.info(f"💉 {path.name} patched: {', '.join(applied) or 'nothing to do'} ({patcher.report})")
+    return patcher.report
@@ -0,0 +1,268 @@
+"""
+OUTPUT SINKS (v1.0.0)
+Where the Generator's files go. Every sink takes project-relative POSIX paths.
+  DiskSink   -> the real project directory (lock-tracked, incremental re-runs;
+                static assets copied, or linked / reflinked from the shared asset store)
+  MemorySink -> {path: bytes} for the Python API and tests
+  TarSink    -> streaming .tar.gz (mode 'w|gz', never seeks, no project directory)
+  ZipSink    -> streaming .zip (deflated, data descriptors on non-seekable streams)
+Archive sinks prefix every entry with the project name, like a downloaded scaffold.
+FEATURE: write_stream(rel, chunks) takes rendered output as an iterable of byte chunks,
+so a large file is never held whole: disk files are written through a sibling temp file
+(a failing template leaves the previous file intact); archive entries need their size
+up front, so chunks spool in memory and only spill to a temp file past SPOOL_BYTES.
+FEATURE: DiskSink(fsync=True) (or INIT_APP_FSYNC=1) fsyncs each file before it lands in place;
+off by default, since a scaffold can be regenerated and a per-file fsync dominates build time.
+"""
+import io
+import os
+import shutil
+import stat
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+from create_app.fileclone import COPY
+from create_app.initializer.asset_store import shared_store
+from create_app.logger import logger
+
+# Archive formats by file suffix (--archive FILE)
+ARCHIVE_SUFFIXES = {".tar.gz": "tar", ".tgz": "tar", ".zip": "zip"}
+
+# Opt-in durable writes (DiskSink fsync=None reads this)
+FSYNC_ENV_VAR = "INIT_APP_FSYNC"
+
+# Archive entries up to this size are staged in memory before they are added
+SPOOL_BYTES = 8 * 1024 * 1024
+
+
+def fsync_enabled() -> bool:
+    """INIT_APP_FSYNC=1 makes every DiskSink fsync its files."""
+    return os.environ.get(FSYNC_ENV_VAR, "").lower() in ["1", "true", "yes"]
+
+
+class DiskSink:
+    """Writes into the project directory; the only sink with a lockfile and a venv."""
+    on_disk = True
+
+    def __init__(self, root: Path, assets: str = COPY, store=None, fsync: bool = None):
+        self.root = Path(root)
+        self.assets = assets  # link | reflink | copy (see asset_store)
+        self.store = store or shared_store()
+        self.fsync = fsync_enabled() if fsync is None else fsync
+        self._fallback_lock = threading.Lock()  # copy() runs on Generator writer-pool threads
+
+    def open(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, rel: str) -> Path:
+        return self.root / rel
+
+    def exists(self, rel: str) -> bool:
+        return (self.root / rel).exists()
+
+    def mkdir(self, rel: str):
+        (self.root / rel).mkdir(parents=True, exist_ok=True)
+
+    def write(self, rel: str, data: bytes):
+        target = self.root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with open(target, "wb") as fh:
+            fh.write(data)
+            self._sync(fh)
+
+    def write_stream(self, rel: str, chunks) -> int:
+        """Writes byte chunks as they come; the target is replaced only once all of them landed."""
+        target = self.root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        size = 0
+        try:
+            with open(staging, "wb") as fh:
+                for chunk in chunks:
+                    fh.write(chunk)
+                    size += len(chunk)
+                self._sync(fh)  # Data is on disk before the rename makes it visible
+            if target.exists():
+                os.chmod(staging, stat.S_IMODE(target.stat().st_mode) | stat.S_IWUSR)  # Keep e.g. +x
+            os.replace(staging, target)  # New inode: a hardlinked target is detached, never edited
+        except BaseException:
+            staging.unlink(missing_ok=True)
+            raise
+        return size
+
+    def _sync(self, fh):
+        if self.fsync:
+            fh.flush()
+            os.fsync(fh.fileno())
+
+    def copy(self, src: Path, rel: str) -> int:
+        """Materializes a static asset; returns the bytes of data actually written."""
+        target = self.root / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        mode = self.assets
+        used, written = self.store.materialize(Path(src), target, mode)
+        if used != mode:
+            # EXDEV / no clone support: the rest of this build copies without retrying
+            with self._fallback_lock:
+                if self.assets == mode:  # First writer thread to hit it switches (and logs) once
+                    logger.info(f"🔗 Asset {mode} unavailable for {self.root}; falling back to {used}.")
+                    self.assets = used
+        return written
+
+    def close(self):
+        pass
+
+
+class MemorySink:
+    """In-memory project tree: .files maps 'path/in/project' -> bytes."""
+    on_disk = False
+
+    def __init__(self):
+        self.files = {}
+        self.dirs = set()
+
+    def open(self):
+        pass
+
+    def path(self, rel: str):
+        return None
+
+    def exists(self, rel: str) -> bool:
+        return rel in self.files or rel in self.dirs
+
+    def mkdir(self, rel: str):
+        self.dirs.add(rel)
+
+    def write(self, rel: str, data: bytes):
+        self.files[rel] = bytes(data)
+
+    def write_stream(self, rel: str, chunks) -> int:
+        self.files[rel] = b"".join(chunks)
+        return len(self.files[rel])
+
+    def copy(self, src: Path, rel: str) -> int:
+        self.files[rel] = Path(src).read_bytes()
+        return len(self.files[rel])
+
+    def close(self):
+        pass
+
+
+class _ArchiveSink:
+    """Shared bookkeeping for streaming archive writers (entries are write-once)."""
+    on_disk = False
+
+    def __init__(self, fileobj, prefix: str = ""):
+        # A path opens (and later closes) its own file; a file object is borrowed (e.g. an HTTP response)
+        self._owned = isinstance(fileobj, (str, Path))
+        self.fileobj = open(fileobj, "wb") if self._owned else fileobj
+        self.prefix = prefix.strip("/")
+        self.names = set()
+        self.bytes = 0
+        self.mtime = time.time()
+
+    def _name(self, rel: str) -> str:
+        return f"{self.prefix}/{rel}" if self.prefix else rel
+
+    def path(self, rel: str):
+        return None
+
+    def exists(self, rel: str) -> bool:
+        return rel in self.names
+
+    def copy(self, src: Path, rel: str) -> int:
+        data = Path(src).read_bytes()
+        self.write(rel, data)
+        return len(data)
+
+    def write_stream(self, rel: str, chunks) -> int:
+        """One entry from byte chunks; nothing is added if the producer fails midway."""
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as spool:
+            for chunk in chunks:
+                spool.write(chunk)
+            size = spool.tell()
+            spool.seek(0)
+            self._add_file(rel, spool, size)
+        return size
+
+    def _close_stream(self):
+        if self._owned:
+            self.fileobj.close()
+
+
+class TarSink(_ArchiveSink):
+    def open(self):
+        self.tar = tarfile.open(fileobj=self.fileobj, mode="w|gz")
+
+    def _info(self, rel: str) -> tarfile.TarInfo:
+        info = tarfile.TarInfo(self._name(rel))
+        info.mtime = self.mtime
+        return info
+
+    def _add_file(self, rel: str, fileobj, size: int):
+        info = self._info(rel)
+        info.size, info.mode = size, 0o644
+        self.tar.addfile(info, fileobj)
+        self.bytes += size
+        self.names.add(rel)
+
+    def mkdir(self, rel: str):
+        if rel not in self.names:
+            info = self._info(rel)
+            info.type, info.mode = tarfile.DIRTYPE, 0o755
+            self.tar.addfile(info)
+            self.names.add(rel)
+
+    def write(self, rel: str, data: bytes):
+        self._add_file(rel, io.BytesIO(data), len(data))
+
+    def close(self):
+        self.tar.close()
+        self._close_stream()
+
+
+class ZipSink(_ArchiveSink):
+    def open(self):
+        self.zip = zipfile.ZipFile(self.fileobj, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def _info(self, name: str, mode: int) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=time.localtime(self.mtime)[:6])
+        info.external_attr = mode << 16
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return info
+
+    def mkdir(self, rel: str):
+        if rel not in self.names:
+            self.zip.writestr(self._info(self._name(rel) + "/", 0o40755), b"")
+            self.names.add(rel)
+
+    def write(self, rel: str, data: bytes):
+        self.zip.writestr(self._info(self._name(rel), 0o100644), data)
+        self.bytes += len(data)
+        self.names.add(rel)
+
+    def _add_file(self, rel: str, fileobj, size: int):
+        with self.zip.open(self._info(self._name(rel), 0o100644), "w", force_zip64=size > zipfile.ZIP64_LIMIT) as entry:
+            shutil.copyfileobj(fileobj, entry)
+        self.bytes += size
+        self.names.add(rel)
+
+    def close(self):
+        self.zip.close()
+        self._close_stream()
+
+
+def archive_format(path) -> str:
+    name = os.fspath(path).lower()
+    for suffix, kind in ARCHIVE_SUFFIXES.items():
+        if name.endswith(suffix):
+            return kind
+    raise ValueError(f"Unsupported archive '{path}' (use {', '.join(ARCHIVE_SUFFIXES)})")
+
+
+def archive_sink(fileobj, kind: str, prefix: str = ""):
+    """TarSink or ZipSink over a path or a writable (possibly non-seekable) stream."""
+    return {"tar": TarSink, "zip": ZipSink}[kind](fileobj, prefix)
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import os
+import shutil
+from collections import ChainMap
+from itertools import islice
+from pathlib import Path
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, ChoiceLoader, ModuleLoader, meta
+from create_app.constants import __version__
+from create_app.cache import cache_dir, cache_enabled, cache_root
+from create_app.logger import logger
+
+# --- TEMPLATE ROOTS ---
+BASE_DIR = Path(__file__).parent.parent.resolve()
+COMMON_DIR = BASE_DIR / "common"
+
+# Precompiled templates + index, emitted into the wheel by setup.py (absent in dev)
+COMPILED_DIR = BASE_DIR / "_compiled"
+INDEX_FILE = "index.json"
+
+# ⚡ Process-wide caches: one warm Environment per flavour, one template index
+_ENVIRONMENTS = {}
+_INDEX = None
+_VARIABLES = None
+
+
+def _bytecode_cache(kind: str):
+    """
+    On-disk compiled-template cache shared by every run.
+    Keyed by package version (directory) and flavour; Jinja invalidates each
+    entry itself when the template source checksum changes.
+    """
+    if not cache_enabled():
+        return None
+    try:
+        return FileSystemBytecodeCache(directory=str(cache_dir("jinja", __version__, kind)))
+    except OSError as e:
+        logger.debug(f"Bytecode cache disabled ({kind}): {e}")
+        return None
+
+
+def _with_compiled(kind: str, fs_loader):
+    """Prefers the shipped ModuleLoader build; falls back to source files in dev."""
+    compiled = COMPILED_DIR / kind
+    if compiled.is_dir():
+        return ChoiceLoader([ModuleLoader(str(compiled)), fs_loader])
+    return fs_loader
+
+
+def _generator_loader():
+    search_paths = [
+        str(BASE_DIR),
+        str(COMMON_DIR / "template"),
+        str(BASE_DIR / "framework" / "templates")
+    ]
+    valid_paths = [p for p in search_paths if Path(p).exists()]
+    return FileSystemLoader(valid_paths)
+
+
+def _terminal_loader():
+    return FileSystemLoader(str(COMMON_DIR))
+
+
+def _generator_env(precompiled: bool = True, cached: bool = True):
+    """File-writing engine: resolves 'common/...' lookups with block trimming."""
+    loader = _generator_loader()
+    return Environment(
+        loader=_with_compiled("generator", loader) if precompiled else loader,
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=_bytecode_cache("generator") if cached else None
+    )
+
+
+def _terminal_env(precompiled: bool = True, cached: bool = True):
+    """Terminal engine: renders bare 'common/' names (venv.txt.tpl, work.txt.tpl)."""
+    loader = _terminal_loader()
+    return Environment(
+        loader=_with_compiled("terminal", loader) if precompiled else loader,
+        bytecode_cache=_bytecode_cache("terminal") if cached else None
+    )
+
+
+_FACTORIES = {
+    "generator": _generator_env,
+    "terminal": _terminal_env,
+}
+
+_LOADERS = {
+    "generator": _generator_loader,
+    "terminal": _terminal_loader,
+}
+
+
+def get_environment(kind: str = "generator") -> Environment:
+    """
+    Returns the shared Jinja Environment for the given flavour.
+    Built once per process so repeated Controllers reuse parsed templates.
+    """
+    env = _ENVIRONMENTS.get(kind)
+    if env is None:
+        env = _FACTORIES[kind]()
+        _ENVIRONMENTS[kind] = env
+        logger.debug(f"🧩 Template environment warmed: {kind}")
+    return env
+
+
+def render_layered(template, ctx) -> str:
+    """
+    Template.render() without its dict copy: ctx (any mapping, e.g. a ChainMap of
+    per-project fields over the shared constants) becomes the context parent as-is.
+    """
+    context = template.new_context(ChainMap(ctx, template.globals), shared=True)
+    try:
+        return template.environment.concat(template.root_render_func(context))
+    except Exception:
+        return template.environment.handle_exception()
+
+
+def generate_layered(template, ctx, parts: int = 4096):
+    """
+    Streaming render_layered(): yields the output `parts` template nodes at a time
+    (joined in C, so a big file costs no more than render() but is never held whole).
+    """
+    context = template.new_context(ChainMap(ctx, template.globals), shared=True)
+    stream = template.root_render_func(context)
+    try:
+        while True:
+            chunk = list(islice(stream, parts))
+            if not chunk:
+                return
+            yield template.environment.concat(chunk)
+    except Exception:
+        yield template.environment.handle_exception()
+
+
+def _is_template(name: str) -> bool:
+    return name.endswith(".tpl")
+
+
+def template_names(kind: str) -> list:
+    """Lists .tpl names as the flavour's source loader sees them."""
+    return [n for n in _LOADERS[kind]().list_templates() if _is_template(n)]
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a file's bytes (template and asset fingerprints)."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+# --- STATIC TEMPLATE INDEX ---
+
+def _scan_common() -> dict:
+    """Walks common/ once: {'common/<rel path>': sha256} for templates and raw assets."""
+    files = {}
+    for root_path, _, names in os.walk(COMMON_DIR):
+        for name in names:
+            path = Path(root_path) / name
+            files[path.relative_to(BASE_DIR).as_posix()] = file_digest(path)
+    return dict(sorted(files.items()))
+
+
+def _read_index() -> dict:
+    index_file = COMPILED_DIR / INDEX_FILE
+    if index_file.exists():
+        return json.loads(index_file.read_text(encoding="utf-8"))
+    return {}
+
+
+def template_index() -> dict:
+    """
+    Returns the {'common/...': sha256} index of shipped files.
+    Read from the precompiled build when present, otherwise scanned once per process.
+    """
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = _read_index().get("files") or _scan_common()
+    return _INDEX
+
+
+def _parse_variables(env, source: str):
+    """Undeclared names a template reads; None when it pulls in other templates (or fails to parse)."""
+    try:
+        ast = env.parse((BASE_DIR / source).read_text(encoding="utf-8"))
+    except Exception as e:
+        logger.debug(f"Variable scan skipped for {source}: {e}")
+        return None
+    if list(meta.find_referenced_templates(ast)):
+        return None
+    return sorted(meta.find_undeclared_variables(ast))
+
+
+def template_variables(source: str):
+    """
+    Context names a generator template reads (lockfile context slices).
+    Shipped in index.json by precompile; parsed lazily, once per process, in dev.
+    """
+    global _VARIABLES
+    if _VARIABLES is None:
+        _VARIABLES = _read_index().get("variables", {})
+    if source not in _VARIABLES:
+        _VARIABLES[source] = _parse_variables(get_environment("generator"), source)
+    return _VARIABLES[source]
+
+
+def precompile(target_dir) -> dict:
+    """
+    Build step (setup.py build_py): compiles every .tpl into importable modules
+    for ModuleLoader, one folder per environment flavour, plus index.json.
+    """
+    target = Path(target_dir)
+    shutil.rmtree(target, ignore_errors=True)
+    for kind, factory in _FACTORIES.items():
+        env = factory(precompiled=False, cached=False)  # The builder's user cache stays untouched
+        env.compile_templates(str(target / kind), filter_func=_is_template, zip=None, ignore_errors=False)
+
+    files = _scan_common()
+    generator = _generator_env(precompiled=False, cached=False)
+    variables = {name: _parse_variables(generator, name) for name in files if _is_template(name)}
+    index = {"version": __version__, "files": files, "variables": variables}
+    (target / INDEX_FILE).write_text(json.dumps(index, indent=1), encoding="utf-8")
+    logger.info(f"📦 Precompiled templates into {target} ({len(index['files'])} indexed files).")
+    return index
+
+
+# --- CACHE MAINTENANCE (init-app cache ...) ---
+
+def warm_cache() -> int:
+    """Compiles every .tpl once through both environments; returns the template count."""
+    compiled = 0
+    for kind in _FACTORIES:
+        env = get_environment(kind)
+        for name in template_names(kind):
+            try:
+                env.get_template(name)
+                compiled += 1
+            except Exception as e:
+                logger.warning(f"⚠️ Cache warm skipped {name} ({kind}): {e}")
+    logger.info(f"🔥 Template cache warmed: {compiled} templates.")
+    return compiled
+
+
+def clear_cache():
+    """Drops every compiled template (all package versions)."""
+    shutil.rmtree(cache_root() / "jinja", ignore_errors=True)
+    logger.info("🧹 Template cache cleared.")
+
+
+def cache_info() -> dict:
+    """Summarizes the compiled-template cache for the current package version."""
+    root = cache_root() / "jinja" / __version__
+    files = [p for p in root.rglob("*") if p.is_file()] if root.exists() else []
+    return {
+        "path": str(root),
+        "enabled": cache_enabled(),
+        "entries": len(files),
+        "bytes": sum(p.stat().st_size for p in files),
+    }
@@ -0,0 +1,218 @@
+import hashlib
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from create_app.cache import cache_dir, cache_enabled, cache_root
+from create_app.fileclone import clone_tree, COPY
+from create_app.logger import logger
+from create_app.tracing import span
+
+# Dependency fingerprint stored inside the venv (re-runs skip pip when it matches)
+DEPS_MARKER = ".init-app-deps"
+
+
+def deps_digest(deps: list) -> str:
+    return hashlib.sha256("\n".join(sorted(deps)).encode("utf-8")).hexdigest()
+
+
+def template_key(deps: list) -> str:
+    """Venv template identity: sorted dependency set + the interpreter that builds it."""
+    identity = {
+        "deps": sorted(deps),
+        "python": sys.version,
+        "implementation": platform.python_implementation(),
+        "base": sys.base_prefix,
+        "platform": sys.platform,
+    }
+    return hashlib.sha256(json.dumps(identity, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+
+
+def templates_supported() -> bool:
+    # Windows launchers (.exe) embed the interpreter path in binary form: no relocation there
+    return cache_enabled() and os.name != "nt"
+
+
+def relocate(venv_path: Path, old: str, new: str):
+    """
+    Rewrites absolute venv paths after a clone: pyvenv.cfg, activate scripts and
+    script shebangs. Files are replaced (not edited) so hardlinked sources stay intact.
+    """
+    venv_path = Path(venv_path)
+    bin_dir = venv_path / ("Scripts" if os.name == "nt" else "bin")
+    candidates = [venv_path / "pyvenv.cfg"] + sorted(bin_dir.iterdir() if bin_dir.is_dir() else [])
+    old_b, new_b = old.encode("utf-8"), new.encode("utf-8")
+
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+        data = path.read_bytes()
+        if old_b not in data:
+            continue
+        mode = path.stat().st_mode
+        path.unlink()
+        path.write_bytes(data.replace(old_b, new_b))
+        os.chmod(path, mode)
+
+
+def venv_cache_info() -> dict:
+    root = cache_root() / "venvs"
+    templates = [p for p in root.iterdir() if p.is_dir()] if root.exists() else []
+    return {"path": str(root), "templates": len(templates)}
+
+
+def clear_venv_cache():
+    shutil.rmtree(cache_root() / "venvs", ignore_errors=True)
+    logger.info("🧹 Venv template cache cleared.")
+
+
+class VenvManager:
+    """
+    ENVIRONMENT PROVISIONER (v1.1.0)
+    Builds the project venv on a background thread while the Generator renders.
+    FEATURE: 'python -m venv' starts as soon as the project root exists; pip starts
+    the moment Bundler has resolved the dependency list (no requirements.txt needed).
+    FEATURE: Template cache keyed by dependency set + interpreter; repeat builds are a
+    hardlink clone plus path fix-up instead of venv + pip.
+    FEATURE: Offline installs from a Wheelhouse (--no-index, one --no-deps pip run over the closure).
+    """
+    def __init__(self, venv_path: Path, wheelhouse=None):
+        self.venv_path = Path(venv_path)
+        self.wheelhouse = wheelhouse
+        self.deps = None
+        self.error = None
+        self.cancelled = False
+        self.state = "idle"   # idle -> waiting -> cloning | creating -> installing -> caching -> done / failed / skipped
+        self.durations = {}   # step -> seconds, spent on the background thread
+        self._deps_ready = threading.Event()
+        self._thread = None
+
+    @property
+    def bin_dir(self) -> Path:
+        return self.venv_path / ("Scripts" if os.name == "nt" else "bin")
+
+    def status(self) -> str:
+        """One-word progress for concurrent spinners."""
+        return f"venv {self.state}"
+
+    # --- LIFECYCLE ---
+
+    def start(self):
+        """Begins provisioning in the background; returns immediately."""
+        self._thread = threading.Thread(target=self._provision, name="venv-provisioner", daemon=True)
+        self._thread.start()
+        return self
+
+    def install(self, deps: list):
+        """Hands the resolved dependency list to the provisioner."""
+        self.deps = list(deps)
+        self._deps_ready.set()
+
+    def cancel(self):
+        """No dependencies will follow (build failed before bundling)."""
+        self.cancelled = True
+        self._deps_ready.set()
+
+    def wait(self) -> bool:
+        """Blocks until provisioning finishes; True on success."""
+        if self._thread:
+            self._thread.join()
+        return self.error is None
+
+    # --- BACKGROUND WORK ---
+
+    def _timed(self, step: str, func):
+        started = time.perf_counter()
+        try:
+            with span(step, "venv", path=str(self.venv_path)):
+                return func()
+        finally:
+            self.durations[step] = time.perf_counter() - started
+
+    def _marker_matches(self) -> bool:
+        marker = self.venv_path / DEPS_MARKER
+        return marker.exists() and marker.read_text(encoding="utf-8").strip() == deps_digest(self.deps)
+
+    def _provision(self):
+        try:
+            self.state = "waiting"
+            self._deps_ready.wait()
+            if self.cancelled:
+                self.state = "skipped"
+                return
+
+            # Re-run: keep the existing venv, refresh packages only if the set changed
+            if self.venv_path.exists():
+                if self._marker_matches() or not self.deps:
+                    self.state = "skipped"
+                    logger.info("⏭️ VENV dependencies up to date, skipped.")
+                    return
+                self._install()
+                self.state = "done"
+                return
+
+            template = cache_root() / "venvs" / template_key(self.deps) if templates_supported() else None
+            if template and (template / "pyvenv.cfg").exists():
+                self.state = "cloning"
+                self._timed("venv.clone", lambda: self._clone(template))
+                self.state = "done"
+                return
+
+            self.state = "creating"
+            self._timed("venv.create", lambda: subprocess.run(
+                [sys.executable, "-m", "venv", str(self.venv_path)], check=True, capture_output=True))
+            logger.info(f"🐍 VENV created: {self.venv_path}")
+
+            if self.deps:
+                self._install()
+            if template and (self.venv_path / "pyvenv.cfg").exists():
+                self.state = "caching"
+                self._timed("venv.cache", lambda: self._store_template(template))
+            self.state = "done"
+        except Exception as e:
+            self.state = "failed"
+            self.error = str(e)
+            logger.error(f"⚠️ VENV warning: {str(e)}")
+
+    def _install(self):
+        self.state = "installing"
+        self._timed("venv.install", self._pip_install)
+        if self.venv_path.exists():
+            (self.venv_path / DEPS_MARKER).write_text(deps_digest(self.deps), encoding="utf-8")
+        logger.info(f"✅ Dependencies installed ({len(self.deps)} packages).")
+
+    def _pip_install(self):
+        pip_exe = self.bin_dir / "pip"
+        if self.wheelhouse:
+            subprocess.run(self.wheelhouse.install_command(pip_exe, self.deps), check=True, capture_output=True)
+            return
+        subprocess.run([str(pip_exe), "install", "--upgrade", "pip"], capture_output=True)
+        subprocess.run([str(pip_exe), "install", *self.deps], check=True, capture_output=True)
+
+    def _clone(self, template: Path):
+        """Hardlink-clones a cached template into the project and fixes its absolute paths."""
+        mode = clone_tree(template, self.venv_path)
+        relocate(self.venv_path, str(template), str(self.venv_path))
+        logger.info(f"⚡ VENV cloned from template {template.name} ({mode})")
+
+    def _store_template(self, template: Path):
+        """
+        Publishes the freshly built venv as a template: private copy (never links
+        to project files), relocated, then renamed into place atomically.
+        """
+        staging = cache_dir("venvs") / f".{template.name}.{os.getpid()}.{threading.get_ident()}"
+        try:
+            clone_tree(self.venv_path, staging, mode=COPY)
+            relocate(staging, str(self.venv_path), str(template))
+            os.rename(staging, template)
+            logger.info(f"📦 VENV template cached: {template.name}")
+        except OSError as e:
+            # Lost a race with a parallel build of the same set, or a cache I/O error
+            logger.debug(f"Venv template not stored ({template.name}): {e}")
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
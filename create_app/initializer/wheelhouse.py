@@ -0,0 +1,118 @@
+"""
+OFFLINE WHEELHOUSE (v1.0.0)
+`init-app wheelhouse build DIR` (run where network exists) pre-builds wheels for
+every dependency set Bundler can resolve and indexes each set's full closure.
+Offline agents then install with --no-index: the closure is checked up front and
+installed with --no-deps by a single pip process (pip does not lock a venv against
+concurrent installs, so the closure is never split across processes).
+"""
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+import create_app.constants as const
+from create_app.logger import logger
+
+WHEELHOUSE_ENV_VAR = "INIT_APP_WHEELHOUSE"
+INDEX_NAME = "wheelhouse.json"
+
+# pip wheel output: newly built/downloaded files and reused ones
+_SAVED = re.compile(r"(?:Saved|File was already downloaded) (\S+)\s*$")
+
+
+def resolve_wheelhouse(path=None):
+    """Explicit --wheelhouse wins; INIT_APP_WHEELHOUSE otherwise; None means online installs."""
+    path = path or os.environ.get(WHEELHOUSE_ENV_VAR)
+    return Wheelhouse(path) if path else None
+
+
+def _normalize(name: str) -> str:
+    """PEP 503 name of a requirement ('uvicorn[standard]' -> 'uvicorn')."""
+    name = re.split(r"[\[<>=!~;\s]", name, maxsplit=1)[0]
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def dependency_sets() -> dict:
+    """Every distinct dependency list Bundler can produce: {digest: sorted deps}."""
+    from create_app.framework.bundler import Bundler
+    from create_app.initializer.venv_manager import deps_digest
+
+    engines = [f for f in const.FRAMEWORKS if f != "others"] + list(const.OTHERS_PROJECT_TYPES)
+    sets = {}
+    for fw in engines:
+        for strategy in const.PROJECT_MODES:
+            for db in const.DB_ENGINES:
+                for drf in ([False, True] if fw == "django" else [False]):
+                    ctx = {"fw_name": fw, "build_strategy": strategy, "database": db, "is_drf": drf}
+                    deps = sorted(Bundler(Path("."), ctx).ctx["dependencies"].split())
+                    sets[deps_digest(deps)] = deps
+    return sets
+
+
+class Wheelhouse:
+    def __init__(self, path):
+        self.path = Path(path).expanduser().resolve()
+        index_file = self.path / INDEX_NAME
+        self.index = json.loads(index_file.read_text(encoding="utf-8")) if index_file.exists() else {"sets": {}}
+
+    def _wheel_names(self) -> set:
+        return {_normalize(p.name.split("-")[0]) for p in self.path.glob("*.whl")}
+
+    def closure(self, deps: list):
+        """Indexed wheel files for this exact set, or None when the set was never built."""
+        from create_app.initializer.venv_manager import deps_digest
+        entry = self.index["sets"].get(deps_digest(deps))
+        return entry["wheels"] if entry and not entry.get("error") else None
+
+    def missing(self, deps: list) -> list:
+        """What an offline install of `deps` would miss (checked before any pip call)."""
+        if not self.path.is_dir():
+            return [f"wheelhouse directory {self.path}"]
+        wheels = self.closure(deps)
+        if wheels is not None:
+            return [w for w in wheels if not (self.path / w).exists()]
+        # Unindexed set: at least every top-level requirement needs a wheel
+        available = self._wheel_names()
+        return [d for d in deps if _normalize(d) not in available]
+
+    def install_command(self, pip_exe, deps: list) -> list:
+        """The pip invocation for an offline install; an indexed closure goes in as exact wheel files."""
+        base = [str(pip_exe), "install", "--no-index", "--no-cache-dir", "--disable-pip-version-check",
+                "--find-links", str(self.path)]
+        wheels = self.closure(deps)
+        if wheels is None:
+            return base + deps
+        return base + ["--no-deps", *[str(self.path / w) for w in wheels]]
+
+    # --- BUILD (online) ---
+
+    def build(self, sets: dict = None) -> dict:
+        """Builds/downloads wheels for every dependency set and writes the closure index."""
+        sets = sets if sets is not None else dependency_sets()
+        self.path.mkdir(parents=True, exist_ok=True)
+        index = {
+            "version": const.__version__,
+            "python": f"{sys.version_info.major}.{sys.version_info.minor}",
+            "platform": sys.platform,
+            "sets": {},
+        }
+        for digest, deps in sets.items():
+            logger.info(f"📥 Wheelhouse: building {len(deps)} requirements ({digest[:12]})")
+            proc = subprocess.run(
+                [sys.executable, "-m", "pip", "wheel", "--wheel-dir", str(self.path), *deps],
+                capture_output=True, text=True
+            )
+            wheels = sorted({Path(m.group(1)).name for m in map(_SAVED.search, proc.stdout.splitlines()) if m})
+            index["sets"][digest] = {"requirements": deps, "wheels": wheels}
+            if proc.returncode != 0:
+                # e.g. an sdist that needs system headers: keep going, the set stays unindexed
+                error = (proc.stderr.strip().splitlines() or ["pip wheel failed"])[-1]
+                index["sets"][digest]["error"] = error
+                logger.error(f"❌ Wheelhouse set {digest[:12]} failed: {error}")
+
+        (self.path / INDEX_NAME).write_text(json.dumps(index, indent=1), encoding="utf-8")
+        self.index = index
+        logger.info(f"📦 Wheelhouse index written: {len(index['sets'])} dependency sets.")
+        return index
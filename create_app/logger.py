@@ -1,11 +1,56 @@
+import atexit
 import logging
 import os
+import queue
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 # --- SETUP LOG DIRECTORY ---
+# One file per run (named by run id), created lazily on the first record,
+# so importing the package leaves no litter and concurrent runs never share a file;
+# only the newest KEEP_RUN_LOGS are kept
+RUN_ID = f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
 LOG_DIR = Path.cwd() / "logs"
-LOG_DIR.mkdir(exist_ok=True)
-LOG_FILE = LOG_DIR / "py-create.log"
+LOG_FILE = LOG_DIR / f"py-create-{RUN_ID}.log"
+KEEP_RUN_LOGS = 20  # Older run logs in the same directory are pruned when a new one opens
+
+class DeferredFileHandler(logging.FileHandler):
+    """FileHandler that only creates its directory and file when a record is emitted."""
+    def __init__(self, filename, encoding=None):
+        super().__init__(filename, encoding=encoding, delay=True)
+
+    def _open(self):
+        path = Path(self.baseFilename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stream = super()._open()
+        _prune_run_logs(path)
+        return stream
+
+def _prune_run_logs(current: Path, keep: int = KEEP_RUN_LOGS):
+    """Keeps the `keep` newest run logs next to `current` (which always survives)."""
+    try:
+        logs = sorted((p for p in current.parent.glob("py-create-*.log") if p != current),
+                      key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in logs[max(0, keep - 1):]:
+            old.unlink(missing_ok=True)
+    except OSError:
+        pass  # Another run pruning at the same time, or a read-only directory: never fail logging
+
+class RunQueueHandler(QueueHandler):
+    """
+    Render-path handler: only enqueues. The file is written by a QueueListener
+    thread, started on the first record (not at import).
+    """
+    def __init__(self, log_queue, start_listener):
+        super().__init__(log_queue)
+        self.start_listener = start_listener
+
+    def emit(self, record):
+        if self.start_listener:
+            _start_listener()
+        super().emit(record)
 
 class CustomLogger:
     def __init__(self):
@@ -14,13 +59,13 @@ class CustomLogger:
 
         # Prevent double logging if logger is already initialized
         if not self.logger.handlers:
-            # 1. File Handler (Detailed logs)
+            # 1. File Handler (Detailed logs), fed from the queue by the listener thread
             file_formatter = logging.Formatter(
-                '%(asctime)s | %(levelname)-8s | %(module)s:%(funcName)s | %(message)s'
+                '%(asctime)s | %(levelname)-8s | %(process)d | %(module)s:%(funcName)s | %(message)s'
             )
-            file_handler = logging.FileHandler(LOG_FILE, encoding='utf-8')
-            file_handler.setLevel(logging.DEBUG)
-            file_handler.setFormatter(file_formatter)
+            self.file_handler = DeferredFileHandler(LOG_FILE, encoding='utf-8')
+            self.file_handler.setLevel(logging.DEBUG)
+            self.file_handler.setFormatter(file_formatter)
 
             # 2. Console Handler (Brief logs for the dev)
             console_formatter = logging.Formatter('%(levelname)s: %(message)s')
@@ -28,12 +73,54 @@ class CustomLogger:
             console_handler.setLevel(logging.INFO) # Change to DEBUG to see everything
             console_handler.setFormatter(console_formatter)
 
-            self.logger.addHandler(file_handler)
+            self.logger.addHandler(RunQueueHandler(_QUEUE, start_listener=True))
             # Optional: Uncomment if you want raw logs in console alongside your UI
             # self.logger.addHandler(console_handler)
 
     def get_logger(self):
         return self.logger
 
+# --- QUEUE PLUMBING ---
+_QUEUE = queue.SimpleQueue()
+_LISTENERS = []
+_LISTENER_LOCK = threading.Lock()
+
+def _start_listener():
+    if _LISTENERS:
+        return
+    with _LISTENER_LOCK:
+        if not _LISTENERS:
+            _LISTENERS.append(listen(_QUEUE))
+
+def listen(log_queue) -> QueueListener:
+    """Starts a listener draining `log_queue` into this run's log file (e.g. a pool's multiprocessing queue)."""
+    listener = QueueListener(log_queue, _FILE_HANDLER, respect_handler_level=True)
+    listener.start()
+    return listener
+
+def forward_to(log_queue):
+    """Worker processes: send records to the parent's queue instead of writing a file of their own."""
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    logger.addHandler(RunQueueHandler(log_queue, start_listener=False))
+
+def stop_logging():
+    """Flushes pending records and stops the listener thread (registered at exit)."""
+    while _LISTENERS:
+        _LISTENERS.pop().stop()
+    _FILE_HANDLER.close()
+
+def set_log_level(level: str):
+    """Drops records below `level` at the logger, before they are even formatted or queued."""
+    logger.setLevel(getattr(logging, str(level).upper()))
+
+def set_file_logging(enabled: bool):
+    """Mutes (or restores) the log file, e.g. for --plan dry runs that must not touch disk."""
+    _FILE_HANDLER.setLevel(logging.DEBUG if enabled else logging.CRITICAL + 1)
+
 # Global Instance
-logger = CustomLogger().get_logger()
\ No newline at end of file
+_CUSTOM = CustomLogger()
+logger = _CUSTOM.get_logger()
+_FILE_HANDLER = getattr(_CUSTOM, "file_handler", None) or DeferredFileHandler(LOG_FILE, encoding='utf-8')
+atexit.register(stop_logging)
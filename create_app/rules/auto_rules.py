@@ -6,6 +6,7 @@ import create_app.constants as const
 # 🟢 Using your existing Generator/Bundler logic
 from create_app.initializer.generator import Generator
 from create_app.framework.bundler import Bundler
+from create_app.framework.planner import compile_plan
 from create_app.logger import logger
 
 def generate_auto(project_root: Path, context: dict):
@@ -31,11 +32,7 @@ def generate_auto(project_root: Path, context: dict):
     worker = Generator(project_root, build_data['ctx'])
     blueprint = build_data['blueprint']
 
-    # 3. Create Physical Architecture (Folders & Packages)
-    # worker.run handles the folder creation and __init__.py logic
-    worker.run(blueprint=blueprint, manifest_rules=[])
-
-    # 4. AUTO-INJECT ALL SUITES
+    # 3. AUTO-INJECT ALL SUITES
     # We compile a massive manifest of every single asset defined in constants.py
     auto_manifest = []
     
@@ -73,17 +70,16 @@ def generate_auto(project_root: Path, context: dict):
                 "target": target_path
             })
 
-    # 5. Framework Entry Point Logic
+    # 4. Framework Entry Point Logic
     if fw_slug != "django":
         # Ensure a main entry point exists for non-Django projects
         auto_manifest.append({"source": "app.py.tpl", "target": "app.py"})
         # Sync dependencies list for requirements.txt
         auto_manifest.append({"source": "requirements.txt.tpl", "target": "requirements.txt"})
 
-    # 6. Execute Physical Generation
-    # We leverage the worker's internal rendering engine to process the auto-manifest
+    # 5. Execute Physical Generation
+    # Folders, packages and the auto-manifest compile into one deduplicated plan
     logger.info(f"📦 Auto-Injecting {len(auto_manifest)} infrastructure files...")
-    for rule in auto_manifest:
-        worker._render_and_write(rule["source"], rule["target"])
+    worker.run(compile_plan(build_data['ctx'], blueprint, auto_manifest))
 
     return project_root
\ No newline at end of file
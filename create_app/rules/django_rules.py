@@ -1,6 +1,11 @@
 """
-DJANGO ENTERPRISE PATCH RULESET (v0.6.5)
+DJANGO ENTERPRISE PATCH RULESET (v0.7.0)
 Centralized Template Mapping: Points to create_app/common/
+Patches are declarative and consumed by SettingsPatcher (one parse, one splice pass):
+  import -> ensure `import <module>` at top level
+  assign -> top-level assignments from a template; 'when': literal (replace hardcoded
+            values), missing (add only if absent) or always
+  list   -> ensure every item (template entries + ctx[items_from]) is in a top-level list
 """
 
 DJANGO_PATCH_RULES = {
@@ -19,14 +24,10 @@ DJANGO_PATCH_RULES = {
             "middleware"
         ],
         "patches": [
-            {
-                "target": "settings.py",
-                "template": "app.py.tpl", # Maps to common/app.py.tpl
-            },
-            {
-                "target": "urls.py",
-                "template": "urls.tpl",    # Maps to common/urls.tpl
-            }
+            {"name": "utility-imports", "file": "settings.py", "kind": "import", "module": "os"},
+            {"name": "secret-from-env", "file": "settings.py", "kind": "assign", "template": "secret.tpl", "when": "literal"},
+            {"name": "installed-apps", "file": "settings.py", "kind": "list", "target": "INSTALLED_APPS",
+             "items_from": "django_apps"},
         ]
     },
     "drf": {
@@ -50,16 +51,50 @@ DJANGO_PATCH_RULES = {
             "api/urls.py"
         ],
         "patches": [
-            {
-                "target": "settings.py",
-                "template_secret": "secret.tpl",
-                "template_apps": "app.py.tpl",
-                "template_rest": "rf.py.tpl",
-            },
-            {
-                "target": "urls.py",
-                "template": "urls.tpl",
-            }
+            {"name": "utility-imports", "file": "settings.py", "kind": "import", "module": "os"},
+            {"name": "secret-from-env", "file": "settings.py", "kind": "assign", "template": "secret.tpl", "when": "literal"},
+            {"name": "installed-apps", "file": "settings.py", "kind": "list", "target": "INSTALLED_APPS",
+             "template": "apps.py.tpl", "items_from": "django_apps"},
+            {"name": "rest-framework", "file": "settings.py", "kind": "assign", "template": "rf.py.tpl", "when": "missing"},
         ]
     }
-}
\ No newline at end of file
+}
+
+
+# ✅ In-process bootstrap: startproject/startapp equivalents rendered by the Generator
+DJANGO_PROJECT_FILES = {
+    "manage.py.tpl":   "manage.py",
+    "settings.py.tpl": "{project}/settings.py",
+    "urls.py.tpl":     "{project}/urls.py",
+    "asgi.py.tpl":     "{project}/asgi.py",
+    "wsgi.py.tpl":     "{project}/wsgi.py",
+}
+
+DJANGO_APP_FILES = {
+    "admin.py.tpl":  "{app}/admin.py",
+    "apps.py.tpl":   "{app}/apps.py",
+    "models.py.tpl": "{app}/models.py",
+    "tests.py.tpl":  "{app}/tests.py",
+    "views.py.tpl":  "{app}/views.py",
+}
+
+def get_django_manifest(context: dict):
+    """
+    Returns (packages, rules) for the Django project package and every app.
+    App rules carry a per-app 'context' ({'app_label': name}) layered over ctx.
+    """
+    project = context.get("project_name", "new_project")
+    apps = context.get("django_apps") or [context.get("app_name", "core_app")]
+
+    packages = [project]
+    rules = [
+        {"source": f"common/django/project/{tpl}", "target": target.format(project=project)}
+        for tpl, target in DJANGO_PROJECT_FILES.items()
+    ]
+    for app in apps:
+        packages += [app, f"{app}/migrations"]
+        rules += [
+            {"source": f"common/django/app/{tpl}", "target": target.format(app=app), "context": {"app_label": app}}
+            for tpl, target in DJANGO_APP_FILES.items()
+        ]
+    return packages, rules
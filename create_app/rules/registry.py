@@ -0,0 +1,75 @@
+"""
+BLUEPRINT REGISTRY (v1.0.0)
+The rule modules compiled once, at import, into frozen blueprint records.
+FEATURE: Records are read-only mappings with tuple values (deeply frozen), keyed by
+(framework, strategy tier, drf). Lookups are one dict probe and allocate nothing;
+records are safe to share across threads, batch workers and server requests.
+FEATURE: Copy-on-write: derive() returns a new record with some fields replaced,
+the registry copy is never touched (no more rule tables growing between projects).
+"""
+from types import MappingProxyType
+
+from create_app.rules.standard_rules import STANDARD_BLUEPRINT
+from create_app.rules.production_rules import PROD_WEB_RULES
+from create_app.rules.django_rules import DJANGO_PATCH_RULES
+from create_app.rules.others_rules import OTHERS_RULES
+
+# Strategy tiers: which rule table a build strategy reads from
+STANDARD = "standard"
+PRODUCTION = "production"
+ANY = "any"  # Django and the specialized stacks ignore the strategy
+PRODUCTION_STRATEGIES = frozenset({"production", "auto_config"})
+
+# Every record has these, even when the rule table leaves them out
+FIELDS = ("packages", "folders")
+
+
+def freeze(value):
+    """Rule data -> immutable equivalent (dict -> mappingproxy, list -> tuple)."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _record(rules: dict) -> MappingProxyType:
+    return freeze({**{field: () for field in FIELDS}, **rules})
+
+
+def derive(blueprint, **changes) -> MappingProxyType:
+    """Copy-on-write: a new frozen record with some fields replaced."""
+    return MappingProxyType({**blueprint, **{k: freeze(v) for k, v in changes.items()}})
+
+
+def _compile():
+    registry, display = {}, {}
+    for tier, table in ((STANDARD, STANDARD_BLUEPRINT), (PRODUCTION, PROD_WEB_RULES)):
+        for name, rules in table.items():
+            display[name.lower()] = name  # Precomputed capitalization map ('fastapi' -> 'FastAPI')
+            registry[(name.lower(), tier, False)] = _record(rules)
+    for name, rules in OTHERS_RULES.items():
+        registry[(name, ANY, False)] = _record(rules)
+    for mode, rules in DJANGO_PATCH_RULES.items():
+        registry[("django", ANY, mode == "drf")] = _record(rules)
+    display["django"] = "Django"
+    return MappingProxyType(registry), MappingProxyType(display)
+
+
+BLUEPRINTS, DISPLAY_NAMES = _compile()
+
+
+def blueprint_key(fw_name: str, strategy: str = STANDARD, is_drf: bool = False) -> tuple:
+    """Normalizes a build's (framework, strategy, drf) to a registry key."""
+    fw = str(fw_name).lower()
+    if "django" in fw:
+        return ("django", ANY, bool(is_drf))
+    if (fw, ANY, False) in BLUEPRINTS:
+        return (fw, ANY, False)
+    return (fw, PRODUCTION if strategy in PRODUCTION_STRATEGIES else STANDARD, False)
+
+
+def lookup(fw_name: str, strategy: str = STANDARD, is_drf: bool = False) -> MappingProxyType:
+    """The frozen blueprint for a build; unknown web frameworks get the tier's FastAPI layout."""
+    key = blueprint_key(fw_name, strategy, is_drf)
+    return BLUEPRINTS.get(key) or BLUEPRINTS[("fastapi", key[1], False)]
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import time
+
+# --- BUILD TRACING ---
+# Spans (name, category, start/end, bytes, template) recorded across the build
+# when --profile / --trace is on. Off by default: span() then returns a shared
+# no-op context, so instrumented hot paths cost one global lookup.
+
+_TRACER = None
+
+
+class Tracer:
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, cat: str, start: float, end: float, args: dict):
+        entry = {"name": name, "cat": cat, "start": start - self.origin, "dur": end - start,
+                 "tid": threading.get_ident(), "thread": threading.current_thread().name, "args": args}
+        with self._lock:
+            self.spans.append(entry)
+
+    def top(self, n: int = 15, cat: str = None) -> list:
+        """Slowest spans first (optionally one category)."""
+        spans = [s for s in self.spans if cat is None or s["cat"] == cat]
+        return sorted(spans, key=lambda s: s["dur"], reverse=True)[:n]
+
+    def totals(self) -> dict:
+        """category -> {count, seconds, bytes}"""
+        out = {}
+        for s in self.spans:
+            bucket = out.setdefault(s["cat"], {"count": 0, "seconds": 0.0, "bytes": 0})
+            bucket["count"] += 1
+            bucket["seconds"] += s["dur"]
+            bucket["bytes"] += s["args"].get("bytes", 0) or 0
+        return out
+
+    def chrome_trace(self) -> dict:
+        """Chrome trace-event format ('X' complete events), for chrome://tracing or Perfetto."""
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+                  for tid, name in {s["tid"]: s["thread"] for s in self.spans}.items()]
+        events += [{
+            "name": s["name"], "cat": s["cat"], "ph": "X", "pid": pid, "tid": s["tid"],
+            "ts": round(s["start"] * 1e6, 3), "dur": round(s["dur"] * 1e6, 3), "args": s["args"],
+        } for s in self.spans]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome(self, path):
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(self.chrome_trace(), handle)
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str, args: dict):
+        self.tracer, self.name, self.cat, self.args = tracer, name, cat, args
+
+    def __enter__(self) -> dict:
+        self.start = time.perf_counter()
+        return self.args  # Callers add results, e.g. info["bytes"] = len(data)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type:
+            self.args["error"] = str(exc)
+        self.tracer.record(self.name, self.cat, self.start, time.perf_counter(), self.args)
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> dict:
+        return {}  # Private per use: writer-pool threads and server builds run spans concurrently
+
+    def __exit__(self, exc_type, exc, tb):
+        return None
+
+
+_NULL = _NullSpan()
+
+
+def span(name: str, cat: str = "phase", **args):
+    """Context manager timing one unit of work; a no-op unless tracing is on."""
+    tracer = _TRACER
+    if tracer is None:
+        return _NULL
+    return _Span(tracer, name, cat, args)
+
+
+def start_tracing() -> Tracer:
+    global _TRACER
+    _TRACER = Tracer()
+    return _TRACER
+
+
+def stop_tracing() -> Tracer:
+    global _TRACER
+    tracer, _TRACER = _TRACER, None
+    return tracer
+
+
+def format_report(tracer: Tracer, n: int = 15) -> str:
+    """Plain-text top-N table plus per-category totals."""
+    lines = [f"{'SPAN'.ljust(44)} {'KIND'.ljust(9)} {'TIME'.rjust(10)} {'BYTES'.rjust(9)}  TEMPLATE"]
+    for s in tracer.top(n):
+        size = s["args"].get("bytes")
+        lines.append(
+            f"{s['name'][-44:].ljust(44)} {s['cat'][:9].ljust(9)} {s['dur'] * 1000:8.2f}ms "
+            f"{(str(size) if size is not None else '-').rjust(9)}  {s['args'].get('template', '')}"
+        )
+    lines.append("")
+    for cat, t in sorted(tracer.totals().items(), key=lambda kv: kv[1]["seconds"], reverse=True):
+        lines.append(f"{cat.ljust(10)} {t['count']:5d} spans {t['seconds'] * 1000:10.2f}ms {t['bytes']:10d} bytes")
+    return "\n".join(lines)
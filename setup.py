@@ -4,6 +4,7 @@ import sys
 from setuptools import setup, find_packages
 from setuptools.command.install import install
 from setuptools.command.develop import develop 
+from setuptools.command.build_py import build_py
 
 ORANGE = "\033[38;5;208m"
 WHITE = "\033[1;37m"
@@ -48,6 +49,19 @@ class PremiumDevelop(develop):
         show_premium_ui()
         develop.run(self)
 
+class PrecompiledBuild(build_py):
+    """Ships create_app/common precompiled for jinja2.ModuleLoader, a template index and the pre-rendered banner."""
+    def run(self):
+        build_py.run(self)
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from create_app.logger import set_file_logging
+        set_file_logging(False)  # A wheel build leaves no logs/ run file behind
+        from create_app.initializer.templating import precompile
+        from create_app.engine.ui.banner import build_banner_module
+        precompile(os.path.join(self.build_lib, "create_app", "_compiled"))
+        if not build_banner_module(os.path.join(self.build_lib, "create_app", "engine", "ui", "_banner.py")):
+            print("pyfiglet not available: shipping the checked-in _banner.py")
+
 setup(
     name="init-app",
     version="1.0.0", # Updated to match pyproject.toml
@@ -60,9 +74,11 @@ setup(
         'python-dotenv>=1.2.1',
         'jinja2>=3.1.0'  # Added to fix your error
     ],
+    extras_require={'batch': ['pyyaml>=6.0']},
     entry_points={'console_scripts': ['init-app=create_app.engine.cli:main']},
     cmdclass={
         'install': PremiumInstall,
         'develop': PremiumDevelop,
+        'build_py': PrecompiledBuild,
     },
 )
\ No newline at end of file
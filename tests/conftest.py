@@ -0,0 +1,53 @@
+import pytest
+from unittest.mock import patch
+from create_app import logger as run_log
+from create_app.cache import CACHE_ENV_VAR
+from create_app.initializer import asset_store, templating
+from create_app.initializer.controller import Controller
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache(tmp_path_factory):
+    """One throwaway user cache for the whole run: bytecode, asset store and venv templates never reach ~/.cache."""
+    root = tmp_path_factory.mktemp("init-app-cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(CACHE_ENV_VAR, str(root))
+        # Anything resolved before the override (Environments, the shared store) is rebuilt lazily
+        mp.setattr(templating, "_ENVIRONMENTS", {})
+        mp.setattr(asset_store, "_STORE", None)
+        yield root
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_run_log(tmp_path_factory):
+    """The per-run log file goes to a temp dir, not CWD/logs."""
+    path = tmp_path_factory.mktemp("logs") / run_log.LOG_FILE.name
+    run_log.stop_logging()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(run_log._FILE_HANDLER, "baseFilename", str(path))
+        yield path
+        run_log.stop_logging()  # Flushed and closed before the path is restored
+
+@pytest.fixture
+def project_manifest():
+    """Headless-CLI manifest for a single-framework build (no venv unless asked)."""
+    def _create(name, fw="fastapi", strategy="production", **extra):
+        return {
+            "project name": name,
+            "core blueprint": f"{fw} (default)",
+            "fw_name": fw,
+            "build strategy": strategy,
+            "venv_enabled": False,
+            **extra,
+        }
+    return _create
+
+@pytest.fixture
+def build_project(tmp_path):
+    """Runs one quiet Controller mission (system check stubbed) and returns the Controller."""
+    def _build(manifest, folders=("docs",), base_dir=None, **controller_kwargs):
+        with patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+            mock_check.return_value = {"status": True, "errors": []}
+            ctrl = Controller(dict(manifest), list(folders), base_dir=base_dir or tmp_path, quiet=True,
+                              **controller_kwargs)
+            assert ctrl.run_mission(), ctrl.error
+        return ctrl
+    return _build
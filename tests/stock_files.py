@@ -0,0 +1,20 @@
+"""Stock inputs shared by the tests and benchmarks/cases.py."""
+
+# Trimmed `django-admin startproject` output
+STOCK_SETTINGS = '''from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SECRET_KEY = 'django-insecure-abc'
+
+DEBUG = True
+
+ALLOWED_HOSTS = []
+
+INSTALLED_APPS = [
+    'django.contrib.admin',
+    'django.contrib.staticfiles'
+]
+
+STATIC_URL = 'static/'
+'''
@@ -0,0 +1,75 @@
+import errno
+import os
+import pytest
+from create_app import fileclone
+from create_app.framework.planner import BuildPlan, COPY
+from create_app.initializer.asset_store import AssetStore, resolve_asset_mode
+from create_app.initializer.generator import Generator
+from create_app.initializer.sinks import DiskSink
+
+ASSET = "common/static/css/style.css.tpl"  # Any shipped file works as a verbatim copy
+
+@pytest.fixture
+def pack(tmp_path):
+    src = tmp_path / "pack" / "logo.png"
+    src.parent.mkdir()
+    src.write_bytes(os.urandom(4096))
+    return src
+
+def _build(root, mode, store):
+    plan = BuildPlan()
+    plan.add(ASSET, "ui/static/css/style.css", COPY)
+    worker = Generator(root, {}, sink=DiskSink(root, assets=mode, store=store))
+    worker.run(plan)
+    return worker
+
+def test_link_mode_shares_one_store_blob(tmp_path):
+    store = AssetStore(tmp_path / "store")
+    first, second = (_build(tmp_path / name, "link", store) for name in ("a", "b"))
+    a, b = (tmp_path / name / "ui/static/css/style.css" for name in ("a", "b"))
+
+    assert os.path.samefile(a, b)
+    assert a.read_bytes() == (first.base_dir / ASSET).read_bytes()
+    assert first.stats["asset_bytes"] == second.stats["asset_bytes"] == 0
+    assert store.stored_bytes == a.stat().st_size  # Stored once
+    assert a.stat().st_mode & 0o222 == 0  # Read-only blob
+
+def test_copy_mode_never_touches_the_store(tmp_path):
+    store = AssetStore(tmp_path / "store")
+    worker = _build(tmp_path / "a", "copy", store)
+    assert worker.stats["asset_bytes"] > 0
+    assert not (tmp_path / "store").exists()
+
+@pytest.mark.parametrize("mode, call", [("link", "link"), ("reflink", "reflink")])
+def test_exdev_falls_back_to_copy_for_the_rest_of_the_build(tmp_path, pack, monkeypatch, mode, call):
+    calls = []
+    def refuse(*args):
+        calls.append(args)
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    monkeypatch.setattr(fileclone.os if call == "link" else fileclone, call, refuse)
+    sink = DiskSink(tmp_path / "site", assets=mode, store=AssetStore(tmp_path / "store"))
+
+    assert sink.copy(pack, "static/logo.png") == 4096
+    assert sink.copy(pack, "static/again.png") == 4096
+    assert sink.assets == "copy" and len(calls) == 1
+    target = tmp_path / "site" / "static" / "logo.png"
+    assert target.read_bytes() == pack.read_bytes() and os.access(target, os.W_OK)
+
+def test_rewriting_a_linked_asset_detaches_it_first(tmp_path, pack):
+    store = AssetStore(tmp_path / "store")
+    DiskSink(tmp_path / "site", assets="link", store=store).copy(pack, "logo.png")
+    blob = store.ingest(pack)
+    original = blob.read_bytes()
+
+    pack.write_bytes(b"new artwork")
+    DiskSink(tmp_path / "site", assets="copy", store=store).copy(pack, "logo.png")
+    assert (tmp_path / "site" / "logo.png").read_bytes() == b"new artwork"
+    assert blob.read_bytes() == original
+
+def test_asset_mode_resolution(monkeypatch):
+    monkeypatch.delenv("INIT_APP_ASSETS", raising=False)
+    assert resolve_asset_mode(None) == "copy"
+    monkeypatch.setenv("INIT_APP_ASSETS", "link")
+    assert resolve_asset_mode(None) == "link" and resolve_asset_mode("reflink") == "reflink"
+    with pytest.raises(ValueError):
+        resolve_asset_mode("symlink")
@@ -0,0 +1,54 @@
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+from create_app.initializer.batch import BatchRunner, load_specs
+
+BATCH_SPECS = [
+    {"project name": "svc_fastapi", "fw_name": "fastapi", "build strategy": "standard"},
+    {"project name": "svc_flask", "fw_name": "flask", "build strategy": "production"},
+    {"project name": "svc_bottle", "fw_name": "bottle", "build strategy": "standard"},
+]
+
+def test_load_specs_merges_defaults(tmp_path):
+    spec_file = tmp_path / "specs.json"
+    spec_file.write_text(json.dumps({
+        "defaults": {"venv_enabled": False, "build strategy": "production"},
+        "projects": [{"project name": "a", "fw_name": "fastapi"}, {"project name": "b", "build strategy": "standard"}]
+    }))
+    specs = load_specs(spec_file)
+
+    assert specs[0]["venv_enabled"] is False
+    assert specs[0]["build strategy"] == "production"
+    assert specs[1]["build strategy"] == "standard"
+
+def test_batch_runs_fleet_in_one_process(tmp_path):
+    specs = [{**s, "venv_enabled": False} for s in BATCH_SPECS]
+
+    with patch("subprocess.run"), \
+         patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        results = BatchRunner(specs, base_dir=tmp_path).run()
+
+    # One prerequisite check for the whole fleet
+    assert mock_check.call_count == 1
+    assert [r["status"] for r in results] == ["ok"] * len(specs)
+    for spec in specs:
+        assert (tmp_path / spec["project name"] / "app.py").exists()
+
+def test_batch_rejects_path_like_project_names(tmp_path):
+    specs = [{"project name": "../outside", "venv_enabled": False}, {"project name": "ok.svc", "venv_enabled": False}]
+    with patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        results = BatchRunner(specs, base_dir=tmp_path / "fleet").run()
+
+    assert [r["status"] for r in results] == ["failed", "ok"]
+    assert "Invalid project name" in results[0]["error"]
+    assert not (tmp_path / "outside").exists()
+
+def test_parallel_batch_stops_the_log_listener_on_interrupt(tmp_path):
+    listener = MagicMock()
+    with patch("create_app.initializer.batch.listen", return_value=listener), \
+         patch("create_app.initializer.batch.ProcessPoolExecutor", side_effect=KeyboardInterrupt), \
+         pytest.raises(KeyboardInterrupt):
+        BatchRunner(BATCH_SPECS, base_dir=tmp_path, jobs=2)._run_parallel()
+    listener.stop.assert_called_once()
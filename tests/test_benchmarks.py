@@ -0,0 +1,40 @@
+from benchmarks.run import compare, measure
+from create_app.cache import cache_root
+
+BASELINE = {"results": {
+    "generate.fastapi.production": {"wall_s": 0.100, "peak_kb": 4000.0, "files_per_s": 300.0},
+    "bundler.init x200": {"wall_s": 0.002, "peak_kb": 5.0, "files_per_s": None},
+}}
+
+def _current(**overrides):
+    base = dict(BASELINE["results"]["generate.fastapi.production"], **overrides)
+    return {"results": {"generate.fastapi.production": base, "bundler.init x200": {"wall_s": 0.004, "peak_kb": 5.0}}}
+
+def test_compare_flags_only_real_regressions():
+    assert compare(_current(), BASELINE, 0.25) == []
+    # Slower wall time and fewer files/sec are both regressions
+    assert len(compare(_current(wall_s=0.140, files_per_s=200.0), BASELINE, 0.25)) == 2
+    # +10% is inside the threshold; the 2ms bundler case doubling is below the noise floor
+    assert compare(_current(wall_s=0.110), BASELINE, 0.25) == []
+
+def test_measure_reports_files_per_second(tmp_path):
+    def factory(workdir):
+        def run():
+            for i in range(3):
+                (workdir / f"f{i}").write_text("x")
+            return 3
+        return run
+
+    result = measure(factory, repeat=2, root=tmp_path)
+    assert result["files"] == 3 and result["files_per_s"] > 0 and result["peak_kb"] is not None
+
+def test_cases_run_against_a_private_cache(monkeypatch, isolated_cache):
+    from benchmarks import cases
+    from benchmarks.run import run_cases
+    seen = []
+    monkeypatch.setitem(cases.CASES, "cache.probe", lambda workdir: lambda: seen.append(cache_root()))
+    monkeypatch.setitem(cases.MEMORY, "cache.probe", False)
+
+    run_cases(["cache.probe"], repeat=1)
+    assert seen and all(p.name == "cache" and "init-app-bench-" in str(p) for p in seen)
+    assert cache_root() == isolated_cache  # Restored afterwards
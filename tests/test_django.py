@@ -0,0 +1,63 @@
+import ast
+import pytest
+from unittest.mock import patch
+
+def _manifest(drf=False, apps="blog, shop"):
+    return {
+        "project name": "mysite",
+        "core blueprint": "Django + Rest Framework" if drf else "Django (Standard)",
+        "build strategy": "standard",
+        "apps": apps,
+        "venv_enabled": False,
+    }
+
+@pytest.fixture
+def build_site(build_project, tmp_path):
+    def _build(manifest):
+        with patch("subprocess.run") as mock_run:
+            build_project(manifest)
+        # Bootstrap happens in-process: no django-admin / manage.py subprocess
+        mock_run.assert_not_called()
+        return tmp_path / "mysite"
+    return _build
+
+def _installed_apps(settings: str) -> list:
+    for node in ast.parse(settings).body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == "INSTALLED_APPS":
+            return [elt.value for elt in node.value.elts]
+
+def test_project_and_every_app_rendered(build_site):
+    root = build_site(_manifest())
+
+    for rel in ["manage.py", "mysite/__init__.py", "mysite/settings.py", "mysite/urls.py", "mysite/asgi.py", "mysite/wsgi.py"]:
+        assert (root / rel).is_file(), rel
+    for app in ["blog", "shop"]:
+        for rel in ["__init__.py", "apps.py", "models.py", "views.py", "admin.py", "tests.py", "migrations/__init__.py"]:
+            assert (root / app / rel).is_file(), f"{app}/{rel}"
+    assert "class ShopConfig(AppConfig)" in (root / "shop" / "apps.py").read_text()
+    assert "name = 'shop'" in (root / "shop" / "apps.py").read_text()
+    # The first app is the primary one (SSR templates land there)
+    assert (root / "blog" / "templates" / "index.html").is_file()
+
+def test_settings_patched_in_one_pass(build_site):
+    root = build_site(_manifest(drf=True, apps="none"))
+    settings = (root / "mysite" / "settings.py").read_text()
+
+    apps = _installed_apps(settings)
+    assert apps[-4:] == ["django_extensions", "django_filters", "rest_framework", "core_app"]
+    assert len(apps) == len(set(apps))
+    assert "import os" in settings and 'os.environ.get("SECRET_KEY")' in settings
+    assert settings.count("REST_FRAMEWORK =") == 1
+    ast.parse((root / "mysite" / "urls.py").read_text())
+
+def test_edited_settings_kept_and_merged(build_site):
+    root = build_site(_manifest())
+    settings = root / "mysite" / "settings.py"
+    settings.write_text(settings.read_text() + "\nCUSTOM_FLAG = True\n")
+
+    root = build_site(_manifest(apps="blog, shop, cart"))
+    patched = settings.read_text()
+
+    assert "CUSTOM_FLAG = True" in patched
+    assert _installed_apps(patched)[-3:] == ["blog", "shop", "cart"]
+    assert (root / "cart" / "apps.py").is_file()
@@ -77,6 +77,45 @@ def test_controller_mission_orchestration(fw, bp, strategy, tmp_path, mock_manif
         except Exception as e:
             pytest.fail(f"💥 Mission failed for {fw}/{strategy}: {e}")
 
+@pytest.mark.parametrize("fw, bp, strategy", TEST_MATRIX)
+def test_every_planned_file_written_once(fw, bp, strategy, tmp_path, mock_manifest):
+    """
+    DEDUP TEST: The compiled plan is the only source of writes, and no target is written twice.
+    """
+    with patch("subprocess.run"), \
+         patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        ctrl = Controller(mock_manifest(fw, bp, strategy), ["docs"], base_dir=tmp_path, quiet=True)
+        assert ctrl.run_mission()
+
+    planned_files = {op["target"] for op in ctrl.plan if op["mode"] != "mkdir"}
+    writes = ctrl.worker.writes
+
+    assert set(writes) == planned_files
+    assert max(writes.values()) == 1, [t for t, n in writes.items() if n > 1]
+    # UI assets land in exactly one folder
+    assert len([t for t in writes if t.endswith("index.html")]) == 1
+
+@pytest.mark.parametrize("fw, bp, strategy", TEST_MATRIX)
+def test_matrix_in_memory(fw, bp, strategy, tmp_path, mock_manifest):
+    """
+    SINK TEST: The whole matrix builds into a MemorySink without touching the filesystem.
+    """
+    from create_app.initializer.sinks import MemorySink
+
+    sink = MemorySink()
+    with patch("subprocess.run") as mock_run, \
+         patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        ctrl = Controller(mock_manifest(fw, bp, strategy), ["docs"], base_dir=tmp_path, quiet=True, sink=sink)
+        assert ctrl.run_mission()
+
+    mock_run.assert_not_called()  # No venv for in-memory builds
+    assert list(tmp_path.iterdir()) == []
+    assert set(sink.files) == {op["target"] for op in ctrl.plan if op["mode"] != "mkdir"}
+    entry = "manage.py" if fw == "django" else "app.py"
+    assert sink.files[entry].strip()
+
 def test_bundler_dependency_resolution(mock_manifest):
     from create_app.framework.bundler import Bundler
     manifest = mock_manifest("django", "Django + Rest Framework", "standard")
@@ -84,4 +123,26 @@ def test_bundler_dependency_resolution(mock_manifest):
     deps = bundler.ctx.get("dependencies", "").lower()
 
     assert "django" in deps
-    assert "djangorestframework" in deps
\ No newline at end of file
+    assert "djangorestframework" in deps
+
+def test_matrix_parallel_sweep(tmp_path, mock_manifest):
+    """
+    SWEEP TEST: Runs the framework x strategy matrix through the --jobs process pool.
+    """
+    from create_app.initializer.batch import BatchRunner
+
+    specs = []
+    for i, (fw, bp, strategy) in enumerate(TEST_MATRIX):
+        spec = mock_manifest(fw, bp, strategy)
+        spec.update({"project name": f"matrix_{i}_{fw}", "venv_enabled": False})
+        specs.append(spec)
+
+    with patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        results = BatchRunner(specs, base_dir=tmp_path, jobs=2).run()
+
+    assert [r["status"] for r in results] == ["ok"] * len(specs), results
+    for spec, result in zip(specs, results):
+        assert "generate" in result["phases"]
+        entry = "manage.py" if spec["framework"] == "django" else "app.py"
+        assert (tmp_path / spec["project name"] / entry).exists()
@@ -0,0 +1,90 @@
+import errno
+import json
+import logging
+import os
+import pytest
+from create_app import fileclone
+from create_app.framework.planner import BuildPlan, COPY
+from create_app.initializer.asset_store import AssetStore
+from create_app.initializer.generator import Generator
+from create_app.initializer.lockfile import LOCK_NAME
+from create_app.initializer.sinks import DiskSink
+
+@pytest.fixture
+def build_pooled(build_project, project_manifest, tmp_path):
+    def _build(name, io_workers, sink=None, strategy="auto_config"):
+        return build_project(project_manifest("pooled", strategy=strategy), base_dir=tmp_path / name,
+                             io_workers=io_workers, sink=sink)
+    return _build
+
+def _tree(root):
+    return {p.relative_to(root).as_posix(): p.read_bytes() for p in sorted(root.rglob("*"))
+            if p.is_file() and p.name != LOCK_NAME}
+
+def _lock(root):
+    entries = json.loads((root / LOCK_NAME).read_text())["files"]
+    return {target: (e["template"], e["context"], e["output"]) for target, e in entries.items()}
+
+def test_pooled_build_matches_inline_build(build_pooled):
+    inline = build_pooled("inline", 1)
+    pooled = build_pooled("pooled", 4)
+
+    assert _tree(pooled.root) == _tree(inline.root)
+    assert pooled.worker.stats == inline.worker.stats
+    assert pooled.worker.writes == inline.worker.writes
+    assert _lock(pooled.root) == _lock(inline.root)
+
+class _FlakyDisk(DiskSink):
+    """First write of app.py fails (e.g. EIO); later writes go through."""
+    failed = False
+
+    def write_stream(self, rel, chunks):
+        if rel == "app.py" and not self.failed:
+            self.failed = True
+            raise OSError(5, "Input/output error")
+        return super().write_stream(rel, chunks)
+
+def test_pooled_write_failure_keeps_the_empty_fallback(build_pooled, tmp_path):
+    ctrl = build_pooled("flaky", 4, sink=_FlakyDisk(tmp_path / "flaky" / "pooled"), strategy="production")
+
+    assert (ctrl.root / "app.py").read_bytes() == b""
+    assert ctrl.worker.stats["errors"] == 1 and ctrl.worker.stats["fallbacks"] == 1
+    assert ctrl.worker.writes["app.py"] == 1
+    assert "app.py" not in _lock(ctrl.root)
+
+@pytest.fixture
+def asset_plan(tmp_path):
+    """40 COPY ops over 4 distinct files, so writer threads ingest the same blobs concurrently."""
+    pack = tmp_path / "pack"
+    pack.mkdir()
+    plan = BuildPlan()
+    for i in range(4):
+        (pack / f"img{i}.png").write_bytes(os.urandom(4096 * (i + 1)))
+    for i in range(40):
+        plan.add(str(pack / f"img{i % 4}.png"), f"static/{i}.png", COPY)
+    return plan
+
+def _copy_pooled(plan, sink):
+    worker = Generator(sink.root, {}, sink=sink, io_workers=4)
+    worker.run(plan)
+    return worker
+
+def test_pooled_asset_links_count_each_blob_once(tmp_path, asset_plan):
+    store = AssetStore(tmp_path / "store")
+    worker = _copy_pooled(asset_plan, DiskSink(tmp_path / "site", assets="link", store=store))
+
+    blobs = [p for p in store.root.rglob("*") if p.is_file()]
+    assert worker.stats["copied"] == 40 and len(blobs) == 4
+    assert store.stored_bytes == sum(p.stat().st_size for p in blobs)
+
+def test_pooled_link_fallback_switches_mode_once(tmp_path, asset_plan, monkeypatch, caplog):
+    def refuse(*args):
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+    monkeypatch.setattr(fileclone.os, "link", refuse)
+    caplog.set_level(logging.INFO, logger="py_create")
+    sink = DiskSink(tmp_path / "site", assets="link", store=AssetStore(tmp_path / "store"))
+    worker = _copy_pooled(asset_plan, sink)
+
+    assert sink.assets == "copy" and worker.stats["copied"] == 40
+    assert sum("falling back to copy" in r.getMessage() for r in caplog.records) == 1
+    assert all(os.access(sink.root / target, os.W_OK) for target in worker.writes)
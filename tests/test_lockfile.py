@@ -0,0 +1,44 @@
+import json
+import pytest
+from create_app.initializer.lockfile import LOCK_NAME
+
+INFRA = {"docker": ["docker/Dockerfile"], "github": ["main.yml.tpl"]}
+
+@pytest.fixture
+def build_locked(build_project, project_manifest):
+    """Builds the 'locked' project (extra manifest keys allowed) and returns its Generator."""
+    def _build(force=False, **extra):
+        return build_project(project_manifest("locked", infra_files=INFRA, **extra), force=force).worker
+    return _build
+
+def test_rerun_writes_nothing(tmp_path, build_locked):
+    first = build_locked()
+    lock = json.loads((tmp_path / "locked" / LOCK_NAME).read_text())
+    assert "app.py" in lock["files"] and lock["files"]["app.py"]["output"]
+
+    lock_mtime = (tmp_path / "locked" / LOCK_NAME).stat().st_mtime_ns
+    second = build_locked()
+
+    assert sum(first.writes.values()) > 0
+    assert not second.writes
+    assert second.stats["skipped"] > 0
+    assert (tmp_path / "locked" / LOCK_NAME).stat().st_mtime_ns == lock_mtime
+
+def test_only_changed_inputs_rerender(tmp_path, build_locked):
+    build_locked()
+    rerun = build_locked(host="127.0.0.1")
+    # Only the env template reads 'host': every other target stays untouched
+    assert list(rerun.writes) == [".env"]
+
+def test_user_edits_are_kept_unless_forced(tmp_path, build_locked):
+    build_locked()
+    app = tmp_path / "locked" / "app.py"
+    app.write_text("# mine\n")
+
+    kept = build_locked()
+    assert kept.conflicts == ["app.py"]
+    assert app.read_text() == "# mine\n"
+
+    forced = build_locked(force=True)
+    assert "app.py" in forced.writes
+    assert app.read_text() != "# mine\n"
@@ -0,0 +1,53 @@
+import logging
+import pytest
+from pathlib import Path
+from create_app.logger import logger, set_log_level, stop_logging, RUN_ID, _FILE_HANDLER
+
+@pytest.fixture
+def log_file(tmp_path, isolated_run_log, monkeypatch):
+    """A private run log for this test (the listener is restarted on it)."""
+    stop_logging()
+    monkeypatch.setattr(_FILE_HANDLER, "baseFilename", str(tmp_path / isolated_run_log.name))
+    yield Path(_FILE_HANDLER.baseFilename)
+    stop_logging()
+
+def test_log_level_drops_records_at_the_logger(caplog):
+    caplog.set_level(logging.DEBUG, logger="py_create")
+    try:
+        set_log_level("info")
+        logger.debug("per-file noise")
+        logger.info("phase summary")
+    finally:
+        set_log_level("debug")
+
+    messages = [r.getMessage() for r in caplog.records]
+    assert "phase summary" in messages and "per-file noise" not in messages
+
+def test_records_land_in_the_run_file_off_thread(log_file):
+    logger.info("queued marker")
+    stop_logging()  # Drains the queue, exactly as at interpreter exit
+
+    assert RUN_ID in log_file.name
+    assert "queued marker" in log_file.read_text(encoding="utf-8")
+
+    logger.info("listener restarts on demand")
+    stop_logging()
+    assert "listener restarts on demand" in log_file.read_text(encoding="utf-8")
+
+def test_opening_a_run_log_prunes_the_oldest(log_file):
+    import os
+    from create_app.logger import KEEP_RUN_LOGS
+    old = [log_file.parent / f"py-create-old-{i:02d}.log" for i in range(KEEP_RUN_LOGS + 5)]
+    for age, path in enumerate(old):
+        path.write_text("old run\n")
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))  # Later in the list = newer
+    keepsake = log_file.parent / "notes.log"
+    keepsake.write_text("not a run log\n")
+
+    logger.info("new run")
+    stop_logging()
+
+    remaining = sorted(log_file.parent.glob("py-create-*.log"))
+    assert len(remaining) == KEEP_RUN_LOGS and log_file in remaining
+    assert set(remaining) - {log_file} == set(old[-(KEEP_RUN_LOGS - 1):])
+    assert keepsake.exists()
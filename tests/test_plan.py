@@ -0,0 +1,33 @@
+import json
+import pytest
+from unittest.mock import patch
+from create_app.initializer.controller import Controller
+
+@pytest.fixture
+def manifest(project_manifest):
+    return project_manifest("planned", infra_files={"docker": ["docker/Dockerfile"]})
+
+def test_dry_run_touches_nothing(tmp_path, manifest):
+    with patch("subprocess.run") as mock_run:
+        plan = Controller(manifest, ["docs"], base_dir=tmp_path).dry_run()
+
+    mock_run.assert_not_called()
+    assert list(tmp_path.iterdir()) == []
+    json.dumps(plan)  # Machine-readable as-is
+
+    targets = [f["target"] for f in plan["files"]]
+    assert "app.py" in targets and "docker/Dockerfile" in targets
+    assert "core/__init__.py" in plan["packages"]
+    assert "fastapi" in plan["dependencies"]
+    assert plan["venv"] is False and plan["django_apps"] == []
+
+def test_dry_run_matches_real_build(tmp_path, manifest, build_project):
+    plan = Controller(manifest, ["docs"], base_dir=tmp_path).dry_run()
+
+    build_project(manifest)
+
+    root = tmp_path / "planned"
+    for entry in plan["files"]:
+        assert (root / entry["target"]).is_file()
+    for folder in plan["directories"]:
+        assert (root / folder).is_dir()
@@ -0,0 +1,45 @@
+import copy
+import pytest
+from create_app.framework.bundler import Bundler
+from create_app.rules.registry import derive, lookup
+from create_app.rules.standard_rules import STANDARD_BLUEPRINT
+from create_app.rules.production_rules import PROD_WEB_RULES
+from create_app.rules.django_rules import DJANGO_PATCH_RULES
+
+def test_records_match_rule_tables():
+    assert lookup("fastapi")["folders"] == tuple(STANDARD_BLUEPRINT["FastAPI"]["folders"])
+    assert lookup("flask", "auto_config")["packages"] == tuple(PROD_WEB_RULES["Flask"]["packages"])
+    assert lookup("django", "production", True)["patches"][0]["module"] == "os"
+    assert lookup("rag_ai", "production")["folders"][0] == "data"
+    assert lookup("Sanic")["packages"] == ("app", "tests")  # Capitalization map, not str.capitalize()
+    assert lookup("quart") is lookup("fastapi")  # Unknown web frameworks: the tier's FastAPI layout
+
+def test_lookup_is_shared_and_frozen():
+    record = lookup("fastapi", "production")
+    assert lookup("fastapi", "production") is record
+    with pytest.raises(TypeError):
+        record["folders"] = []
+    with pytest.raises(AttributeError):
+        record["folders"].append("ui")
+    with pytest.raises(TypeError):
+        lookup("django", is_drf=True)["patches"][0]["module"] = "sys"
+
+def test_derive_is_copy_on_write():
+    record = lookup("flask")
+    derived = derive(record, folders=record["folders"] + ("ui",))
+    assert derived["folders"][-1] == "ui" and "ui" not in record["folders"]
+    assert derived["packages"] is record["packages"]
+
+@pytest.mark.parametrize("fw", ["fastapi", "flask", "django"])
+def test_repeated_builds_leave_the_registry_alone(tmp_path, fw):
+    sources = copy.deepcopy((STANDARD_BLUEPRINT, DJANGO_PATCH_RULES))
+    ctx = {"fw_name": fw, "project_name": "mysite", "django_apps": ["blog"]}
+    blueprints = [Bundler(tmp_path, dict(ctx)).execute()["blueprint"] for _ in range(3)]
+
+    assert all(dict(bp) == dict(blueprints[0]) for bp in blueprints)
+    assert (STANDARD_BLUEPRINT, DJANGO_PATCH_RULES) == sources
+    if fw == "django":
+        assert "mysite" in blueprints[0]["packages"] and "mysite" not in lookup("django")["packages"]
+    else:
+        ui = "ui" if fw == "fastapi" else "templates"
+        assert blueprints[0]["folders"].count(ui) == 1
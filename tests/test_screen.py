@@ -0,0 +1,80 @@
+import io
+import os
+import re
+import pytest
+import readchar
+from create_app.engine.ui import screen as screen_mod
+from create_app.engine.ui.screen import Screen, visible_width
+from create_app.engine.ui.user_interface import InitUI
+
+MOVE = re.compile(r"\x1b\[(\d+);1H")
+
+@pytest.fixture
+def term(monkeypatch):
+    size = {"value": os.terminal_size((80, 40))}
+    monkeypatch.setattr(screen_mod.shutil, "get_terminal_size", lambda *a, **k: size["value"])
+    return size
+
+def _rows(out: str) -> list:
+    """Rows touched by a differential frame (the final cursor park excluded)."""
+    return [int(r) for r in MOVE.findall(out)][:-1]
+
+def test_second_frame_only_rewrites_changed_lines(term):
+    out = io.StringIO()
+    screen = Screen(out)
+    screen.render(["banner", "  > one", "    two", "    three"])
+    assert out.getvalue().startswith("\033[H\033[J")
+
+    out.seek(0); out.truncate()
+    assert screen.render(["banner", "    one", "  > two", "    three"]) == 2
+    assert "\033[H\033[J" not in out.getvalue()
+    assert _rows(out.getvalue()) == [2, 3]
+    assert "banner" not in out.getvalue() and "three" not in out.getvalue()
+
+def test_identical_frame_writes_nothing_but_the_cursor(term):
+    out = io.StringIO()
+    screen = Screen(out)
+    screen.render(["a", "b"])
+    out.seek(0); out.truncate()
+    assert screen.render(["a", "b"]) == 0
+    assert out.getvalue() == "\033[3;1H"
+
+def test_shorter_frame_erases_the_tail(term):
+    out = io.StringIO()
+    screen = Screen(out)
+    screen.render(["a", "b", "c"])
+    out.seek(0); out.truncate()
+    screen.render(["a", "b"])
+    assert "\033[3;1H\033[J" in out.getvalue()
+
+@pytest.mark.parametrize("trigger", ["resize", "invalidate", "overflow"])
+def test_full_redraw_fallbacks(term, trigger):
+    out = io.StringIO()
+    screen = Screen(out)
+    frame = ["a", "b"]
+    screen.render(frame)
+    if trigger == "resize":
+        term["value"] = os.terminal_size((100, 40))
+    elif trigger == "invalidate":
+        screen.invalidate()
+    else:
+        frame = ["a", "x" * 80]  # Would wrap and shift every row below it
+    out.seek(0); out.truncate()
+    screen.render(frame)
+    assert out.getvalue().startswith("\033[H\033[J")
+    assert screen.full_redraws == 2
+
+def test_visible_width_ignores_colors():
+    assert visible_width("\033[38;5;214m\033[1mabc\033[0m") == 3
+
+def test_menu_arrow_key_redraws_two_lines(term, monkeypatch, capsys):
+    keys = iter([readchar.key.DOWN, readchar.key.ENTER])
+    monkeypatch.setattr(readchar, "readkey", lambda: next(keys))
+    ui = InitUI("init-app", "0.0.0")
+    renders = []
+    real = ui.screen.render
+    monkeypatch.setattr(ui.screen, "render", lambda lines: renders.append(real(lines)) or renders[-1])
+
+    assert ui.menu("core blueprint", ["fastapi", "flask", "django"], flow=["blueprint"]) == ("flask", "standard")
+    assert renders[0] > 5 and renders[1:] == [2]
+    assert ui.screen.full_redraws == 1
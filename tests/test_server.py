@@ -0,0 +1,98 @@
+import http.client
+import io
+import json
+import socket
+import tarfile
+import threading
+import zipfile
+import pytest
+from create_app.engine.server import ScaffoldServer
+
+SPEC = {"project name": "served", "fw_name": "fastapi", "build strategy": "production", "venv_enabled": False}
+
+@pytest.fixture
+def server(tmp_path):
+    srv = ScaffoldServer(port=0, max_concurrency=2, output_root=tmp_path, preflight=False)
+    thread = threading.Thread(target=srv.run, daemon=True)
+    thread.start()
+    assert srv.ready.wait(timeout=30)
+    yield srv
+    srv.shutdown()
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+
+def _request(srv, method, path, spec=None):
+    conn = http.client.HTTPConnection("127.0.0.1", srv.port, timeout=30)
+    conn.request(method, path, body=json.dumps(spec) if spec is not None else None)
+    response = conn.getresponse()
+    return response.status, response.getheader("Content-Type"), response.read()
+
+def test_streams_tar_and_zip(server, tmp_path):
+    status, ctype, body = _request(server, "POST", "/build", SPEC)
+    assert status == 200 and ctype == "application/gzip"
+    with tarfile.open(fileobj=io.BytesIO(body), mode="r:gz") as tar:
+        assert "served/app.py" in tar.getnames()
+
+    status, ctype, body = _request(server, "POST", "/build?format=zip", SPEC)
+    assert status == 200 and ctype == "application/zip"
+    assert "served/app.py" in zipfile.ZipFile(io.BytesIO(body)).namelist()
+    assert list(tmp_path.iterdir()) == []  # Streaming never touches the server's disk
+
+def test_writes_server_side_path_inside_root_only(server, tmp_path):
+    status, _, body = _request(server, "POST", "/build", {**SPEC, "output": "out"})
+    assert status == 200, body
+    assert (tmp_path / "out" / "served" / "app.py").is_file()
+
+    status, _, _ = _request(server, "POST", "/build", {**SPEC, "output": "../escape"})
+    assert status == 403
+
+def test_concurrent_builds_and_metrics(server):
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(_request(server, "POST", "/build", SPEC)[0]))
+               for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert results == [200] * 5
+
+    status, _, body = _request(server, "GET", "/metrics")
+    metrics = json.loads(body)
+    assert status == 200
+    assert metrics["builds"]["ok"] == 5 and metrics["in_flight"] == 0
+    assert metrics["latency"]["POST /build"]["count"] == 5
+    assert _request(server, "GET", "/nope")[0] == 404
+
+@pytest.mark.parametrize("name", ["../../escaped", "/abs/path", "a/b", "..", 'x"\r\nSet-Cookie: y', "项目"])
+def test_rejects_project_names_that_are_not_one_directory(server, tmp_path, name):
+    for spec in ({**SPEC, "project name": name}, {**SPEC, "project name": name, "output": "out"}):
+        status, _, body = _request(server, "POST", "/build", spec)
+        assert status == 400 and b"Invalid project name" in body
+    assert list(tmp_path.iterdir()) == [] and not (tmp_path.parent / "escaped").exists()
+
+@pytest.mark.parametrize("length", ["abc", "-1"])
+def test_bad_content_length_is_a_client_error(server, length):
+    with socket.create_connection(("127.0.0.1", server.port), timeout=30) as sock:
+        sock.sendall(f"POST /build HTTP/1.1\r\nHost: x\r\nContent-Length: {length}\r\n\r\n".encode())
+        response = sock.makefile("rb").read()
+    assert response.startswith(b"HTTP/1.1 400") and b"invalid Content-Length" in response
+
+def test_announces_the_bound_port_once_listening(tmp_path):
+    announced = []
+    srv = ScaffoldServer(port=0, output_root=tmp_path, preflight=False, on_ready=announced.append)
+    thread = threading.Thread(target=srv.run, daemon=True)
+    thread.start()
+    assert srv.ready.wait(timeout=30)
+    srv.shutdown()
+    thread.join(timeout=30)
+    assert srv.port != 0 and announced == [f"http://127.0.0.1:{srv.port}"]
+
+def test_separator_scaffolds_a_project_named_like_a_subcommand(monkeypatch):
+    from create_app.engine import cli
+    seen = []
+    monkeypatch.setattr(cli, "start", seen.append)
+    monkeypatch.setitem(cli.SUBCOMMANDS, "serve", lambda argv: pytest.fail("dispatched to serve"))
+    monkeypatch.setattr("sys.argv", ["init-app", "--", "serve", "-f", "fastapi"])
+    cli.main()
+    assert seen == [["serve", "-f", "fastapi"]]
+    assert cli.build_parser().parse_args(seen[0]).name == "serve"
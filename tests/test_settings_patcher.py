@@ -0,0 +1,44 @@
+import ast
+from create_app.initializer.settings_patcher import SettingsPatcher, APPLIED, UNCHANGED
+from create_app.rules.django_rules import DJANGO_PATCH_RULES
+from tests.stock_files import STOCK_SETTINGS
+
+CTX = {"django_apps": ["blog", "shop"], "app_name": "blog"}
+
+def _patch(source, mode="drf", ctx=CTX):
+    patcher = SettingsPatcher(source)
+    return patcher.apply(DJANGO_PATCH_RULES[mode]["patches"], ctx), patcher.report
+
+def _value(source, name):
+    for node in ast.parse(source).body:
+        if isinstance(node, ast.Assign) and node.targets[0].id == name:
+            return node.value
+
+def test_stock_settings_patched_in_one_pass():
+    patched, report = _patch(STOCK_SETTINGS)
+
+    assert set(report.values()) == {APPLIED}
+    apps = [e.value for e in _value(patched, "INSTALLED_APPS").elts]
+    assert apps == ["django.contrib.admin", "django.contrib.staticfiles",
+                    "django_extensions", "django_filters", "rest_framework", "blog", "shop"]
+    assert "import os" in patched.splitlines()[:3]
+    assert 'os.environ.get("SECRET_KEY")' in patched and "django-insecure" not in patched
+    assert isinstance(_value(patched, "REST_FRAMEWORK"), ast.Dict)
+    # Untouched statements keep their exact text and order
+    assert "STATIC_URL = 'static/'" in patched and patched.index("BASE_DIR") < patched.index("SECRET_KEY")
+
+def test_patching_is_idempotent():
+    once, _ = _patch(STOCK_SETTINGS)
+    twice, report = _patch(once)
+
+    assert twice == once
+    assert set(report.values()) == {UNCHANGED}
+
+def test_user_values_are_kept():
+    edited = STOCK_SETTINGS.replace("SECRET_KEY = 'django-insecure-abc'", "SECRET_KEY = get_secret()")
+    edited = edited.replace("STATIC_URL", "REST_FRAMEWORK = {'PAGE_SIZE': 5}\n\nSTATIC_URL")
+    patched, report = _patch(edited)
+
+    assert "SECRET_KEY = get_secret()" in patched
+    assert "REST_FRAMEWORK = {'PAGE_SIZE': 5}" in patched and patched.count("REST_FRAMEWORK =") == 1
+    assert report["rest-framework"] == UNCHANGED
@@ -0,0 +1,60 @@
+import io
+import tarfile
+import zipfile
+import pytest
+from unittest.mock import patch
+from create_app.initializer.sinks import MemorySink, archive_sink, archive_format
+
+class StreamOnly(io.RawIOBase):
+    """Write-only, non-seekable stream (an HTTP response body, a pipe)."""
+    def __init__(self):
+        self.chunks = []
+    def writable(self):
+        return True
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+    def getvalue(self):
+        return b"".join(self.chunks)
+
+@pytest.fixture
+def build_shipped(build_project, project_manifest):
+    """Flask production build (venv requested: archive and memory sinks must still never spawn it)."""
+    def _build(sink):
+        with patch("subprocess.run") as mock_run:
+            build_project(project_manifest("shipped", "flask", venv_enabled=True), sink=sink)
+        mock_run.assert_not_called()
+        return sink
+    return _build
+
+@pytest.mark.parametrize("kind", ["tar", "zip"])
+def test_archive_streams_same_tree_as_memory(tmp_path, build_shipped, kind):
+    expected = build_shipped(MemorySink()).files
+    stream = StreamOnly()
+    build_shipped(archive_sink(stream, kind, prefix="shipped"))
+
+    if kind == "tar":
+        with tarfile.open(fileobj=io.BytesIO(stream.getvalue()), mode="r:gz") as tar:
+            files = {m.name: tar.extractfile(m).read() for m in tar.getmembers() if m.isfile()}
+    else:
+        with zipfile.ZipFile(io.BytesIO(stream.getvalue())) as zf:
+            files = {n: zf.read(n) for n in zf.namelist() if not n.endswith("/")}
+
+    assert files == {f"shipped/{rel}": data for rel, data in expected.items()}
+    assert list(tmp_path.iterdir()) == []
+
+def test_archive_format_from_suffix():
+    assert archive_format("out.tar.gz") == "tar" and archive_format("OUT.ZIP") == "zip"
+    with pytest.raises(ValueError):
+        archive_format("out.rar")
+
+def test_cli_archive_flag(tmp_path, monkeypatch):
+    from create_app.engine.cli import start
+    monkeypatch.chdir(tmp_path)
+    with patch("docs.prerequisite.Prerequisite.check_system") as mock_check:
+        mock_check.return_value = {"status": True, "errors": []}
+        start(["webapp", "-f", "fastapi", "--archive", "webapp.zip"])
+
+    with zipfile.ZipFile(tmp_path / "webapp.zip") as zf:
+        assert "webapp/app.py" in zf.namelist()
+    assert not (tmp_path / "webapp").exists()
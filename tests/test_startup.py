@@ -0,0 +1,76 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative import budget for create_app.engine.cli (microseconds, -X importtime units).
+# Generous for slow CI machines; the point is catching the Controller/Jinja chain creeping back in.
+IMPORT_BUDGET_US = 150_000
+
+HEAVY = ["jinja2", "pyfiglet", "readchar", "create_app.initializer.controller"]
+
+def _run(cwd, *argv):
+    """Runs the console entry point under -X importtime; returns (process, {module: cumulative us}, cli cumulative us)."""
+    code = f"import sys; sys.argv = ['init-app', *{list(argv)!r}]; from create_app.engine.cli import main; main()"
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=cwd, env=env, capture_output=True, text=True)
+
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if cumulative.isdigit():
+            modules[name] = int(cumulative)
+    cli_us = modules.get("create_app.engine.cli")
+    return proc, modules, cli_us
+
+@pytest.mark.parametrize("flag", ["--version", "--help"])
+def test_info_flags_stay_light(tmp_path, flag):
+    proc, modules, cli_us = _run(tmp_path, flag)
+
+    assert proc.returncode == 0
+    assert cli_us is not None and cli_us < IMPORT_BUDGET_US, f"cli import took {cli_us}us"
+    assert not [m for m in HEAVY if m in modules]
+    assert list(tmp_path.iterdir()) == []  # No logs/ litter
+
+def test_headless_plan_skips_interactive_stack(tmp_path):
+    proc, modules, _ = _run(tmp_path, "demo", "-f", "fastapi", "--plan")
+
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert "jinja2" in modules
+    assert "pyfiglet" not in modules and "readchar" not in modules
+    assert list(tmp_path.iterdir()) == []
+
+def test_interactive_header_skips_pyfiglet(tmp_path):
+    code = ("import sys; from create_app.engine.app import AppEngine; ui = AppEngine(); "
+            "ui._header_lines('blueprint'); print('pyfiglet' in sys.modules, len(ui.banner))")
+    env = {**os.environ, "PYTHONPATH": str(REPO_ROOT)}
+    proc = subprocess.run([sys.executable, "-c", code], cwd=tmp_path, env=env, capture_output=True, text=True)
+
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    assert proc.stdout.split() == ["False", "6"]
+
+def test_precomputed_banner_matches_pyfiglet():
+    from create_app.engine.ui import banner
+    from create_app.engine.ui._banner import BANNERS, FONT
+
+    assert FONT == banner.FONT
+    assert set(banner.FIXED_TITLES) <= set(BANNERS)
+    for title in banner.FIXED_TITLES:
+        assert BANNERS[title] == banner._render(title)  # Stale table? python -m create_app.engine.ui.banner
+    assert banner.banner_lines("x") == banner._render("x")  # Custom titles still render
+
+def test_banner_build_step_keeps_checked_in_table_without_pyfiglet(tmp_path, monkeypatch):
+    from create_app.engine.ui import banner
+    target = tmp_path / "_banner.py"
+    target.write_text("# checked in\n")
+    monkeypatch.setattr(banner, "_figlet", None)
+    monkeypatch.setitem(sys.modules, "pyfiglet", None)  # Isolated build env: import fails
+
+    assert banner.build_banner_module(target) is False
+    assert target.read_text() == "# checked in\n"
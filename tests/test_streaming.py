@@ -0,0 +1,93 @@
+import hashlib
+import io
+import logging
+import tarfile
+import tracemalloc
+import pytest
+from jinja2 import DictLoader, Environment
+from create_app.framework.planner import BuildPlan, RENDER
+from create_app.initializer.generator import Generator
+from create_app.initializer.sinks import DiskSink, archive_sink
+
+TEMPLATES = {
+    "big.sql.tpl": "{% for i in range(rows) %}INSERT INTO seed VALUES ({{ i }}, '{{ label }}');\n{% endfor %}",
+    "blank.tpl": "{% if never %}x{% endif %}\n   \n",
+    "broken.tpl": "{% for i in range(rows) %}row {{ i }}\n{% endfor %}{{ missing.attr }}",
+}
+
+class DictGenerator(Generator):
+    """Generator over in-test templates instead of the shipped ones."""
+    @property
+    def env(self):
+        return Environment(loader=DictLoader(TEMPLATES), keep_trailing_newline=True)
+
+def _render(root, source, sink=None, **ctx):
+    plan = BuildPlan()
+    plan.add(source, "out.txt", RENDER)
+    worker = DictGenerator(root, {"rows": 50_000, "label": "seed", **ctx}, sink=sink)
+    worker.run(plan)
+    return worker
+
+def test_large_output_streams_with_bounded_memory(tmp_path):
+    tracemalloc.start()
+    try:
+        worker = _render(tmp_path, "big.sql.tpl")
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    out = tmp_path / "out.txt"
+    size = out.stat().st_size
+    assert size > 1024 * 1024 and peak < size / 4
+    assert worker.stats["rendered"] == 1
+    assert worker.lock.entries["out.txt"]["output"] == hashlib.sha256(out.read_bytes()).hexdigest()
+
+def test_failing_template_keeps_the_previous_file(tmp_path):
+    _render(tmp_path, "big.sql.tpl", rows=3)
+    before = (tmp_path / "out.txt").read_bytes()
+    worker = _render(tmp_path, "broken.tpl", rows=10_000)  # Stale target: streamed, fails midway
+
+    assert (tmp_path / "out.txt").read_bytes() == before
+    assert worker.stats["errors"] == 1 and worker.stats["rendered"] == 0
+    assert sorted(p.name for p in tmp_path.iterdir()) == [".init-app.lock", "out.txt"]  # No staging file left
+
+def test_blank_output_warns_without_a_stripped_copy(tmp_path, caplog):
+    caplog.set_level(logging.WARNING, logger="py_create")
+    _render(tmp_path, "blank.tpl")
+    assert any("rendered as empty" in r.getMessage() for r in caplog.records)
+
+@pytest.mark.parametrize("spool", [1 << 20, 1024])
+def test_archive_entry_from_chunks(monkeypatch, spool):
+    monkeypatch.setattr("create_app.initializer.sinks.SPOOL_BYTES", spool)
+    buffer = io.BytesIO()
+    sink = archive_sink(buffer, "tar", prefix="p")
+    sink.open()
+    assert sink.write_stream("seed.sql", (b"x" * 4096 for _ in range(16))) == 65536
+    with pytest.raises(RuntimeError):
+        sink.write_stream("half.sql", _interrupted())
+    sink.close()
+
+    with tarfile.open(fileobj=io.BytesIO(buffer.getvalue()), mode="r:gz") as tar:
+        assert tar.getnames() == ["p/seed.sql"]
+        assert tar.extractfile("p/seed.sql").read() == b"x" * 65536
+
+def _interrupted():
+    yield b"partial"
+    raise RuntimeError("template failed midway")
+
+def test_disk_stream_keeps_file_mode(tmp_path):
+    target = tmp_path / "run.sh"
+    target.write_text("old")
+    target.chmod(0o755)
+    DiskSink(tmp_path).write_stream("run.sh", [b"#!/bin/sh\n", b"echo hi\n"])
+    assert target.read_text() == "#!/bin/sh\necho hi\n" and target.stat().st_mode & 0o777 == 0o755
+
+@pytest.mark.parametrize("env, expected", [("", 0), ("1", 2)])
+def test_disk_fsync_is_opt_in(tmp_path, monkeypatch, env, expected):
+    synced = []
+    monkeypatch.setattr("create_app.initializer.sinks.os.fsync", synced.append)
+    monkeypatch.setenv("INIT_APP_FSYNC", env)
+    sink = DiskSink(tmp_path)
+    sink.write_stream("app.py", [b"print('hi')\n"])
+    sink.write(".env", b"DEBUG=1\n")
+    assert len(synced) == expected and (tmp_path / "app.py").read_bytes() == b"print('hi')\n"
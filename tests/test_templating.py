@@ -0,0 +1,86 @@
+import pytest
+from create_app.initializer import templating
+
+@pytest.fixture
+def fresh_cache(tmp_path, monkeypatch):
+    """Points the user cache at tmp_path and forces new Environments."""
+    monkeypatch.setenv("INIT_APP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(templating, "_ENVIRONMENTS", {})
+    return tmp_path
+
+def test_environment_is_shared_per_process(fresh_cache):
+    assert templating.get_environment("generator") is templating.get_environment("generator")
+    assert templating.get_environment("generator") is not templating.get_environment("terminal")
+
+def test_bytecode_cache_warm_and_clear(fresh_cache):
+    count = templating.warm_cache()
+    info = templating.cache_info()
+
+    assert count > 0
+    assert info["entries"] > 0
+    assert info["path"].startswith(str(fresh_cache))
+
+    templating.clear_cache()
+    assert templating.cache_info()["entries"] == 0
+
+def test_bytecode_cache_can_be_disabled(fresh_cache, monkeypatch):
+    monkeypatch.setenv("INIT_APP_NO_CACHE", "1")
+    assert templating.get_environment("generator").bytecode_cache is None
+
+def test_precompiled_templates_match_source(fresh_cache, tmp_path, monkeypatch):
+    """Renders through the shipped ModuleLoader build and the dev FileSystemLoader."""
+    ctx = {"project_name": "demo", "framework": "fastapi", "fw_name": "fastapi", "APP_NAME": "init-app"}
+    source = templating.get_environment("generator").get_template("common/static/css/style.css.tpl").render(**ctx)
+
+    compiled_dir = tmp_path / "_compiled"
+    index = templating.precompile(compiled_dir)
+    monkeypatch.setattr(templating, "COMPILED_DIR", compiled_dir)
+    monkeypatch.setattr(templating, "_ENVIRONMENTS", {})
+    monkeypatch.setattr(templating, "_INDEX", None)
+
+    env = templating.get_environment("generator")
+    assert type(env.loader).__name__ == "ChoiceLoader"
+    assert env.get_template("common/static/css/style.css.tpl").render(**ctx) == source
+    assert templating.template_index() == index["files"]
+    assert "common/template/index.html.tpl" in index["files"]
+
+class _NoCopy(dict):
+    """A context that fails the test if anything iterates (i.e. copies) it."""
+    def keys(self):
+        raise AssertionError("context was copied")
+    __iter__ = keys
+
+def test_render_layered_matches_render_without_copying(fresh_cache):
+    from collections import ChainMap
+    env = templating.get_environment("generator")
+    template = env.from_string("{% for i in range(2) %}{{ name }}-{{ PORT }}{% endfor %}")
+    ctx = ChainMap(_NoCopy(name="api"), _NoCopy(PORT=8000))
+
+    assert templating.render_layered(template, ctx) == "api-8000api-8000"
+    assert templating.render_layered(template, ctx) == template.render(name="api", PORT=8000)
+
+def test_build_context_layers_constants_instead_of_copying(tmp_path):
+    from create_app.framework.bundler import Bundler, constants_snapshot
+    first, second = {"fw_name": "fastapi"}, {"fw_name": "flask"}
+    a, b = Bundler(tmp_path, first).ctx, Bundler(tmp_path, second).ctx
+
+    assert a.maps[1] is b.maps[1] is constants_snapshot()  # One shared, read-only layer
+    assert "FRAMEWORKS" in a and "FRAMEWORKS" not in first
+    assert a["fw_name"] == "fastapi" and first["port"] == a["port"]  # Writes land in the project's own dict
+    with pytest.raises(TypeError):
+        constants_snapshot()["APP_NAME"] = "other"
+
+def test_precompile_leaves_user_cache_and_run_log_alone(tmp_path, monkeypatch):
+    from create_app import logger as run_log
+    monkeypatch.setenv("INIT_APP_CACHE_DIR", str(tmp_path / "cache"))
+    run_log.stop_logging()
+    monkeypatch.setattr(run_log._FILE_HANDLER, "baseFilename", str(tmp_path / "logs" / "run.log"))
+    run_log.set_file_logging(False)
+    try:
+        templating.precompile(tmp_path / "_compiled")
+        run_log.stop_logging()
+    finally:
+        run_log.set_file_logging(True)
+
+    assert (tmp_path / "_compiled" / "generator").is_dir()
+    assert not (tmp_path / "cache").exists() and not (tmp_path / "logs").exists()
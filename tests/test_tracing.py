@@ -0,0 +1,32 @@
+import json
+from create_app import tracing
+from create_app.initializer.sinks import MemorySink
+
+def test_spans_cover_phases_and_files(build_project, project_manifest):
+    tracing.start_tracing()
+    try:
+        ctrl = build_project(project_manifest("traced"), sink=MemorySink())
+    finally:
+        tracer = tracing.stop_tracing()
+
+    names = {s["name"] for s in tracer.spans}
+    assert {"mission:traced", "bundler.init", "bundler.execute", "plan.compile", "generator.run"} <= names
+    renders = {s["name"]: s for s in tracer.spans if s["cat"] == "render"}
+    assert set(renders) == {op["target"] for op in ctrl.plan if op["mode"] == "render"}
+    assert renders["app.py"]["args"]["template"] == "common/entry.py.tpl"
+    assert renders["app.py"]["args"]["bytes"] == len(ctrl.sink.files["app.py"])
+
+    trace = json.loads(json.dumps(tracer.chrome_trace()))
+    complete = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert len(complete) == len(tracer.spans) and all(e["dur"] >= 0 for e in complete)
+    assert "app.py" in tracing.format_report(tracer, 50)
+
+def test_tracing_off_records_nothing(build_project, project_manifest):
+    assert tracing.span("x") is tracing.span("y")  # Shared no-op
+    build_project(project_manifest("traced"), sink=MemorySink())
+    assert tracing._TRACER is None
+
+def test_untraced_spans_do_not_share_results():
+    with tracing.span("a") as first, tracing.span("b") as second:
+        first["bytes"], second["bytes"] = 1, 2
+    assert first is not second and first["bytes"] == 1
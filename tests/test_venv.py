@@ -0,0 +1,76 @@
+import threading
+import pytest
+from unittest.mock import patch
+from create_app.cache import CACHE_ENV_VAR
+from create_app.initializer.generator import Generator
+from create_app.initializer.venv_manager import VenvManager, DEPS_MARKER, deps_digest, template_key
+
+@pytest.fixture(autouse=True)
+def venv_cache(tmp_path, monkeypatch):
+    """Private cache root so no real venv template is ever picked up."""
+    root = tmp_path / "cache"
+    monkeypatch.setenv(CACHE_ENV_VAR, str(root))
+    return root
+
+def test_venv_overlaps_rendering(build_project, project_manifest):
+    venv_started = threading.Event()
+    seen = {}
+    calls = []
+    real_run = Generator.run
+
+    def fake_subprocess(cmd, **kwargs):
+        calls.append(cmd)
+        if "venv" in cmd:
+            venv_started.set()
+
+    def rendering(self, plan):
+        # A sequential implementation would only create the venv after this returns
+        seen["overlapped"] = venv_started.wait(timeout=5)
+        return real_run(self, plan)
+
+    with patch("subprocess.run", side_effect=fake_subprocess), patch.object(Generator, "run", rendering):
+        ctrl = build_project(project_manifest("overlap", strategy="standard", venv_enabled=True))
+
+    assert seen["overlapped"]
+    install = calls[-1]
+    # pip gets the resolved list directly; requirements.txt is not needed yet
+    assert install[1] == "install" and "fastapi" in install
+    assert "venv.create" in ctrl.timings and "venv.install" in ctrl.timings
+
+def test_matching_marker_skips_pip(tmp_path):
+    venv = tmp_path / "venv"
+    venv.mkdir()
+    (venv / DEPS_MARKER).write_text(deps_digest(["flask", "gunicorn"]))
+
+    with patch("subprocess.run") as mock_run:
+        manager = VenvManager(venv).start()
+        manager.install(["gunicorn", "flask"])
+        assert manager.wait()
+
+    mock_run.assert_not_called()
+    assert manager.state == "skipped"
+
+def test_cached_template_is_cloned_and_relocated(tmp_path, venv_cache):
+    deps = ["fastapi", "uvicorn"]
+    template = venv_cache / "venvs" / template_key(deps)
+    (template / "bin").mkdir(parents=True)
+    (template / "lib").mkdir()
+    (template / "pyvenv.cfg").write_text(f"home = /usr/bin\ncommand = python -m venv {template}\n")
+    (template / "bin" / "pip").write_text(f"#!{template}/bin/python\nimport pip\n")
+    (template / "bin" / "activate").write_text(f'VIRTUAL_ENV="{template}"\n')
+    (template / "lib" / "site.py").write_text("# shared\n")
+
+    project_venv = tmp_path / "proj" / "venv"
+    with patch("subprocess.run") as mock_run:
+        manager = VenvManager(project_venv).start()
+        manager.install(deps)
+        assert manager.wait()
+
+    mock_run.assert_not_called()
+    assert "venv.clone" in manager.durations
+    assert (project_venv / "bin" / "pip").read_text().startswith(f"#!{project_venv}/bin/python")
+    assert str(project_venv) in (project_venv / "bin" / "activate").read_text()
+    assert str(template) not in (project_venv / "pyvenv.cfg").read_text()
+    # Untouched files share the template's inode; rewritten ones never leak back into it
+    assert (project_venv / "lib" / "site.py").stat().st_ino == (template / "lib" / "site.py").stat().st_ino
+    assert str(template) in (template / "bin" / "pip").read_text()